@@ -0,0 +1,60 @@
+import timeit
+
+from liarsdice import Bid, Bot, Die, Round
+
+# The number of times each benchmark is repeated
+REPEAT = 5
+NUMBER = 20000
+
+
+def main():
+    print("Cost of setting up a round & playing one bid - checked vs. trusted paths:")
+    checked = bench(turn_checked)
+    trusted = bench(turn_trusted)
+    print(f"  checked: {checked:.2f} us")
+    print(f"  trusted: {trusted:.2f} us ({1 - trusted / checked:.0%} less)")
+
+
+def bench(setup):
+    """
+    Returns the best time (in microseconds) of a call to the function returned by setup()
+    """
+    f = setup()
+    return min(timeit.repeat(f, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def _players():
+    return [Bot(f"Bot_{i}") for i in range(5)]
+
+
+def turn_checked():
+    """
+    A round with one bid, built through the constructors & setters (like project.py does for user input)
+    """
+    players = _players()
+
+    def turn():
+        round = Round(1, players, players[0])
+        round.active_bid = Bid(Die(3), 4, round.active_bid, 25)
+        round.active_bidder = round.whose_turn
+        round.rotate_turn()
+
+    return turn
+
+
+def turn_trusted():
+    """
+    The same as turn_checked(), but through the trusted paths that the simulation engine uses
+    """
+    players = _players()
+
+    def turn():
+        round = Round.trusted(1, players, players[0])
+        round.set_active_bid_trusted(Bid.trusted(3, 4), round.whose_turn)
+        round.rotate_turn()
+
+    return turn
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,722 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from math import factorial
+
+import numpy as np
+
+from liarsdice import FACES_PER_DIE, Bid
+from strategy import CHALLENGE, NO_BID, Strategy, _generator
+
+# A counterfactual regret minimization (CFR) solver for heads-up games (2 players, a few dice each).
+#
+# A game is a sequence of rounds, and a round between a starter with a dice and a responder with b dice
+# is solved as a game of its own: its outcome is the chance of winning the whole game from the next round on
+# (the loser loses a die & starts it), which is known from the rounds with less dice - so the rounds are
+# solved from the smallest to the largest (see solve()).
+#
+# In a round the bids are indexed by rank, from 0 to count_all_active_dice * faces_per_die - 1
+# (just like in Bid.legal_bids()), and the action after the bids is a challenge.
+# A player decides on what they can see - an information set:
+# - their view of the round (their own dice & the opponent's), which picks the table;
+# - their own hand histogram (see Hand.counts), by its index in hand_histograms();
+# - the last `memory` bids of the round (the whole history, if it's short enough), by their ranks.
+# With memory=1 that's just the active bid, which is all a Bot gets to see (see Bot.play_turn()).
+#
+# Each table holds the regrets & the strategy sums of a view, as a preallocated array, indexed by
+# (hand, bid history, action). Training is chance-sampled, fixed-strategy-iteration CFR (with regret matching+):
+# each iteration rolls a batch of hands, and sweeps the rounds' histories in order of their last bid - forward
+# to sum the reach of each history, and backward to sum the utilities & update the regrets.
+
+DEFAULT_BATCH_SIZE = 256
+
+
+def hand_histograms(count_of_dice, faces_per_die=FACES_PER_DIE):
+    """
+    Returns all the histograms (see Hand.counts) of a hand with count_of_dice, as an (n x faces_per_die) array,
+    and the probability of rolling each of them. The index of a histogram in the array is its id.
+    """
+    histograms = np.array(
+        [
+            np.bincount(faces, minlength=faces_per_die)
+            for faces in itertools.combinations_with_replacement(
+                range(faces_per_die), count_of_dice
+            )
+        ],
+        dtype=np.int64,
+    )
+
+    ways = [
+        factorial(count_of_dice) // np.prod([factorial(c) for c in h])
+        for h in histograms
+    ]
+    return histograms, np.array(ways) / faces_per_die**count_of_dice
+
+
+class HandIndex:
+    """
+    Maps hand histograms to their ids (see hand_histograms()), for hands of the given count_of_dice
+    """
+    def __init__(self, count_of_dice, faces_per_die=FACES_PER_DIE):
+        self._histograms, self._probabilities = hand_histograms(
+            count_of_dice, faces_per_die
+        )
+
+        # Each histogram is a number in base count_of_dice + 1, that's looked up in a dense array
+        self._weights = (count_of_dice + 1) ** np.arange(faces_per_die)
+        self._ids = np.full((count_of_dice + 1) ** faces_per_die, -1, dtype=np.int64)
+        self._ids[self._histograms @ self._weights] = np.arange(len(self._histograms))
+
+    def __len__(self):
+        return len(self._histograms)
+
+    def ids(self, histograms):
+        """
+        Returns the ids of an array of histograms (one per row)
+        """
+        return self._ids[np.asarray(histograms) @ self._weights]
+
+    @property
+    def histograms(self):
+        return self._histograms
+
+    @property
+    def probabilities(self):
+        return self._probabilities
+
+
+class _RoundGraph:
+    """
+    The histories of a round, as seen with a memory of the last few bids, and who's in turn at each of them.
+    A state is (role, history) - role 0 is the starter, and 1 the responder.
+    Its groups of states (by last bid & role) are in the order in which they can be played.
+    """
+    def __init__(self, count_all_active_dice, faces_per_die, memory):
+        count_of_bids = count_all_active_dice * faces_per_die
+        self.count_of_bids = count_of_bids
+
+        # All the histories (tuples of increasing bids, up to memory long), ordered by their last bid
+        histories = [()]
+        for length in range(1, memory + 1):
+            histories += itertools.combinations(range(count_of_bids), length)
+        histories.sort(key=lambda h: h[-1] if h else -1)
+        self.histories = {h: i for i, h in enumerate(histories)}
+
+        # The starter makes the first bid, and then the turns alternate
+        # (once the bids are more than the memory, either player can be in turn at a history)
+        states = {}
+        for h in histories:
+            roles = (len(h) % 2,) if len(h) < memory else (0, 1)
+            for role in roles:
+                states[(role, h)] = len(states)
+        self.count_of_states = len(states)
+
+        self.groups = []
+        for last in range(-1, count_of_bids):
+            for role in (0, 1):
+                keys = [
+                    key
+                    for key in states
+                    if key[0] == role and (key[1][-1] if key[1] else -1) == last
+                ]
+                if keys:
+                    self.groups.append(_StateGroup(keys, states, self, memory))
+
+
+class _StateGroup:
+    """
+    A group of states with the same last bid & role. The legal actions (raises above the last bid,
+    and a challenge - unless it's the first turn) are a contiguous slice of the actions of a table.
+    """
+    def __init__(self, keys, states, graph, memory):
+        self.role = keys[0][0]
+        self.last = keys[0][1][-1] if keys[0][1] else -1
+        self.states = np.array([states[k] for k in keys])
+        self.histories = np.array([graph.histories[h] for _, h in keys])
+
+        count_of_bids = graph.count_of_bids
+        self.bids = np.arange(self.last + 1, count_of_bids)
+        self.actions = slice(
+            self.last + 1, count_of_bids + 1 if self.last >= 0 else count_of_bids
+        )
+
+        # The states after each bid - the reach is summed over the states that lead to the same one
+        children = np.array(
+            [
+                [states[(1 - self.role, (h + (j,))[-memory:])] for j in self.bids]
+                for _, h in keys
+            ],
+            dtype=np.int64,
+        ).reshape(len(keys), len(self.bids))
+        self.children = children
+
+        flat = children.ravel()
+        self.order = np.argsort(flat, kind="stable")
+        self.targets, self.starts = np.unique(flat[self.order], return_index=True)
+
+
+def _regret_matching(regrets):
+    """
+    Returns the strategy for an array of regrets (or strategy sums) over the actions in its last axis:
+    proportional to the positive ones, or uniform if there are none
+    """
+    positive = np.maximum(regrets, 0)
+    total = positive.sum(axis=-1, keepdims=True)
+
+    uniform = np.full_like(positive, 1 / positive.shape[-1])
+    return np.divide(positive, total, out=uniform, where=total > 0)
+
+
+def _grouping(ids):
+    """
+    Returns the order that sorts an array of ids, the unique ids, and where each of them starts in the sorted array
+    (to sum values by id with np.add.reduceat())
+    """
+    order = np.argsort(ids, kind="stable")
+    unique_ids, starts = np.unique(ids[order], return_index=True)
+
+    return order, unique_ids, starts
+
+
+class CFRSolver:
+    """
+    A CFRSolver solves the rounds between two players with the given counts of dice, i.e. dice=(a, b) -
+    both the one where the player with a dice starts, and the one where the other player does.
+
+    values holds the starter's chance of winning the game from each round with less dice - {(x, y): p}
+    for a starter with x dice and an opponent with y dice (rounds where a player has no dice left are known).
+        solver = CFRSolver((1, 1), wild_1s=False)
+        solver.train(10000)
+        solver.value((1, 1))
+    """
+    def __init__(
+        self,
+        dice,
+        wild_1s,
+        values=None,
+        faces_per_die=FACES_PER_DIE,
+        memory=1,
+        seed=None,
+    ):
+        # Check args
+        if not isinstance(wild_1s, bool):
+            raise TypeError("The 'wild_1s' property of a CFRSolver has to be Boolean")
+
+        if (
+            not isinstance(dice, tuple)
+            or len(dice) != 2
+            or not all(isinstance(d, int) for d in dice)
+        ):
+            raise TypeError("The dice of a CFRSolver have to be a tuple of 2 integers")
+
+        if not min(dice) >= 1:
+            raise ValueError("Each player needs at least 1 die")
+
+        if not isinstance(faces_per_die, int) or not isinstance(memory, int):
+            raise TypeError("Non-integer faces_per_die or memory")
+
+        if not faces_per_die >= 2 or not memory >= 1:
+            raise ValueError("faces_per_die must be >= 2, and memory >= 1")
+
+        self._dice = tuple(sorted(dice))
+        self._wild_1s = wild_1s
+        self._faces_per_die = faces_per_die
+        self._memory = memory
+        self._rng = np.random.default_rng(seed)
+        self._iterations = 0
+
+        count_all_active_dice = sum(dice)
+        self._count_all_active_dice = count_all_active_dice
+        self._graph = _RoundGraph(count_all_active_dice, faces_per_die, memory)
+
+        # The faces & counts of the bids, by rank
+        bids = np.arange(self._graph.count_of_bids)
+        self._bid_faces = bids // count_all_active_dice
+        self._bid_counts = bids % count_all_active_dice + 1
+
+        # The tables of each view (own dice, opponent's dice)
+        a, b = self._dice
+        self._views = [(a, b)] if a == b else [(a, b), (b, a)]
+
+        self._hands = {}
+        self._regrets = {}
+        self._strategy_sums = {}
+        shape = (len(self._graph.histories), self._graph.count_of_bids + 1)
+        for view in self._views:
+            hands = HandIndex(view[0], faces_per_die)
+            self._hands[view[0]] = hands
+            self._regrets[view] = np.zeros((len(hands),) + shape)
+            self._strategy_sums[view] = np.zeros((len(hands),) + shape)
+
+        # The outcomes of each round - the utility (chance of winning the game - 1/2) for the player in turn,
+        # if they lose it, or if the other player does
+        if values is None:
+            values = {}
+
+        self._outcomes = {}
+        for starter in self._views:
+            utilities = []
+            for own, opponent in (starter, starter[::-1]):
+                lose = self._value_of(values, own - 1, opponent)
+                win = 1 - self._value_of(values, opponent - 1, own)
+                utilities.append((lose - 0.5, win - 0.5))
+            self._outcomes[starter] = utilities
+
+    @staticmethod
+    def _value_of(values, starter_dice, opponent_dice):
+        """
+        Helper to the constructor. Returns the starter's chance of winning from a round (after the previous one).
+        """
+        if starter_dice == 0:
+            return 0.0
+
+        if (starter_dice, opponent_dice) not in values:
+            raise ValueError(
+                f"The value of the round with {starter_dice} vs {opponent_dice} dice has to be solved first"
+            )
+
+        return values[(starter_dice, opponent_dice)]
+
+    def _roll(self, count_of_dice, count_of_hands):
+        """
+        Rolls count_of_hands hands, and returns their histograms
+        """
+        faces = self._rng.integers(
+            0, self._faces_per_die, size=(count_of_hands, count_of_dice)
+        )
+        return (faces[..., None] == np.arange(self._faces_per_die)).sum(axis=1)
+
+    def _bids_true(self, table_counts):
+        """
+        Returns a (count_of_bids x n) matrix - whether each bid is true for each of the n table counts
+        (the same rule as Round.evaluate_challenge())
+        """
+        totals = table_counts[:, self._bid_faces]
+        if self._wild_1s:
+            totals = totals + np.where(self._bid_faces != 0, table_counts[:, :1], 0)
+
+        return (totals >= self._bid_counts).T
+
+    def train(self, iterations, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Runs iterations of CFR, each on a batch of batch_size rolls of the hands (for each of the rounds)
+        """
+        if not isinstance(iterations, int) or not isinstance(batch_size, int):
+            raise TypeError("Non-integer iterations or batch_size")
+
+        if iterations < 0 or batch_size < 1:
+            raise ValueError("iterations must be >= 0, and batch_size > 0")
+
+        for _ in range(iterations):
+            self._iterations += 1
+            for starter in self._views:
+                histograms = [self._roll(d, batch_size) for d in starter]
+                self._iterate(starter, histograms)
+
+    def _iterate(self, starter, histograms):
+        """
+        Helper to .train(). A single iteration for the round with the given starter view, and the rolled hands.
+        """
+        graph = self._graph
+        views = (starter, starter[::-1])
+        hand_ids = [self._hands[views[r][0]].ids(histograms[r]) for r in (0, 1)]
+        bids_true = self._bids_true(histograms[0] + histograms[1])
+        outcomes = self._outcomes[starter]
+        batch_size = len(hand_ids[0])
+
+        # The updates of the same information set (the same hand) in the batch are summed up
+        groupings = [_grouping(ids) for ids in hand_ids]
+
+        # Forward - the reach of each state, for the starter & the responder (the root is reached by both)
+        reach = np.zeros((2, graph.count_of_states, batch_size))
+        reach[:, 0] = 1.0
+
+        for group in graph.groups:
+            role = group.role
+            strategy = _regret_matching(
+                self._regrets[views[role]][
+                    hand_ids[role][None, :], group.histories[:, None], group.actions
+                ]
+            )
+
+            own = reach[role, group.states]
+            opponent = reach[1 - role, group.states]
+            count_of_raises = len(group.bids)
+
+            raised = own[:, :, None] * strategy[:, :, :count_of_raises]
+            raised = raised.transpose(0, 2, 1).reshape(-1, batch_size)
+            passed = np.repeat(opponent, count_of_raises, axis=0)
+
+            if count_of_raises:
+                reach[role, group.targets] += np.add.reduceat(
+                    raised[group.order], group.starts, axis=0
+                )
+                reach[1 - role, group.targets] += np.add.reduceat(
+                    passed[group.order], group.starts, axis=0
+                )
+
+        # Backward - the utility of each state for the player in turn, and their regrets
+        utilities = np.zeros((graph.count_of_states, batch_size))
+
+        for group in reversed(graph.groups):
+            role = group.role
+            view = views[role]
+            regrets = self._regrets[view]
+            index = (hand_ids[role][None, :], group.histories[:, None], group.actions)
+            strategy = _regret_matching(regrets[index])
+
+            # A raise hands the turn to the other player, and a challenge ends the round
+            action_utilities = [-utilities[group.children].transpose(0, 2, 1)]
+            if group.last >= 0:
+                lose, win = outcomes[role]
+                challenge = np.where(bids_true[group.last], lose, win)
+                action_utilities.append(
+                    np.broadcast_to(
+                        challenge[None, :, None], (len(group.states), batch_size, 1)
+                    )
+                )
+            action_utilities = np.concatenate(action_utilities, axis=2)
+
+            state_utilities = (strategy * action_utilities).sum(axis=2)
+            utilities[group.states] = state_utilities
+
+            own = reach[role, group.states]
+            opponent = reach[1 - role, group.states]
+            regret = opponent[:, :, None] * (
+                action_utilities - state_utilities[:, :, None]
+            )
+            strategy_weight = (self._iterations * own)[:, :, None] * strategy
+
+            order, hands, starts = groupings[role]
+            regret = np.add.reduceat(regret[:, order], starts, axis=1)
+            strategy_weight = np.add.reduceat(strategy_weight[:, order], starts, axis=1)
+
+            block = np.ix_(
+                hands,
+                group.histories,
+                np.arange(group.actions.start, group.actions.stop),
+            )
+            regrets[block] = np.maximum(regrets[block] + regret.transpose(1, 0, 2), 0)
+            self._strategy_sums[view][block] += strategy_weight.transpose(1, 0, 2)
+
+    def strategy_table(self, view):
+        """
+        Returns the average strategy of a view (own dice, opponent's dice) - an array indexed by
+        (hand id, history id, action), where the action is a bid rank, or count_of_bids for a challenge.
+        Illegal actions have a probability of 0.
+        """
+        if view not in self._strategy_sums:
+            raise ValueError(f"The solver has no view with {view[0]} vs {view[1]} dice")
+
+        sums = self._strategy_sums[view]
+        table = np.zeros_like(sums)
+        for group in self._graph.groups:
+            index = (slice(None), group.histories[:, None], group.actions)
+            table[index] = _regret_matching(sums[index])
+
+        return table
+
+    def hand_ids(self, own_dice, histograms):
+        """
+        Returns the ids of hand histograms (see HandIndex), for hands with own_dice
+        """
+        return self._hands[own_dice].ids(histograms)
+
+    def history_id(self, bids):
+        """
+        Returns the id of a bid history (a sequence of bid ranks, from the first bid of the round),
+        as it's remembered by the solver
+        """
+        bids = tuple(bids)
+        if any(not 0 <= b < self.count_of_bids for b in bids) or any(
+            b1 >= b2 for b1, b2 in zip(bids, bids[1:])
+        ):
+            raise ValueError("The bids of a history have to be legal raises")
+
+        history = bids[-self._memory :] if bids else ()
+
+        return self._graph.histories[history]
+
+    def action_probabilities(self, view, hand_counts, bids):
+        """
+        Returns the probability of each action (see strategy_table()) for a player with
+        the given view & hand, after the given bids (ranks) in the round
+        """
+        if view not in self._regrets or len(hand_counts) != self._faces_per_die:
+            raise ValueError("There is no such hand in the solver")
+
+        hand_id = self.hand_ids(view[0], np.array(hand_counts))
+        return self.strategy_table(view)[hand_id, self.history_id(bids)]
+
+    def value(self, starter):
+        """
+        Returns the starter's chance of winning the game from a round with the given view (starter's dice, opponent's),
+        when both players play the average strategy. It's exact - all pairs of hands are played out.
+        """
+        if starter not in self._outcomes:
+            raise ValueError(
+                f"The solver has no round with {starter[0]} vs {starter[1]} dice"
+            )
+
+        graph = self._graph
+        views = (starter, starter[::-1])
+        tables = [self.strategy_table(v) for v in views]
+        outcomes = self._outcomes[starter]
+
+        # All pairs of hands, and their probabilities
+        hands = [self._hands[v[0]] for v in views]
+        pairs = np.array(
+            list(itertools.product(range(len(hands[0])), range(len(hands[1]))))
+        ).T
+        weights = hands[0].probabilities[pairs[0]] * hands[1].probabilities[pairs[1]]
+        bids_true = self._bids_true(
+            hands[0].histograms[pairs[0]] + hands[1].histograms[pairs[1]]
+        )
+
+        # The flow of probability through the states, for each pair of hands
+        flow = np.zeros((graph.count_of_states, len(weights)))
+        flow[0] = 1.0
+        value = np.zeros(len(weights))
+
+        for group in graph.groups:
+            role = group.role
+            strategy = tables[role][
+                pairs[role][None, :], group.histories[:, None], group.actions
+            ]
+            into = flow[group.states][:, :, None] * strategy
+            count_of_raises = len(group.bids)
+
+            if count_of_raises:
+                raised = into[:, :, :count_of_raises].transpose(0, 2, 1)
+                raised = raised.reshape(-1, len(weights))
+                flow[group.targets] += np.add.reduceat(
+                    raised[group.order], group.starts, axis=0
+                )
+
+            # The starter's chance of winning after each challenge
+            if group.last >= 0:
+                lose, win = outcomes[role]
+                utility = np.where(bids_true[group.last], lose, win)
+                if role == 1:
+                    utility = -utility
+                value += into[:, :, count_of_raises].sum(axis=0) * (utility + 0.5)
+
+        return float(value @ weights)
+
+    @property
+    def dice(self):
+        return self._dice
+
+    @property
+    def views(self):
+        return list(self._views)
+
+    @property
+    def wild_1s(self):
+        return self._wild_1s
+
+    @property
+    def faces_per_die(self):
+        return self._faces_per_die
+
+    @property
+    def memory(self):
+        return self._memory
+
+    @property
+    def count_all_active_dice(self):
+        return self._count_all_active_dice
+
+    @property
+    def count_of_bids(self):
+        return self._graph.count_of_bids
+
+    @property
+    def iterations(self):
+        return self._iterations
+
+
+class CFRSolution:
+    """
+    The solved rounds of heads-up games with up to max_dice per player (see solve()).
+    Holds a CFRSolver for each pair of dice counts, and the starter's chance of winning from each round.
+    """
+    def __init__(self, solvers, values):
+        self._solvers = solvers
+        self._values = values
+
+    def solver(self, view):
+        """
+        Returns the CFRSolver of the rounds with the given view (own dice, opponent's dice)
+        """
+        key = tuple(sorted(view))
+        if key not in self._solvers:
+            raise ValueError(
+                f"There is no solved round with {view[0]} vs {view[1]} dice"
+            )
+
+        return self._solvers[key]
+
+    def action_probabilities(self, view, hand_counts, bids):
+        """
+        Returns the probability of each action, for a player with the given view & hand,
+        after the given bids (ranks) in the round - see CFRSolver.strategy_table()
+        """
+        return self.solver(view).action_probabilities(view, hand_counts, bids)
+
+    @property
+    def values(self):
+        return dict(self._values)
+
+    @property
+    def solvers(self):
+        return list(self._solvers.values())
+
+
+def solve(
+    max_dice,
+    wild_1s,
+    iterations,
+    faces_per_die=FACES_PER_DIE,
+    memory=1,
+    batch_size=DEFAULT_BATCH_SIZE,
+    seed=0,
+    workers=1,
+):
+    """
+    Solves heads-up games where each player has up to max_dice, and returns the CFRSolution.
+
+    The rounds are solved in order of the count of dice in play, since each round's outcome depends on the rounds
+    with less dice. The solvers of rounds with the same count of dice are independent of each other, so with
+    workers > 1 (or None, for all the CPU cores) they're trained in a pool of worker processes.
+    Each solver's RNG is seeded from the seed and its dice, so the results are the same regardless of the workers.
+    """
+    if not isinstance(max_dice, int) or not isinstance(seed, int):
+        raise TypeError("Non-integer max_dice or seed")
+
+    if not max_dice >= 1:
+        raise ValueError("max_dice must be >= 1")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if not isinstance(workers, int):
+        raise TypeError("Non-integer workers")
+
+    if workers < 1:
+        raise ValueError("workers must be > 0")
+
+    solvers = {}
+    values = {}
+
+    for count_all_active_dice in range(2, 2 * max_dice + 1):
+        tasks = [
+            (
+                (a, count_all_active_dice - a),
+                wild_1s,
+                dict(values),
+                faces_per_die,
+                memory,
+                (seed, a, count_all_active_dice - a),
+                iterations,
+                batch_size,
+            )
+            for a in range(1, count_all_active_dice // 2 + 1)
+            if count_all_active_dice - a <= max_dice
+        ]
+
+        if workers == 1 or len(tasks) < 2:
+            trained = [_train_solver(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                trained = list(executor.map(_train_solver, *zip(*tasks)))
+
+        for solver in trained:
+            solvers[solver.dice] = solver
+            for view in solver.views:
+                values[view] = solver.value(view)
+
+    return CFRSolution(solvers, values)
+
+
+def _train_solver(
+    dice, wild_1s, values, faces_per_die, memory, seed, iterations, batch_size
+):
+    """
+    Helper to solve(). Creates & trains a CFRSolver (possibly in a worker process).
+    """
+    solver = CFRSolver(dice, wild_1s, values, faces_per_die, memory, list(seed))
+    solver.train(iterations, batch_size)
+
+    return solver
+
+
+class CFRStrategy(Strategy):
+    """
+    Plays the average strategy of a CFRSolution (solved with memory=1), by sampling
+    the action of each turn from it. The opponents' dice are taken as a single opponent's.
+    The actions are drawn from the rng passed to decide_batch(), or else from the strategy's own rng (if it has one).
+    """
+    def __init__(self, solution, rng=None):
+        if not isinstance(solution, CFRSolution):
+            raise TypeError("A CFRStrategy expects a CFRSolution")
+
+        if any(s.memory != 1 for s in solution.solvers):
+            raise ValueError("A CFRStrategy can only play a solution with memory=1")
+
+        if rng is not None and not isinstance(rng, np.random.Generator):
+            raise TypeError(
+                "The rng of a CFRStrategy has to be a numpy.random.Generator"
+            )
+
+        self._solution = solution
+        self._rng = rng
+
+        # The strategy tables are only built once for each view
+        self._tables = {}
+
+    def _table(self, view):
+        table = self._tables.get(view)
+        if table is None:
+            table = self._solution.solver(view).strategy_table(view)
+            self._tables[view] = table
+
+        return table
+
+    def decide_batch(self, states, rng=None):
+        hand_counts, bid_ranks, dice_in_play = states
+        rng = _generator(rng, self._rng)
+        own_dice = hand_counts.sum(axis=1)
+        actions = np.empty(len(bid_ranks), dtype=np.int64)
+
+        for view in set(zip(own_dice.tolist(), (dice_in_play - own_dice).tolist())):
+            rows = np.flatnonzero((own_dice == view[0]) & (dice_in_play == sum(view)))
+            solver = self._solution.solver(view)
+            count_all_active_dice = solver.count_all_active_dice
+
+            # The history is just the active bid - with memory=1, the history ids are 0 for no bids,
+            # and the index of the bid among the legal bids + 1
+            faces, counts = np.divmod(bid_ranks[rows], Bid.MAX_COUNT)
+            bids = faces * count_all_active_dice + counts
+            histories = np.where(bid_ranks[rows] == NO_BID, 0, bids + 1)
+
+            hand_ids = solver.hand_ids(view[0], hand_counts[rows])
+            probabilities = self._table(view)[hand_ids, histories]
+
+            # Sample an action from each row
+            draws = rng.random((len(rows), 1))
+            chosen = (probabilities.cumsum(axis=1) < draws).sum(axis=1)
+            chosen = np.minimum(chosen, probabilities.shape[1] - 1)
+
+            chosen_faces, chosen_counts = np.divmod(chosen, count_all_active_dice)
+            actions[rows] = np.where(
+                chosen == solver.count_of_bids,
+                CHALLENGE,
+                chosen_faces * Bid.MAX_COUNT + chosen_counts,
+            )
+
+        return actions
+
+    @property
+    def solution(self):
+        return self._solution
@@ -0,0 +1,28 @@
+import inspect
+
+import pytest
+
+import liarsdice
+
+# Several tests in test_liarsdice.py mock private attributes on the classes themselves
+# (e.g. type(p)._hand = PropertyMock(...)), and those mocks outlive the test.
+# Take a snapshot of the classes before any test runs, so that other test modules can start clean.
+_PRISTINE = {
+    c: dict(c.__dict__)
+    for _, c in inspect.getmembers(liarsdice, inspect.isclass)
+    if c.__module__ == liarsdice.__name__
+}
+
+
+@pytest.fixture
+def pristine_liarsdice():
+    """
+    Restores the classes in liarsdice.py to the state they were in at import time
+    """
+    for c, attributes in _PRISTINE.items():
+        for name in list(c.__dict__):
+            if name not in attributes:
+                delattr(c, name)
+        for name, value in attributes.items():
+            if c.__dict__.get(name) is not value:
+                setattr(c, name, value)
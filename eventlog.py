@@ -0,0 +1,341 @@
+import mmap
+import os
+import struct
+
+from liarsdice import Event
+
+# The binary format of a game log is a sequence of length-prefixed records - one per event:
+#   [length][kind][fields...]
+# - length: the number of bytes after it (kind + fields), as a varint;
+# - kind: a single byte (see liarsdice.Event);
+# - fields: the event's fields, in the order they have in the event tuple.
+#   Integers (seats, counts, faces, round numbers) and booleans are varints, while the HANDS event
+#   holds the count of hands, followed by (seat, count of dice, faces) for each hand - one byte per face.
+# Varints take a single byte for values < 128, so most events fit in 3 to 6 bytes.
+#
+# Each log file has a sidecar offset index (the same path + INDEX_SUFFIX), which holds the offset
+# of the GAME_START record of each game, as a little-endian unsigned 64-bit integer.
+
+# Write to the file once the buffer grows beyond this many bytes
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+INDEX_SUFFIX = ".idx"
+_OFFSET = struct.Struct("<Q")
+
+
+def encode_varint(n, out):
+    """
+    Appends an unsigned integer to the bytearray out, 7 bits per byte (lowest bits first)
+    """
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def decode_varint(data, offset):
+    """
+    Reads an unsigned integer, written by encode_varint(), from data at offset.
+    Returns the integer, and the offset right after it.
+    """
+    n = 0
+    shift = 0
+    while True:
+        b = data[offset]
+        offset += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, offset
+        shift += 7
+
+
+def encode_event(event, out):
+    """
+    Appends the record for an event (a tuple, as emitted by a Game) to the bytearray out
+    """
+    body = bytearray()
+    body.append(event[0])
+
+    if event[0] == Event.HANDS:
+        hands = event[1]
+        encode_varint(len(hands), body)
+        for seat, faces in hands:
+            encode_varint(seat, body)
+            encode_varint(len(faces), body)
+            body += faces
+    else:
+        for field in event[1:]:
+            encode_varint(int(field), body)
+
+    encode_varint(len(body), out)
+    out += body
+
+
+def decode_event(data, offset):
+    """
+    Reads the record of a single event from data at offset.
+    Returns the event tuple (in the same form as emitted by a Game), and the offset of the next record.
+    """
+    length, offset = decode_varint(data, offset)
+    end = offset + length
+
+    kind = Event(data[offset])
+    offset += 1
+
+    if kind == Event.HANDS:
+        count_of_hands, offset = decode_varint(data, offset)
+        hands = []
+        for _ in range(count_of_hands):
+            seat, offset = decode_varint(data, offset)
+            count_of_dice, offset = decode_varint(data, offset)
+            hands.append((seat, bytes(data[offset : offset + count_of_dice])))
+            offset += count_of_dice
+
+        return (kind, tuple(hands)), end
+
+    fields = [kind]
+    while offset < end:
+        field, offset = decode_varint(data, offset)
+        fields.append(field)
+
+    if kind == Event.GAME_START:
+        fields[2] = bool(fields[2])
+    elif kind == Event.CHALLENGE:
+        fields[3] = bool(fields[3])
+
+    return tuple(fields), end
+
+
+def decode_events(data):
+    """
+    Yields all the events in data (e.g. the contents of a log file)
+    """
+    offset = 0
+    while offset < len(data):
+        event, offset = decode_event(data, offset)
+        yield event
+
+
+def build_index(path):
+    """
+    (Re)builds the offset index of a log file, by skipping from record to record
+    (only the length & kind of each record are read). Returns the list of offsets.
+    """
+    offsets = []
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+        offset = 0
+        while offset < size:
+            length, start = decode_varint(data, offset)
+            if data[start] == Event.GAME_START:
+                offsets.append(offset)
+            offset = start + length
+
+        if size:
+            data.close()
+
+    with open(str(path) + INDEX_SUFFIX, "wb") as f:
+        f.write(b"".join(_OFFSET.pack(o) for o in offsets))
+
+    return offsets
+
+
+class EventLogWriter:
+    """
+    An EventLogWriter writes the events of games to a binary log file (and keeps its offset index up to date).
+    Records are collected in a buffer, and only written out once it's full (or on flush() / close()).
+
+    Can be used as a listener of a Game (see Game.add_listener()), and as a context manager:
+        with EventLogWriter("games.log") as log:
+            game.add_listener(log)
+    """
+    def __init__(self, path, buffer_size=DEFAULT_BUFFER_SIZE):
+        if not isinstance(buffer_size, int):
+            raise TypeError("Non-integer buffer_size")
+
+        if buffer_size < 1:
+            raise ValueError("The buffer_size must be > 0")
+
+        if os.path.exists(path) and not os.path.exists(str(path) + INDEX_SUFFIX):
+            build_index(path)
+
+        self._file = open(path, "ab")
+        self._index_file = open(str(path) + INDEX_SUFFIX, "ab")
+        self._buffer = bytearray()
+        self._index_buffer = bytearray()
+        self._buffer_size = buffer_size
+
+        # The offset in the file, where the buffer starts
+        self._offset = self._file.tell()
+
+    def __call__(self, event):
+        self.write(event)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, event):
+        """
+        Adds an event to the log
+        """
+        if event[0] == Event.GAME_START:
+            self._index_buffer += _OFFSET.pack(self._offset + len(self._buffer))
+
+        encode_event(event, self._buffer)
+
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes out everything in the buffer
+        """
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._offset += len(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+        # The index is written after the log, so it never points past the end of the log
+        if self._index_buffer:
+            self._index_file.write(self._index_buffer)
+            self._index_buffer.clear()
+        self._index_file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            self._index_file.close()
+
+
+class EventLogReader:
+    """
+    An EventLogReader reads a binary log file, written by an EventLogWriter.
+    The file is memory-mapped, and games are only parsed when they're asked for,
+    so even very large logs can be scanned without loading them in memory.
+
+    Supports len(), random access to the n-th game (through the offset index), and iterating over the games:
+        with EventLogReader("games.log") as log:
+            for game in log:
+                for round in game.rounds():
+                    ...
+    """
+    def __init__(self, path):
+        if not os.path.exists(str(path) + INDEX_SUFFIX):
+            build_index(path)
+
+        self._file = open(path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._data = self._map(self._file, self._size)
+
+        self._index_file = open(str(path) + INDEX_SUFFIX, "rb")
+        index_size = os.fstat(self._index_file.fileno()).st_size
+        self._index = self._map(self._index_file, index_size)
+        self._count_of_games = index_size // _OFFSET.size
+
+    def __len__(self):
+        return self._count_of_games
+
+    def __getitem__(self, n):
+        return self.game(n)
+
+    def __iter__(self):
+        for n in range(self._count_of_games):
+            yield self.game(n)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _map(f, size):
+        """
+        Memory-maps a file for reading (empty files can't be mapped, so they're just empty bytes)
+        """
+        if size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _offset_of(self, n):
+        """
+        Returns the offset of the n-th game in the log (or the end of the log, for n == len(self))
+        """
+        if n == self._count_of_games:
+            return self._size
+        return _OFFSET.unpack_from(self._index, n * _OFFSET.size)[0]
+
+    def game(self, n):
+        """
+        Returns the n-th game in the log (counting from 0), as a GameLog
+        """
+        if not isinstance(n, int):
+            raise TypeError("Non-integer game number")
+
+        if n < 0:
+            n += self._count_of_games
+
+        if not self._count_of_games > n >= 0:
+            raise IndexError("There is no such game in the log")
+
+        return GameLog(self._data, self._offset_of(n), self._offset_of(n + 1))
+
+    def close(self):
+        for m in (self._data, self._index):
+            if isinstance(m, mmap.mmap):
+                m.close()
+        self._file.close()
+        self._index_file.close()
+
+
+class GameLog:
+    """
+    A GameLog represents a single game in a log file. Its events are only decoded while iterating over them.
+    """
+    def __init__(self, data, start, end):
+        self._data = data
+        self._start = start
+        self._end = end
+
+    def events(self):
+        """
+        Yields the events of the game, in order
+        """
+        data = self._data
+        offset = self._start
+        while offset < self._end:
+            event, offset = decode_event(data, offset)
+            yield event
+
+    def rounds(self):
+        """
+        Yields the events of each round of the game, as a list (starting with the ROUND_START event).
+        The events before the first round, and the WINNER event, are left out.
+        """
+        round_events = None
+        for event in self.events():
+            kind = event[0]
+            if kind == Event.ROUND_START:
+                if round_events is not None:
+                    yield round_events
+                round_events = [event]
+            elif round_events is not None and kind != Event.WINNER:
+                round_events.append(event)
+
+        if round_events is not None:
+            yield round_events
+
+    @property
+    def size(self):
+        """
+        The number of bytes the game takes in the log
+        """
+        return self._end - self._start
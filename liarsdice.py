@@ -1,18 +1,95 @@
 import random
-from collections import Counter
+from collections import deque, namedtuple
+from enum import IntEnum
+from functools import lru_cache
+
+from probability import FACES_PER_DIE, probability_of_bid
+
+# The sizes of a standard table (a Game can be set up with other sizes).
+# FACES_PER_DIE is defined in probability.py, which can't import this module.
+MAX_PLAYERS = 5
+DICE_PER_PLAYER = 5
+
+
+class Event(IntEnum):
+    """
+    The kinds of events that a Game emits to its listeners (see Game.add_listener()).
+    Each event is a tuple, starting with its kind, and followed by (seats are indexes in Game.players):
+    - GAME_START: count_of_players, wild_1s, dice_per_player, faces_per_die
+    - ROUND_START: round_number, seat_of_whose_turn
+    - HANDS: a tuple of (seat, faces) pairs, with faces as bytes (see Hand.faces)
+    - BID: seat_of_bidder, face, count
+    - CHALLENGE: seat_of_challenger, seat_of_bidder, bid_was_a_lie
+    - DIE_LOST: seat
+    - ELIMINATION: seat
+    - WINNER: seat
+    """
+    GAME_START = 0
+    ROUND_START = 1
+    HANDS = 2
+    BID = 3
+    CHALLENGE = 4
+    DIE_LOST = 5
+    ELIMINATION = 6
+    WINNER = 7
 
 
 class Bid:
     """
     An instance of Bid represents a guess that at least as many occurences (count)
-    of a die face are present within the concealed hands of all players
+    of a die face are present within the concealed hands of all players.
+
+    Bids are immutable flyweights - there's only one Bid object for each (face, count) pair,
+    so Bid(Die(3), 2) is Bid(Die(3), 2), and bids can be used as dict keys.
     """
+    __slots__ = ("_die", "_count", "_rank")
+
+    # The highest count a bid can have (the most dice there can be in a game, whatever the size of the table).
+    # Bids are ranked in the order of Bid.is_higher(), by face first, and then by count:
+    # rank == (face - 1) * MAX_COUNT + (count - 1)
+    MAX_COUNT = 1 << 16
+
+    # The Bid objects that have been created so far, by rank
+    _bids = {}
+
+    def __new__(cls, die, count, active_bid=None, count_all_active_dice=None):
+        cls._check_bid_validity(die, count, active_bid, count_all_active_dice)
+
+        rank = (die.face - 1) * Bid.MAX_COUNT + (count - 1)
 
-    def __init__(self, die, count, active_bid=None, count_all_active_dice=None):
-        self._check_bid_validity(die, count, active_bid, count_all_active_dice)
+        # Only Bid objects are shared - subclasses get objects of their own
+        if cls is Bid:
+            bid = Bid._bids.get(rank)
+            if bid is not None:
+                return bid
 
-        self._die = die
-        self._count = count
+        bid = object.__new__(cls)
+        object.__setattr__(bid, "_die", die)
+        object.__setattr__(bid, "_count", count)
+        object.__setattr__(bid, "_rank", rank)
+
+        if cls is not Bid:
+            return bid
+
+        # If threads race to create the same bid, setdefault() keeps (and returns) the first one stored
+        return Bid._bids.setdefault(rank, bid)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Bid objects are immutable")
+
+    @classmethod
+    def trusted(cls, face, count):
+        """
+        Returns the Bid for a face & count, skipping the checks once it exists.
+        Only for engine code, where the bid is known to be legal.
+        """
+        bid = cls._bids.get((face - 1) * cls.MAX_COUNT + (count - 1))
+
+        return bid if bid is not None and cls is Bid else cls(Die.trusted(face), count)
+
+    def __reduce__(self):
+        # Unpickling goes through the constructor, so that it returns the shared object
+        return (type(self), (self._die, self._count))
 
     def __str__(self):
         return f"{self.count} occurrences of:\n{Die.stringify_dice([self.die])}"
@@ -22,18 +99,60 @@ class Bid:
         """
         Determines whether a new_bid is higher than the active_bid
         """
-        if new_bid.die.face > active_bid.die.face:
-            return True
-        elif new_bid.die.face < active_bid.die.face:
-            return False
-        else:
-            if new_bid.count > active_bid.count:
-                return True
-            else:
-                return False
+        return new_bid.rank > active_bid.rank
+
+    @classmethod
+    def legal_bids(cls, count_all_active_dice, faces_per_die=FACES_PER_DIE):
+        """
+        Returns a tuple of all the bids that can be made when there are count_all_active_dice in play,
+        ordered by rank. The bid with face f & count c is at index (f - 1) * count_all_active_dice + (c - 1).
+        The tuples of the most recently used table sizes are kept, and reused.
+        """
+        if not isinstance(count_all_active_dice, int) or not isinstance(
+            faces_per_die, int
+        ):
+            raise TypeError("Non-integer for count_all_active_dice or faces_per_die")
+
+        if not cls.MAX_COUNT >= count_all_active_dice >= 2:
+            raise ValueError(
+                "count_all_active_dice must be between 2 and the most dice there can be in play"
+            )
+
+        return Bid._legal_bids(count_all_active_dice, faces_per_die)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _legal_bids(count_all_active_dice, faces_per_die):
+        """
+        Helper to legal_bids(). Builds the tuple of all the bids for a table size, once it has been checked
+        (each tuple holds up to MAX_COUNT x faces_per_die bids, so only a few of them are kept).
+        """
+        return tuple(
+            Bid(Die(face, faces_per_die), count)
+            for face in range(1, faces_per_die + 1)
+            for count in range(1, count_all_active_dice + 1)
+        )
+
+    @classmethod
+    def legal_raises(
+        cls, active_bid, count_all_active_dice, faces_per_die=FACES_PER_DIE
+    ):
+        """
+        Returns a tuple of all the bids that can follow the active_bid (all legal bids, if it's None),
+        ordered by rank. It's a slice of Bid.legal_bids().
+        """
+        bids = cls.legal_bids(count_all_active_dice, faces_per_die)
+
+        if active_bid is None:
+            return bids
 
+        # (A count beyond the dice in play means there are no raises left on that face)
+        count = min(active_bid.count, count_all_active_dice)
+        return bids[(active_bid.die.face - 1) * count_all_active_dice + count :]
+
+    @classmethod
     def _check_bid_validity(
-        self, die, count, active_bid=None, count_all_active_dice=None
+        cls, die, count, active_bid=None, count_all_active_dice=None
     ):
         """
         Checks if the die and face args, passed to the constructor can be used to
@@ -49,13 +168,18 @@ class Bid:
         if not count > 0:
             raise ValueError("Invalid bid: count must be > 0")
 
+        if count > Bid.MAX_COUNT:
+            raise ValueError(
+                "Invalid bid: count is more than the dice there can be in a game"
+            )
+
         if not count_all_active_dice is None:
             if not isinstance(count_all_active_dice, int):
                 raise TypeError("Non-integer for count_all_active_dice")
 
-            if not count_all_active_dice > 2:
+            if not count_all_active_dice >= 2:
                 raise ValueError(
-                    "count_all_active_dice must be > 2, or the game is over"
+                    "count_all_active_dice must be >= 2, or the game is over"
                 )
 
         if count_all_active_dice:
@@ -81,19 +205,93 @@ class Bid:
     def count(self):
         return self._count
 
+    @property
+    def rank(self):
+        return self._rank
+
 
 class Die:
     """
-    A Die instance represents a single die (one of the players' dice)
+    A Die instance represents a single die (one of the players' dice).
+
+    Dice are immutable flyweights - there's only one Die object for each face, so Die(3) is Die(3).
+    A die has FACES_PER_DIE faces, unless another faces_per_die is passed (e.g. Die(8, faces_per_die=10)).
     """
-    def __init__(self, face):
+    __slots__ = ("_face",)
+
+    # The most faces a die can have (faces are kept in bytes, see Hand)
+    MAX_FACES = 255
+
+    # The Die objects that have been created so far, by face
+    _dice = {}
+
+    # The rows of ASCII art for each face, built once
+    _TOP_BOTTOM = "+-------+"
+    _BLANK_ROW = "|       |"
+    _MIDDLE_POINT = "|   O   |"
+    _LEFT_SIDE_POINT = "| O     |"
+    _RIGHT_SIDE_POINT = "|     O |"
+    _BOTH_SIDE_POINTS = "| O   O |"
+
+    _FACE_ROWS = (
+        (_TOP_BOTTOM, _BLANK_ROW, _MIDDLE_POINT, _BLANK_ROW, _TOP_BOTTOM),
+        (_TOP_BOTTOM, _RIGHT_SIDE_POINT, _BLANK_ROW, _LEFT_SIDE_POINT, _TOP_BOTTOM),
+        (_TOP_BOTTOM, _RIGHT_SIDE_POINT, _MIDDLE_POINT, _LEFT_SIDE_POINT, _TOP_BOTTOM),
+        (_TOP_BOTTOM, _BOTH_SIDE_POINTS, _BLANK_ROW, _BOTH_SIDE_POINTS, _TOP_BOTTOM),
+        (_TOP_BOTTOM, _BOTH_SIDE_POINTS, _MIDDLE_POINT, _BOTH_SIDE_POINTS, _TOP_BOTTOM),
+        (
+            _TOP_BOTTOM,
+            _BOTH_SIDE_POINTS,
+            _BOTH_SIDE_POINTS,
+            _BOTH_SIDE_POINTS,
+            _TOP_BOTTOM,
+        ),
+    )
+
+    def __new__(cls, face, faces_per_die=FACES_PER_DIE):
         if not isinstance(face, int):
             raise TypeError("Invalid die: non-integer face")
 
-        if not 6 >= face >= 1:
-            raise ValueError("Invalid die: face not between 1 and 6")
+        if not isinstance(faces_per_die, int):
+            raise TypeError("Invalid die: non-integer faces_per_die")
 
-        self._face = face
+        if not faces_per_die >= face >= 1:
+            raise ValueError(f"Invalid die: face not between 1 and {faces_per_die}")
+
+        if faces_per_die > cls.MAX_FACES:
+            raise ValueError(f"Invalid die: more than {cls.MAX_FACES} faces")
+
+        # Only Die objects are shared - subclasses get objects of their own
+        if cls is Die:
+            die = Die._dice.get(face)
+            if die is not None:
+                return die
+
+        die = object.__new__(cls)
+        object.__setattr__(die, "_face", face)
+
+        if cls is not Die:
+            return die
+
+        # If threads race to create the same die, setdefault() keeps (and returns) the first one stored
+        return Die._dice.setdefault(face, die)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Die objects are immutable")
+
+    @classmethod
+    def trusted(cls, face):
+        """
+        Returns the Die for a face, skipping the checks once it exists.
+        Only for engine code, where the face is known to be valid.
+        """
+        die = cls._dice.get(face)
+
+        return die if die is not None and cls is Die else cls(face, cls.MAX_FACES)
+
+    def __reduce__(self):
+        # Unpickling goes through the constructor, so that it returns the shared object
+        return (type(self), (self._face,))
 
     @staticmethod
     def stringify_dice(raw_hand):
@@ -102,6 +300,7 @@ class Die:
         Expects a list of Die objects as the only argument.
 
         To be used in printing player's hands & bids.
+        The result for each combination of dice is cached, so a hand or a bid is only rendered once.
         """
         if not isinstance(raw_hand, list):
             raise TypeError(
@@ -113,50 +312,179 @@ class Die:
                 "The Die.stringify_dice methods expects a list of at least 1 Die object"
             )
 
-        for d in raw_hand:
+        try:
+            return Die._stringify_dice(tuple(raw_hand))
+        except TypeError:
+            raise TypeError(
+                "The Die.stringify_dice methods expects a list of Die objects"
+            )
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _stringify_dice(dice):
+        """
+        Helper to stringify_dice(). Only checks the dice when they aren't in the cache yet
+        (Die objects are shared, so a cached tuple can only hold valid dice).
+        """
+        for d in dice:
             if not isinstance(d, Die):
                 raise TypeError(
                     "The Die.stringify_dice methods expects a list of Die objects"
                 )
 
-        top_bottom = "+-------+"
-        blank_row = "|       |"
-        middle_point = "|   O   |"
-        left_side_point = "| O     |"
-        right_side_point = "|     O |"
-        both_side_points = "| O   O |"
-
-        dice_faces = [
-            [top_bottom, blank_row, middle_point, blank_row, top_bottom],
-            [top_bottom, right_side_point, blank_row, left_side_point, top_bottom],
-            [top_bottom, right_side_point, middle_point, left_side_point, top_bottom],
-            [top_bottom, both_side_points, blank_row, both_side_points, top_bottom],
-            [top_bottom, both_side_points, middle_point, both_side_points, top_bottom],
-            [
-                top_bottom,
-                both_side_points,
-                both_side_points,
-                both_side_points,
-                top_bottom,
-            ],
-        ]
-
-        hand = [die.face for die in raw_hand]
+        return Die.stringify_faces(bytes(d.face for d in dice), Die.MAX_FACES)
 
-        s = ""
-        for i in range(5):
-            for die in hand:
-                s += " " + dice_faces[die - 1][i]
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def stringify_faces(faces, faces_per_die=FACES_PER_DIE):
+        """
+        Same as stringify_dice(), but expects the faces as bytes (e.g. Hand.faces), instead of Die objects,
+        of dice with faces_per_die faces
+        """
+        # Check args
+        for face in faces:
+            if not faces_per_die >= face >= 1:
+                raise ValueError(f"Invalid die: face not between 1 and {faces_per_die}")
 
-            s += "\n"
+        rows = [
+            Die._FACE_ROWS[face - 1] if face <= 6 else Die._numbered_rows(face)
+            for face in faces
+        ]
+        return "\n".join(" " + " ".join(r[i] for r in rows) for i in range(5))
 
-        return s.rstrip("\n")
+    @staticmethod
+    def _numbered_rows(face):
+        """
+        Helper to stringify_faces(). Returns the rows for a face above 6, which shows its number instead of points.
+        """
+        return (
+            Die._TOP_BOTTOM,
+            Die._BLANK_ROW,
+            f"|{face:^7}|",
+            Die._BLANK_ROW,
+            Die._TOP_BOTTOM,
+        )
 
     @property
     def face(self):
         return self._face
 
 
+class Hand:
+    """
+    A Hand instance holds the faces of a player's dice as a single row of bytes,
+    plus a face-count vector (how many dice show each face).
+    Die objects are only created when they're asked for.
+    """
+    def __init__(self, faces, faces_per_die=FACES_PER_DIE):
+        faces = bytes(faces)
+
+        if not isinstance(faces_per_die, int):
+            raise TypeError("Non-integer faces_per_die")
+
+        if not Die.MAX_FACES >= faces_per_die >= 2:
+            raise ValueError(f"A die has to have between 2 and {Die.MAX_FACES} faces")
+
+        if len(faces) > 0 and not (min(faces) >= 1 and max(faces) <= faces_per_die):
+            raise ValueError(f"Invalid hand: face not between 1 and {faces_per_die}")
+
+        self._faces = faces
+        self._faces_per_die = faces_per_die
+        self._counts = None
+
+    @classmethod
+    def trusted(cls, faces, faces_per_die=FACES_PER_DIE):
+        """
+        Creates a Hand without checking the faces.
+        Only for engine code, where they are known to be bytes between 1 and faces_per_die (e.g. from Hand.roll_faces()).
+        """
+        hand = cls.__new__(cls)
+        hand._faces = faces
+        hand._faces_per_die = faces_per_die
+        hand._counts = None
+
+        return hand
+
+    def __len__(self):
+        return len(self._faces)
+
+    def __iter__(self):
+        for face in self._faces:
+            yield Die.trusted(face)
+
+    def __getitem__(self, index):
+        return Die.trusted(self._faces[index])
+
+    def to_dice(self):
+        """
+        Returns the hand as a list of Die objects
+        """
+        return [Die.trusted(face) for face in self._faces]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _byte_to_face(faces_per_die):
+        """
+        Returns the table that maps a random byte to a die face. The bytes beyond the last whole multiple
+        of faces_per_die map to 0 and get thrown away, so that all faces are equally likely
+        (for 6 faces, bytes >= 252 == 6 * 42 are thrown away).
+        """
+        limit = 256 - 256 % faces_per_die
+        return bytes(b % faces_per_die + 1 if b < limit else 0 for b in range(256))
+
+    @classmethod
+    def roll_faces(cls, count, faces_per_die=FACES_PER_DIE, rng=random):
+        """
+        Rolls count dice at once, and returns their faces as a row of bytes.
+        Uses a single rng.getrandbits() call (unless some bytes have to be re-drawn).
+        The rng is a random.Random (or the random module itself).
+        """
+        byte_to_face = cls._byte_to_face(faces_per_die)
+
+        faces = b""
+        while len(faces) < count:
+            # Draw a few extra bytes, so that the thrown away ones are (nearly always) covered
+            count_of_bytes = count - len(faces) + 4
+            raw = rng.getrandbits(8 * count_of_bytes).to_bytes(count_of_bytes, "little")
+            faces += raw.translate(byte_to_face).replace(b"\x00", b"")
+
+        return faces[:count]
+
+    @property
+    def faces(self):
+        return self._faces
+
+    @property
+    def faces_per_die(self):
+        return self._faces_per_die
+
+    @property
+    def counts(self):
+        """
+        A tuple of faces_per_die counts - counts[i] is the number of dice with face i + 1
+        """
+        if self._counts is None:
+            faces = self._faces
+            self._counts = tuple(
+                faces.count(face) for face in range(1, self._faces_per_die + 1)
+            )
+
+        return self._counts
+
+    def most_common_face(self):
+        """
+        Returns the face that most dice in the hand show (on a tie - the one that comes first in the hand)
+        """
+        counts = self.counts
+        most = max(counts)
+
+        faces = [face for face in range(1, len(counts) + 1) if counts[face - 1] == most]
+        if len(faces) == 1:
+            return faces[0]
+
+        return min(faces, key=self._faces.index)
+
+
 class Round:
     """
     A Round instance represents one of the rounds in a game of "Liar's dice".
@@ -166,7 +494,6 @@ class Round:
             raise TypeError("Invalid round number: has to be a positive integer")
         if not number > 0:
             raise ValueError("Invalid round number: has to be a positive integer")
-        self._number = number
 
         for p in players:
             if not isinstance(p, Player):
@@ -176,20 +503,88 @@ class Round:
 
         if len(players) < 2:
             raise ValueError("A round can't have less than 2 players")
-        self._players = players
 
         if not isinstance(whose_turn, Player):
             raise TypeError(
                 "The 'whose_turn' property has to reference a Player object"
             )
+
+        self._start(number, players, whose_turn)
+
+    def __str__(self):
+        return f"Round {self.number} begins! ({len(self.players)} players in the game)"
+
+    @classmethod
+    def trusted(cls, number, players, whose_turn, game=None):
+        """
+        Creates a Round without checking the args.
+        Only for engine code (e.g. Game.add_round()), where they are known to be valid.
+        If a game is passed, the round emits its events to the game's listeners.
+        """
+        round = cls.__new__(cls)
+        round._start(number, players, whose_turn, game)
+
+        return round
+
+    def _start(self, number, players, whose_turn, game=None):
+        """
+        Helper to the constructors. Sets up the state of a new round.
+        """
+        self._number = number
+        self._players = players
         self._whose_turn = whose_turn
+        self._game = game
+        self._faces_per_die = game._faces_per_die if game is not None else FACES_PER_DIE
+        self._rng = game._rng if game is not None else random
 
         self._active_bid = None
         self._active_bidder = None
         self._round_loser = None
 
-    def __str__(self):
-        return f"Round {self.number} begins! ({len(self.players)} players in the game)"
+        # The count of dice showing each face, across all hands (set by draw_hands())
+        self._face_counts = None
+
+        # The index of each player in players (only built when needed, see ._positions())
+        self._positions_of_players = None
+
+    def _positions(self):
+        """
+        Returns a dict with the index of each player of the round, so that looking players up is O(1)
+        """
+        if self._positions_of_players is None:
+            self._positions_of_players = {p: i for i, p in enumerate(self._players)}
+
+        return self._positions_of_players
+
+    def _emit_bid(self):
+        """
+        Emits the BID event for the active_bid (if the round is part of a game with listeners)
+        """
+        if self._game is not None and self._game.has_listeners:
+            bid = self._active_bid
+            self._game.emit(
+                (Event.BID, self._active_bidder.seat, bid.die.face, bid.count)
+            )
+
+    def _emit_challenge(self):
+        """
+        Emits the events that follow a challenge - CHALLENGE, DIE_LOST, and ELIMINATION (if the loser has no dice left).
+        Expects the loser to have lost their die already (the same way, project.py & the simulation engine do it).
+        """
+        if self._game is not None and self._game.has_listeners:
+            loser = self._round_loser
+            self._game.emit(
+                (
+                    Event.CHALLENGE,
+                    self._whose_turn.seat,
+                    self._active_bidder.seat,
+                    loser is self._active_bidder,
+                )
+            )
+            self._game.emit((Event.DIE_LOST, loser.seat))
+
+            if loser.dice_left < 1:
+                self._game.emit((Event.ELIMINATION, loser.seat))
 
     @classmethod
     def determine_index_of_next(cls, players, previous_in_turn):
@@ -230,20 +625,22 @@ class Round:
     @staticmethod
     def _return_next(players, loser, whose_turn):
         """
-        Recursive method to loop over the players list continuosly and return the next player whose turn it will be.
+        Loops over the players list continuosly and returns the next player whose turn it will be (skipping the loser).
         Only called when the loser of the previous round has no dice left and can't continue.
         """
-        # Base case
-        index_of_next = Round.determine_index_of_next(players, whose_turn)
-        next = players[index_of_next]
+        index_of_whose_turn = players.index(whose_turn)
 
-        if next != loser:
-            return next
+        for offset in range(1, len(players) + 1):
+            next = players[(index_of_whose_turn + offset) % len(players)]
 
-        # Recursive call
-        return Round._return_next(players, loser, next)
+            if next != loser:
+                return next
 
     def get_count_of_all_active_dice(self):
+        # The game keeps count of the dice (the players of a round are the ones that still have dice)
+        if self._game is not None:
+            return self._game.count_of_all_dice
+
         count_all_active_dice = 0
         for player in self.players:
             count_all_active_dice += player.dice_left
@@ -259,29 +656,79 @@ class Round:
                 "There must be at least 2 players if hands are going to be drawn"
             )
 
-        for player in self.players:
-            player.draw_hand()
+        # Roll all the dice in the round at once, and hand them out to the players
+        players = self.players
+        faces_per_die = self._faces_per_die
+        counts_of_dice = [player.dice_left for player in players]
+        faces = Hand.roll_faces(sum(counts_of_dice), faces_per_die, self._rng)
+
+        start = 0
+        for player, count in zip(players, counts_of_dice):
+            player.draw_hand(faces[start : start + count], faces_per_die)
+            start += count
+
+        self._face_counts = tuple(
+            faces.count(face) for face in range(1, faces_per_die + 1)
+        )
+
+        if self._game is not None and self._game.has_listeners:
+            self._game.emit(
+                (Event.HANDS, tuple((p.seat, p.hand_faces) for p in players))
+            )
 
     def evaluate_challenge(self, active_bid, is_wild_1s):
+        """
+        Returns True if the active_bid was a lie (there are less dice of its face, than its count)
+        """
+        index_of_face = active_bid.die.face - 1
+        count_wild_1s = is_wild_1s and index_of_face != 0
+
+        # If the hands were drawn by draw_hands(), the counts for the whole table are already there
+        face_counts = self._face_counts
+        if face_counts is not None:
+            total_count = face_counts[index_of_face]
+            if count_wild_1s:
+                total_count += face_counts[0]
+
+            return total_count < active_bid.count
+
         total_count = 0
-        if is_wild_1s:
-            for p in self._players:
-                for die in p.hand:
-                    if die.face in [active_bid.die.face, 1]:
-                        total_count += 1
-        else:
-            # Classic rules:
-            for p in self._players:
-                for die in p.hand:
-                    if die.face == active_bid.die.face:
-                        total_count += 1
+        for p in self._players:
+            counts = p.hand_counts
+            total_count += counts[index_of_face]
+
+            if count_wild_1s:
+                total_count += counts[0]
 
         return total_count < active_bid.count
 
+    def set_active_bid_trusted(self, bid, bidder):
+        """
+        Sets the active_bid & active_bidder without the checks in their setters.
+        Only for engine code, where the bid is known to be a legal raise by the player whose turn it is.
+        """
+        self._active_bid = bid
+        self._active_bidder = bidder
+        self._emit_bid()
+
+    def set_round_loser_trusted(self, p):
+        """
+        Sets the round_loser without the checks in its setter.
+        Only for engine code, where the loser is known to be one of the round's players.
+        """
+        if self._round_loser is None:
+            self._round_loser = p
+            self._emit_challenge()
+
     def rotate_turn(self):
-        self._whose_turn = self._players[
-            Round.determine_index_of_next(self.players, self.whose_turn)
-        ]
+        # In a game, the next seat is looked up in the game's ring of seats
+        game = self._game
+        if game is not None and game._next_seat is not None:
+            self._whose_turn = game._players[game._next_seat[self._whose_turn._seat]]
+            return
+
+        index_of_next = self._positions()[self._whose_turn] + 1
+        self._whose_turn = self._players[index_of_next % len(self._players)]
 
     @property
     def number(self):
@@ -302,7 +749,7 @@ class Round:
                 "The 'whose_turn' property of a Round object has to be a Player object"
             )
 
-        if p not in self._players:
+        if p not in self._positions():
             raise ValueError(
                 "The 'whose_turn' property of a Round object has to be a Player object which is included in the list of players in Round.players"
             )
@@ -340,7 +787,7 @@ class Round:
                 "The 'active_bidder' property of a Round object has to be a Player object"
             )
 
-        if p not in self._players:
+        if p not in self._positions():
             raise ValueError(
                 "The 'active_bidder' property of a Round object has to be a Player object which is included in the list of players in Round.players"
             )
@@ -349,6 +796,14 @@ class Round:
             raise ValueError("It can't be same player's bid twice in a row")
 
         self._active_bidder = p
+        self._emit_bid()
+
+    @property
+    def face_counts(self):
+        """
+        A tuple of counts for all the hands in the round (like Hand.counts), or None if they weren't drawn yet
+        """
+        return self._face_counts
 
     @property
     def round_loser(self):
@@ -361,13 +816,14 @@ class Round:
                 "The 'round_loser' property of a Round object has to be a Player object"
             )
 
-        if p not in self._players:
+        if p not in self._positions():
             raise ValueError(
                 "The 'round_loser' property of a Round object has to be a Player object which is included in the list of players in Round.players"
             )
 
         if self._round_loser is None:
             self._round_loser = p
+            self._emit_challenge()
 
 
 class Player:
@@ -380,24 +836,40 @@ class Player:
         if name == "":
             raise ValueError("Each player must have a name")
         self._name = name
+        self._seat = None
+        self._game = None
+
+        self._dice_left = DICE_PER_PLAYER
+        self._hand = Hand(b"")
+
+    def draw_hand(self, faces=None, faces_per_die=None):
+        """
+        Simulates a player rolling their dice (with as many faces as the dice in the player's game have).
+        If the dice were already rolled (by Round.draw_hands()), their faces are passed in as bytes,
+        and aren't checked again.
+        """
+        if faces_per_die is None:
+            faces_per_die = (
+                self._game._faces_per_die if self._game is not None else FACES_PER_DIE
+            )
 
-        self._dice_left = 5
-        self._hand = []
+        if faces is None:
+            faces = Hand.roll_faces(self._dice_left, faces_per_die, self._rng())
 
-    def draw_hand(self):
+        self._hand = Hand.trusted(faces, faces_per_die)
+
+    def _rng(self):
         """
-        Simulates a player rolling their dice
+        Returns the RNG of the player's game (or the random module, if they aren't in a game)
         """
-        self._hand = []
-        for _ in range(self._dice_left):
-            self._hand.append(Die(random.randint(1, 6)))
+        return self._game._rng if self._game is not None else random
 
     def stringify_hand(self):
         """
         Return a string, representing the player's hand.
         """
         if len(self._hand) > 0:
-            return Die.stringify_dice(self.hand)
+            return Die.stringify_faces(self._hand.faces, self._hand.faces_per_die)
         else:
             return None
 
@@ -408,17 +880,60 @@ class Player:
         if self._dice_left > 0:
             self._dice_left -= 1
 
+            if self._game is not None:
+                self._game._count_die_lost(self)
+
+    def reset(self):
+        """
+        Gives the player back all of their dice, so that they can take part in a new game
+        (a game hands out its own number of dice, when the player is added to it)
+        """
+        self._dice_left = DICE_PER_PLAYER
+        self._game = None
+        self._hand = Hand(b"")
+
+    def __getstate__(self):
+        # A pickled player leaves their game behind - it would take its rounds, listeners & rng along
+        # (and the random module, or an open event log, can't be pickled at all)
+        state = self.__dict__.copy()
+        state["_game"] = None
+        return state
+
     @property
     def name(self):
         return self._name
 
+    @property
+    def seat(self):
+        """
+        The index of the player in the list of players of their game (None, until they join a game)
+        """
+        return self._seat
+
     @property
     def dice_left(self):
         return self._dice_left
 
     @property
     def hand(self):
-        return self._hand
+        """
+        The player's hand, as a list of Die objects
+        """
+        return self._hand.to_dice()
+
+    @property
+    def hand_faces(self):
+        """
+        The faces of the player's hand, as a row of bytes (see Hand.faces)
+        """
+        return self._hand.faces
+
+    @property
+    def hand_counts(self):
+        """
+        The face-count vector of the player's hand (see Hand.counts)
+        """
+        return self._hand.counts
 
 
 class Bot(Player):
@@ -426,7 +941,9 @@ class Bot(Player):
     An instance of Bot represents one of the oponents that the user plays against.
     """
     @classmethod
-    def _will_challenge(cls, active_bid, count_all_active_dice):
+    def _will_challenge(
+        cls, active_bid, count_all_active_dice, faces_per_die=FACES_PER_DIE, rng=random
+    ):
         """
         Decide whether to bid or challenge, with bias towards bidding
         """
@@ -434,22 +951,27 @@ class Bot(Player):
         if not isinstance(count_all_active_dice, int):
             raise TypeError("Non-integer for count_all_active_dice")
 
-        if not count_all_active_dice > 2:
-            raise ValueError("count_all_active_dice must be > 2, or the game is over")
+        if not count_all_active_dice >= 2:
+            raise ValueError("count_all_active_dice must be >= 2, or the game is over")
 
         # Decide
         if active_bid is None:
             return False
 
-        if active_bid.die.face == 6 and active_bid.count == count_all_active_dice:
+        if (
+            active_bid.die.face == faces_per_die
+            and active_bid.count == count_all_active_dice
+        ):
             return True
         else:
             # Turns out that random.choices() always returns a list (even if it has 1 element),
             # so the '[0]' part is necessary, in order to get the actual result
-            return (random.choices([True, False], k=1, weights=[20, 80]))[0]
+            return (rng.choices([True, False], k=1, weights=[20, 80]))[0]
 
     @classmethod
-    def _will_raise_by_face(cls, active_bid, count_all_active_dice):
+    def _will_raise_by_face(
+        cls, active_bid, count_all_active_dice, faces_per_die=FACES_PER_DIE, rng=random
+    ):
         """
         Decide whether to raise the active_bid by face.
         If not - will have to raise by count.
@@ -458,20 +980,23 @@ class Bot(Player):
         if not isinstance(count_all_active_dice, int):
             raise TypeError("Non-integer for count_all_active_dice")
 
-        if not count_all_active_dice > 2:
-            raise ValueError("count_all_active_dice must be > 2, or the game is over")
+        if not count_all_active_dice >= 2:
+            raise ValueError("count_all_active_dice must be >= 2, or the game is over")
 
         # Decide
         if active_bid is None:
             return True
-        elif active_bid.die.face < 6 and active_bid.count == count_all_active_dice:
+        elif (
+            active_bid.die.face < faces_per_die
+            and active_bid.count == count_all_active_dice
+        ):
             return True
-        elif active_bid.die.face == 6:
+        elif active_bid.die.face == faces_per_die:
             return False
         else:
             # Turns out that random.choices() always returns a list (even if it has 1 element),
             # so the '[0]' part is necessary, in order to get the actual result
-            return (random.choices([True, False], k=1))[0]
+            return (rng.choices([True, False], k=1))[0]
 
     def play_turn(self, active_bid, count_all_active_dice):
         """
@@ -482,51 +1007,160 @@ class Bot(Player):
         if not isinstance(count_all_active_dice, int):
             raise TypeError("Non-integer for count_all_active_dice")
 
-        if not count_all_active_dice > 2:
-            raise ValueError("count_all_active_dice must be > 2, or the game is over")
+        if not count_all_active_dice >= 2:
+            raise ValueError("count_all_active_dice must be >= 2, or the game is over")
+
+        # The bot's dice have as many faces as all the dice in its game, and it draws from the game's RNG
+        hand = self._hand
+        faces_per_die = hand.faces_per_die
+        rng = self._rng()
 
         # Decide to bid or challenge
-        if Bot._will_challenge(active_bid, count_all_active_dice):
+        if Bot._will_challenge(active_bid, count_all_active_dice, faces_per_die, rng):
             return None
 
         # Formulate bid
-        if Bot._will_raise_by_face(active_bid, count_all_active_dice):
+        if Bot._will_raise_by_face(
+            active_bid, count_all_active_dice, faces_per_die, rng
+        ):
             # Decide by which face to raise
             # Check which face has most occurences in own hand
-            counts_in_hand = Counter([element.face for element in self._hand])
+            most_common_face = hand.most_common_face()
 
             # Check if face with most occurences in own hand suffices
             raised_face = None
 
             if active_bid is None:
-                raised_face = counts_in_hand.most_common(1)[0][0]
-                count_in_bid = counts_in_hand.most_common(1)[0][1]
+                raised_face = most_common_face
+                count_in_bid = hand.counts[most_common_face - 1]
 
                 return Bid(
-                    Die(raised_face), count_in_bid, active_bid, count_all_active_dice
+                    Die(raised_face, faces_per_die),
+                    count_in_bid,
+                    active_bid,
+                    count_all_active_dice,
                 )
             else:
-
-                for i in range(len(counts_in_hand)):
-                    try:
-                        f = counts_in_hand.most_common(i)[0][0]
-                    except IndexError:
-                        pass
-                    else:
-                        if f > active_bid.die.face:
-                            raised_face = f
-                            break
+                # The most common face is only used if the hand shows more than one face
+                count_of_faces = faces_per_die - hand.counts.count(0)
+                if count_of_faces > 1 and most_common_face > active_bid.die.face:
+                    raised_face = most_common_face
 
                 if raised_face is None:
                     raised_face = active_bid.die.face + 1
 
-                return Bid(Die(raised_face), 1, active_bid, count_all_active_dice)
+                return Bid(
+                    Die(raised_face, faces_per_die),
+                    1,
+                    active_bid,
+                    count_all_active_dice,
+                )
         else:
-            raised_count = random.randint(active_bid.count + 1, count_all_active_dice)
+            raised_count = rng.randint(active_bid.count + 1, count_all_active_dice)
 
             return Bid(active_bid.die, raised_count, active_bid, count_all_active_dice)
 
 
+class ProbabilityBot(Bot):
+    """
+    A ProbabilityBot is a bot that decides based on how likely bids are to be true, given its own hand.
+    It challenges bids that are less likely than challenge_threshold, and otherwise makes
+    the legal bid that is most likely to be true.
+    It plays by the rules of its game - wild_1s is only used when the bot isn't in a game.
+    """
+    def __init__(self, name, wild_1s=False, challenge_threshold=0.5):
+        super().__init__(name)
+
+        if not isinstance(wild_1s, bool):
+            raise TypeError(
+                "The 'wild_1s' property of a ProbabilityBot has to be Boolean"
+            )
+        self._wild_1s = wild_1s
+
+        if not isinstance(challenge_threshold, (int, float)):
+            raise TypeError("The challenge_threshold has to be a number")
+
+        if not 1 >= challenge_threshold >= 0:
+            raise ValueError("The challenge_threshold has to be between 0 and 1")
+        self._challenge_threshold = challenge_threshold
+
+    def play_turn(self, active_bid, count_all_active_dice):
+        """
+        Represents the bot playing their turn.
+        Returns either a Bid object, or None (which means a challenge to the previous player's bid)
+        """
+        # Check args
+        if not isinstance(count_all_active_dice, int):
+            raise TypeError("Non-integer for count_all_active_dice")
+
+        if not count_all_active_dice >= 2:
+            raise ValueError("count_all_active_dice must be >= 2, or the game is over")
+
+        hand_counts = self.hand_counts
+        faces_per_die = len(hand_counts)
+        count_of_unknown_dice = count_all_active_dice - len(self._hand)
+        wild_1s = self.wild_1s
+
+        # Decide to bid or challenge
+        if active_bid is not None:
+            p = probability_of_bid(
+                active_bid.die.face,
+                active_bid.count,
+                hand_counts,
+                count_of_unknown_dice,
+                wild_1s,
+                faces_per_die,
+            )
+            if p < self._challenge_threshold:
+                return None
+
+        # Find the lowest legal bid for each face, and pick the one most likely to be true
+        # (or, out of equally likely ones, the one on the face the bot has most of)
+        best_bid = None
+        best_p = -1
+
+        # Faces below the active bid's can't be bid on
+        first_face = 1 if active_bid is None else active_bid.die.face
+
+        for face in range(first_face, faces_per_die + 1):
+            if active_bid is None or face > first_face:
+                count = 1
+            else:
+                count = active_bid.count + 1
+
+            if count > count_all_active_dice:
+                continue
+
+            p = probability_of_bid(
+                face,
+                count,
+                hand_counts,
+                count_of_unknown_dice,
+                wild_1s,
+                faces_per_die,
+            )
+            if p > best_p or (
+                p == best_p and hand_counts[face - 1] > hand_counts[best_face - 1]
+            ):
+                best_bid = Bid.trusted(face, count)
+                best_face = face
+                best_p = p
+
+        # If there is no way to raise the bid, best_bid is None (i.e. a challenge)
+        return best_bid
+
+    @property
+    def wild_1s(self):
+        """
+        Whether 1s are wild - by the rules of the bot's game, or else by the bot's own wild_1s
+        """
+        return self._game.wild_1s if self._game is not None else self._wild_1s
+
+    @property
+    def challenge_threshold(self):
+        return self._challenge_threshold
+
+
 class Human(Player):
     """
     A sub class of Player that represents the user.
@@ -535,20 +1169,99 @@ class Human(Player):
     pass
 
 
+# A compact record of a finished round, kept by a Game with history=HISTORY_SUMMARIES:
+# - number: the number of the round;
+# - loser: the seat of the loser of the round;
+# - final_bid: the active bid when the challenge was made (a Bid);
+# - dice_left: a tuple with the dice left to each seat at the end of the round.
+RoundSummary = namedtuple("RoundSummary", ["number", "loser", "final_bid", "dice_left"])
+
+# The retention policies for the rounds of a Game (besides these, history can be an int K - keep the last K rounds)
+HISTORY_ALL = "all"
+HISTORY_SUMMARIES = "summaries"
+
+
 class Game:
     """
     An instance a of Game represents a game of "Liar's dice".
+
+    history decides which rounds the game keeps in Game.rounds:
+    - HISTORY_ALL (the default) - all of them;
+    - an int K - only the last K rounds;
+    - HISTORY_SUMMARIES - only the current round, plus a RoundSummary of each finished round (in Game.summaries).
+
+    The size of the table can be changed from the standard one - up to max_players players,
+    with dice_per_player dice each, which have faces_per_die faces.
+
+    All the dice rolls & the bots' decisions in the game are drawn from its rng - a random.Random.
+    Passing a seeded one (e.g. random.Random(42)) makes the game reproducible, and keeps it apart
+    from other games (e.g. in other threads). By default, the game uses the random module itself.
     """
-    def __init__(self, wild_1s):
+    def __init__(
+        self,
+        wild_1s,
+        history=HISTORY_ALL,
+        max_players=MAX_PLAYERS,
+        dice_per_player=DICE_PER_PLAYER,
+        faces_per_die=FACES_PER_DIE,
+        rng=None,
+    ):
         if not isinstance(wild_1s, bool):
             raise TypeError(
                 "The 'wild_1s' property of a Game instance has to be Boolean"
             )
         self._wild_1s = wild_1s
 
+        for size in (max_players, dice_per_player, faces_per_die):
+            if not isinstance(size, int):
+                raise TypeError("The sizes of the table of a Game have to be integers")
+
+        if max_players < 2 or dice_per_player < 1:
+            raise ValueError("A game needs at least 2 players, with at least 1 die")
+
+        if not Die.MAX_FACES >= faces_per_die >= 2:
+            raise ValueError(f"A die has to have between 2 and {Die.MAX_FACES} faces")
+
+        if max_players * dice_per_player > Bid.MAX_COUNT:
+            raise ValueError(f"There can't be more than {Bid.MAX_COUNT} dice in a game")
+
+        self._max_players = max_players
+        self._dice_per_player = dice_per_player
+        self._faces_per_die = faces_per_die
+
+        if rng is None:
+            rng = random
+        elif not isinstance(rng, random.Random):
+            raise TypeError("The rng of a Game has to be a random.Random object")
+        self._rng = rng
+
+        self._summaries = None
+        if history == HISTORY_ALL:
+            self._rounds = []
+        elif history == HISTORY_SUMMARIES:
+            self._rounds = deque(maxlen=1)
+            self._summaries = []
+        elif isinstance(history, int) and not isinstance(history, bool):
+            if history < 1:
+                raise ValueError("A game has to keep at least its last round")
+            self._rounds = deque(maxlen=history)
+        else:
+            raise ValueError(
+                f"The history of a Game has to be '{HISTORY_ALL}', '{HISTORY_SUMMARIES}', or a number of rounds"
+            )
+
         self._players = None
-        self._rounds = []
         self._winner = None
+        self._listeners = []
+
+        # Kept up to date by Player.lose_a_die() (see ._count_die_lost())
+        self._count_of_all_dice = None
+        self._count_players_with_dice = None
+
+        # A ring of the seats of the players with dice left - _next_seat[seat] & _prev_seat[seat] are the seats
+        # next to each seat. A player who runs out of dice is unlinked, but their own _next_seat is kept.
+        self._next_seat = None
+        self._prev_seat = None
 
     def __str__(self):
         if len(self._players) == 0 or len(self._rounds) == 0:
@@ -576,7 +1289,7 @@ class Game:
         # Determine turn
         whose_turn = players_in_round[0]
 
-        return Round(round_number, players_in_round, whose_turn)
+        return Round.trusted(round_number, players_in_round, whose_turn, self)
 
     def _get_n_th_round(self):
         """
@@ -598,13 +1311,20 @@ class Game:
             )
 
         # Determine turn
-        whose_turn = Round.determine_whose_turn_at_next_round(
-            previous_round.players,
-            previous_round.round_loser,
-            previous_round.whose_turn,
-        )
+        if self._next_seat is None:
+            whose_turn = Round.determine_whose_turn_at_next_round(
+                previous_round.players,
+                previous_round.round_loser,
+                previous_round.whose_turn,
+            )
+        elif previous_round.round_loser.dice_left > 0:
+            whose_turn = previous_round.round_loser
+        else:
+            # The loser is already unlinked from the ring, so the seat after the last player in turn is the next one
+            # (even if the loser was the last player in turn)
+            whose_turn = self._players[self._next_seat[previous_round.whose_turn.seat]]
 
-        return Round(round_number, players_in_round, whose_turn)
+        return Round.trusted(round_number, players_in_round, whose_turn, self)
 
     def add_round(self):
         """
@@ -616,10 +1336,81 @@ class Game:
             next_round = self._get_n_th_round()
 
         if isinstance(next_round, Round):
+            if self._summaries is not None and len(self._rounds) > 0:
+                self._summaries.append(self._summarize(self._rounds[-1]))
+
             self._rounds.append(next_round)
+
+            if self._listeners:
+                if next_round.number == 1:
+                    self.emit(
+                        (
+                            Event.GAME_START,
+                            len(self.players),
+                            self.wild_1s,
+                            self._dice_per_player,
+                            self._faces_per_die,
+                        )
+                    )
+                self.emit(
+                    (Event.ROUND_START, next_round.number, next_round.whose_turn.seat)
+                )
+
             return next_round
 
+    def _summarize(self, round):
+        """
+        Returns the RoundSummary of a finished round
+        """
+        return RoundSummary(
+            round.number,
+            round.round_loser.seat,
+            round.active_bid,
+            tuple(p.dice_left for p in self._players),
+        )
+
+    def add_listener(self, listener):
+        """
+        Adds a listener - a callable that gets each event of the game (see Event), as it happens.
+        """
+        if not callable(listener):
+            raise TypeError("A listener has to be callable")
+
+        self._listeners.append(listener)
+
+    def emit(self, event):
+        """
+        Passes an event to all the listeners of the game
+        """
+        for listener in self._listeners:
+            listener(event)
+
+    def _count_die_lost(self, player):
+        """
+        Updates the counts of dice & players with dice, after a player (of this game) has lost a die
+        """
+        self._count_of_all_dice -= 1
+
+        if player._dice_left < 1:
+            self._count_players_with_dice -= 1
+
+            # Unlink the player from the ring of seats
+            seat = player._seat
+            prev_seat = self._prev_seat[seat]
+            next_seat = self._next_seat[seat]
+            self._next_seat[prev_seat] = next_seat
+            self._prev_seat[next_seat] = prev_seat
+
     def count_players_with_remaining_dice(self):
+        if self._players is None:
+            raise TypeError("The game has no players yet")
+
+        return self._count_players_with_dice
+
+    def _scan_players_with_remaining_dice(self):
+        """
+        Helper to the winner setter. Counts the players with dice, without relying on the kept count.
+        """
         count = 0
         for player in self._players:
             if player.dice_left > 0:
@@ -631,6 +1422,22 @@ class Game:
     def wild_1s(self):
         return self._wild_1s
 
+    @property
+    def rng(self):
+        return self._rng
+
+    @property
+    def max_players(self):
+        return self._max_players
+
+    @property
+    def dice_per_player(self):
+        return self._dice_per_player
+
+    @property
+    def faces_per_die(self):
+        return self._faces_per_die
+
     @property
     def players(self):
         return self._players
@@ -643,11 +1450,34 @@ class Game:
                     "The 'players' property of a Game object has to be a list of Player objects"
                 )
 
-        if not 5 >= len(players) >= 2:
-            raise ValueError("A game can't have less than 2, and more than 5 players")
+        if not self._max_players >= len(players) >= 2:
+            raise ValueError(
+                f"A game can't have less than 2, and more than {self._max_players} players"
+            )
 
         if self._players is None:
             self._players = players
+
+            self._count_of_all_dice = 0
+            self._count_players_with_dice = 0
+            seats_with_dice = []
+            for seat, p in enumerate(players):
+                p._seat = seat
+                p._game = self
+                # Everyone starts the game with the table's dice_per_player, whatever
+                # they had left (e.g. after a previous game)
+                p._dice_left = self._dice_per_player
+
+                self._count_of_all_dice += p.dice_left
+                if p.dice_left > 0:
+                    self._count_players_with_dice += 1
+                    seats_with_dice.append(seat)
+
+            self._next_seat = [None] * len(players)
+            self._prev_seat = [None] * len(players)
+            for i, seat in enumerate(seats_with_dice):
+                self._next_seat[seat] = seats_with_dice[(i + 1) % len(seats_with_dice)]
+                self._prev_seat[seat] = seats_with_dice[i - 1]
         else:
             raise Exception(
                 "The players list can only be added once, at the start of the game"
@@ -657,6 +1487,33 @@ class Game:
     def rounds(self):
         return self._rounds
 
+    @property
+    def summaries(self):
+        """
+        The RoundSummary of each finished round (only kept with history=HISTORY_SUMMARIES, otherwise None)
+        """
+        return self._summaries
+
+    @property
+    def count_of_all_dice(self):
+        """
+        The number of dice all players have left
+        """
+        return self._count_of_all_dice
+
+    @property
+    def count_of_rounds(self):
+        """
+        The number of rounds played so far (including those no longer kept in Game.rounds)
+        """
+        if len(self._rounds) == 0:
+            return 0
+        return self._rounds[-1].number
+
+    @property
+    def has_listeners(self):
+        return len(self._listeners) > 0
+
     @property
     def winner(self):
         return self._winner
@@ -673,7 +1530,7 @@ class Game:
                 "The 'winner' property of a Game object has to be a Player object included in the list in Game.players"
             )
 
-        players_with_remaining_dice = self.count_players_with_remaining_dice()
+        players_with_remaining_dice = self._scan_players_with_remaining_dice()
 
         if players_with_remaining_dice > 1:
             raise Exception(
@@ -691,3 +1548,9 @@ class Game:
 
         if self._winner is None:
             self._winner = p
+
+            if self._summaries is not None and len(self._rounds) > 0:
+                self._summaries.append(self._summarize(self._rounds[-1]))
+
+            if self._listeners:
+                self.emit((Event.WINNER, p.seat))
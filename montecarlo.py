@@ -0,0 +1,272 @@
+import time
+
+import numpy as np
+
+from liarsdice import Bid, Bot, Event
+
+# Sample the opponents' hands in batches of this many
+DEFAULT_BATCH_SIZE = 256
+
+
+class MonteCarloBot(Bot):
+    """
+    A MonteCarloBot decides by sampling the hands the opponents might have, given what it has seen in the round.
+
+    Each opponent's hand is rolled at random, and weighted by how well it backs the bids the opponent has made
+    (a hand with k dice counting towards a bid's face makes it 1 + trust * k times as likely).
+    The bids are then evaluated on each sample with the same rule as Round.evaluate_challenge():
+    the bot challenges the active bid if it's true in less than challenge_threshold of the samples,
+    and otherwise makes the legal bid that's true in most of them.
+
+    Sampling goes in batches of batch_size, until the bot has taken samples, or its time_budget (in seconds)
+    runs out - so a turn takes at most about time_budget, plus a batch.
+    The bot follows the bids of its game's rounds as a listener (see Game.add_listener()), from its first turn on,
+    and plays by the rules of its game (wild_1s is only used when the bot isn't in a game).
+    """
+    def __init__(
+        self,
+        name,
+        wild_1s=False,
+        challenge_threshold=0.5,
+        samples=1024,
+        time_budget=None,
+        trust=1.0,
+        batch_size=DEFAULT_BATCH_SIZE,
+    ):
+        super().__init__(name)
+
+        if not isinstance(wild_1s, bool):
+            raise TypeError(
+                "The 'wild_1s' property of a MonteCarloBot has to be Boolean"
+            )
+
+        for arg in (challenge_threshold, trust):
+            if not isinstance(arg, (int, float)):
+                raise TypeError("The challenge_threshold & trust have to be numbers")
+
+        if not 1 >= challenge_threshold >= 0 or trust < 0:
+            raise ValueError(
+                "The challenge_threshold has to be between 0 and 1, and the trust >= 0"
+            )
+
+        if not isinstance(samples, int) or not isinstance(batch_size, int):
+            raise TypeError("Non-integer samples or batch_size")
+
+        if samples < 1 or batch_size < 1:
+            raise ValueError("samples and batch_size must be > 0")
+
+        if time_budget is not None:
+            if not isinstance(time_budget, (int, float)):
+                raise TypeError("The time_budget has to be a number of seconds")
+
+            if time_budget <= 0:
+                raise ValueError("The time_budget has to be > 0")
+
+        self._wild_1s = wild_1s
+        self._challenge_threshold = challenge_threshold
+        self._samples = samples
+        self._time_budget = time_budget
+        self._trust = trust
+        self._batch_size = batch_size
+
+        # The bids of the current round, as (seat, face, count), in the game the bot follows
+        self._followed_game = None
+        self._bids = []
+
+        self._samples_taken = 0
+
+    def __getstate__(self):
+        # Like a player's game, the followed game isn't pickled
+        state = super().__getstate__()
+        state["_followed_game"] = None
+        state["_bids"] = []
+        return state
+
+    def observe(self, event):
+        """
+        Keeps track of the bids of the current round (the bot is a listener of its game)
+        """
+        if event[0] == Event.BID:
+            self._bids.append(event[1:])
+        elif event[0] == Event.ROUND_START or event[0] == Event.GAME_START:
+            self._bids.clear()
+
+    def _history(self, active_bid):
+        """
+        Returns the bids of the round that the bot knows the bidders of, as (seat, face, count)
+        """
+        game = self._game
+        if game is None:
+            return []
+
+        if self._followed_game is not game:
+            game.add_listener(self.observe)
+            self._followed_game = game
+            self._bids = []
+
+        # The bids before the bot's first turn in a game were missed, but the active one is known
+        if active_bid is not None and (
+            not self._bids
+            or self._bids[-1][1:] != (active_bid.die.face, active_bid.count)
+        ):
+            bidder = game.rounds[-1].active_bidder
+            self._bids.append((bidder.seat, active_bid.die.face, active_bid.count))
+
+        return self._bids
+
+    def play_turn(self, active_bid, count_all_active_dice):
+        """
+        Represents the bot playing their turn.
+        Returns either a Bid object, or None (which means a challenge to the previous player's bid)
+        """
+        # Check args
+        if not isinstance(count_all_active_dice, int):
+            raise TypeError("Non-integer for count_all_active_dice")
+
+        if not count_all_active_dice >= 2:
+            raise ValueError("count_all_active_dice must be >= 2, or the game is over")
+
+        hand_counts = np.array(self.hand_counts)
+        faces_per_die = len(hand_counts)
+
+        # The candidates - the active bid, and the lowest legal bid on each face from there on
+        if active_bid is None:
+            first_face, count_on_first_face = 1, 1
+        else:
+            first_face, count_on_first_face = active_bid.die.face, active_bid.count + 1
+
+        faces = np.arange(first_face, faces_per_die + 1)
+        counts = np.where(faces == first_face, count_on_first_face, 1)
+        legal = counts <= count_all_active_dice
+        faces, counts = faces[legal], counts[legal]
+
+        if active_bid is not None:
+            faces = np.concatenate([[active_bid.die.face], faces])
+            counts = np.concatenate([[active_bid.count], counts])
+
+        p = self._probabilities(
+            faces,
+            counts,
+            hand_counts,
+            count_all_active_dice,
+            self._history(active_bid),
+        )
+
+        # Decide to bid or challenge
+        if active_bid is not None:
+            if p[0] < self._challenge_threshold or len(p) == 1:
+                return None
+            faces, counts, p = faces[1:], counts[1:], p[1:]
+
+        # The bid most likely to be true (out of equally likely ones - on the face the bot has most of)
+        best = np.flatnonzero(p == p.max())
+        face = faces[best[np.argmax(hand_counts[faces[best] - 1])]]
+        count = counts[faces == face][0]
+
+        return Bid.trusted(int(face), int(count))
+
+    def _opponents(self, count_all_active_dice):
+        """
+        Returns the seats & counts of dice of the opponents with dice left
+        (or a single opponent with all the other dice, for a bot outside of a game)
+        """
+        game = self._game
+        if game is None:
+            return [None], [count_all_active_dice - self.dice_left]
+
+        seats, dice = [], []
+        for p in game.players:
+            if p is not self and p.dice_left > 0:
+                seats.append(p.seat)
+                dice.append(p.dice_left)
+
+        return seats, dice
+
+    def _probabilities(self, faces, counts, hand_counts, count_all_active_dice, bids):
+        """
+        Returns the share of the (weighted) samples of the opponents' hands, in which each bid (face, count) is true
+        """
+        faces_per_die = len(hand_counts)
+        wild_1s = self.wild_1s
+        seats, dice = self._opponents(count_all_active_dice)
+        rng = np.random.default_rng(self._rng().getrandbits(64))
+
+        # Each sample's dice are rolled at once, and counted per opponent
+        starts = np.concatenate([[0], np.cumsum(dice)[:-1]])
+        count_of_dice = sum(dice)
+        seat_index = {seat: i for i, seat in enumerate(seats)}
+
+        # Only the last bid of each opponent is taken into account
+        last_bids = {}
+        for seat, face, count in bids:
+            if seat in seat_index:
+                last_bids[seat] = (seat, face, count)
+        bids = list(last_bids.values())
+
+        wild = wild_1s & (faces != 1)
+        weights_sum = 0.0
+        true_sums = np.zeros(len(faces))
+        samples_taken = 0
+
+        start_time = time.perf_counter()
+        while True:
+            rolled = rng.integers(
+                0, faces_per_die, size=(self._batch_size, count_of_dice)
+            )
+            one_hot = rolled[..., None] == np.arange(faces_per_die)
+            opponent_counts = np.add.reduceat(one_hot, starts, axis=1, dtype=np.int64)
+
+            weights = np.ones(self._batch_size)
+            for seat, face, _ in bids:
+                backing = opponent_counts[:, seat_index[seat], face - 1]
+                if wild_1s and face != 1:
+                    backing = backing + opponent_counts[:, seat_index[seat], 0]
+                weights *= 1 + self._trust * backing
+
+            totals = opponent_counts.sum(axis=1) + hand_counts
+            totals_of_bids = totals[:, faces - 1] + np.where(wild, totals[:, :1], 0)
+
+            weights_sum += weights.sum()
+            true_sums += weights @ (totals_of_bids >= counts)
+            samples_taken += self._batch_size
+
+            if samples_taken >= self._samples:
+                break
+            if (
+                self._time_budget is not None
+                and time.perf_counter() - start_time >= self._time_budget
+            ):
+                break
+
+        self._samples_taken = samples_taken
+        return true_sums / weights_sum
+
+    @property
+    def wild_1s(self):
+        """
+        Whether 1s are wild - by the rules of the bot's game, or else by the bot's own wild_1s
+        """
+        return self._game.wild_1s if self._game is not None else self._wild_1s
+
+    @property
+    def challenge_threshold(self):
+        return self._challenge_threshold
+
+    @property
+    def samples(self):
+        return self._samples
+
+    @property
+    def time_budget(self):
+        return self._time_budget
+
+    @property
+    def trust(self):
+        return self._trust
+
+    @property
+    def samples_taken(self):
+        """
+        The number of samples taken on the bot's last turn
+        """
+        return self._samples_taken
@@ -0,0 +1,371 @@
+import os
+import struct
+
+import numpy as np
+
+from cfr import hand_histograms
+from liarsdice import DICE_PER_PLAYER, FACES_PER_DIE, MAX_PLAYERS, Bid, Bot
+from strategy import CHALLENGE, NO_BID, Strategy, TurnStates
+
+# A policy table holds the decision of a strategy for every turn a player can see, so a bot can
+# look its turn up with a single array index. A table file is a small header:
+#   [magic][version][dice_per_player][faces_per_die][max_dice_in_play]
+# (unsigned 16-bit integers after the magic), followed by a dense little-endian int16 array, indexed by
+#   [dice in play][hand id][active bid]
+# - hand id: the index of the hand's histogram among the hands with 1 to dice_per_player dice
+#   (in the order of cfr.hand_histograms(), from 1 die up);
+# - active bid: 0 for no bid, and 1 + (face - 1) * max_dice_in_play + (count - 1) for a bid.
+# The entries are actions in the same encoding, with 0 for a challenge (and NO_ENTRY for turns that can't happen).
+# Tables are memory-mapped (read-only), and only when they're first used, so processes that use the same table
+# share a single copy of it in the page cache.
+
+MAGIC = b"LDPT"
+VERSION = 1
+NO_ENTRY = -1
+
+_HEADER = struct.Struct("<4sHHHH")
+_DTYPE = np.dtype("<i2")
+
+# The number of turns to decide at once, while compiling a table
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _table_shape(count_of_hands, faces_per_die, max_dice_in_play):
+    """
+    Returns the shape of a table's array: [dice in play][hand id][active bid]
+    """
+    return (max_dice_in_play + 1, count_of_hands, 1 + max_dice_in_play * faces_per_die)
+
+
+def _all_hands(dice_per_player, faces_per_die):
+    """
+    Returns the histograms of all the hands with 1 to dice_per_player dice, in the order of their ids
+    """
+    return np.concatenate(
+        [
+            hand_histograms(count_of_dice, faces_per_die)[0]
+            for count_of_dice in range(1, dice_per_player + 1)
+        ]
+    )
+
+
+class PolicyTable:
+    """
+    A PolicyTable gives access to a table file, written by compile_policy().
+    Only the header is read (and the file size checked) when it's created - the table itself is memory-mapped
+    on its first lookup.
+    """
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+
+        if len(header) < _HEADER.size:
+            raise ValueError("The file is too short to be a policy table")
+
+        magic, version, dice_per_player, faces_per_die, max_dice_in_play = (
+            _HEADER.unpack(header)
+        )
+
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(
+                "The file isn't a policy table (or has an unknown version)"
+            )
+
+        self._path = path
+        self._dice_per_player = dice_per_player
+        self._faces_per_die = faces_per_die
+        self._max_dice_in_play = max_dice_in_play
+        self._table = None
+
+        # The ids of the hands are looked up by their histograms - as a tuple (see Hand.counts),
+        # or as a number in base dice_per_player + 1 (for arrays of histograms)
+        hands = _all_hands(dice_per_player, faces_per_die)
+        self._hand_ids = {tuple(h): i for i, h in enumerate(hands.tolist())}
+        self._weights = (dice_per_player + 1) ** np.arange(faces_per_die)
+        self._hand_id_array = np.full(
+            (dice_per_player + 1) ** faces_per_die, NO_ENTRY, dtype=np.int64
+        )
+        self._hand_id_array[hands @ self._weights] = np.arange(len(hands))
+
+        self._shape = _table_shape(len(hands), faces_per_die, max_dice_in_play)
+
+        # A truncated (or padded) file would be mapped with the wrong entries
+        size = _HEADER.size + _DTYPE.itemsize * int(np.prod(self._shape))
+        if os.path.getsize(path) != size:
+            raise ValueError(
+                "The size of the policy table file doesn't match its header"
+            )
+
+    def _map(self):
+        """
+        Memory-maps the table (once)
+        """
+        if self._table is None:
+            self._table = np.memmap(
+                self._path,
+                dtype=_DTYPE,
+                mode="r",
+                offset=_HEADER.size,
+                shape=self._shape,
+            )
+
+        return self._table
+
+    def hand_id(self, hand_counts):
+        """
+        Returns the id of a hand, by its histogram (see Hand.counts)
+        """
+        hand_id = self._hand_ids.get(tuple(hand_counts))
+        if hand_id is None:
+            raise ValueError("There is no such hand in the policy table")
+
+        return hand_id
+
+    def bid_index(self, bid):
+        """
+        Returns the index of an active bid (or None) in the table
+        """
+        if bid is None:
+            return 0
+
+        if bid.die.face > self._faces_per_die or bid.count > self._max_dice_in_play:
+            raise ValueError("The policy table has no entries for the bid")
+
+        return 1 + (bid.die.face - 1) * self._max_dice_in_play + (bid.count - 1)
+
+    def lookup(self, hand_counts, active_bid, count_all_active_dice):
+        """
+        Looks up a turn in the table. Returns either a Bid object, or None (a challenge).
+        """
+        if not 2 <= count_all_active_dice <= self._max_dice_in_play:
+            raise ValueError("The policy table has no entries for so many dice in play")
+
+        action = int(
+            self._map()[
+                count_all_active_dice,
+                self.hand_id(hand_counts),
+                self.bid_index(active_bid),
+            ]
+        )
+
+        if action == NO_ENTRY:
+            raise ValueError("The policy table has no entry for the turn")
+
+        if action == 0:
+            return None
+
+        face, count = divmod(action - 1, self._max_dice_in_play)
+        return Bid.trusted(face + 1, count + 1)
+
+    def lookup_batch(self, states):
+        """
+        Looks up a batch of TurnStates (see strategy.py), and returns an array of actions
+        """
+        hand_counts, bid_ranks, dice_in_play = states
+
+        # Check args (out-of-range values would index other entries, instead of failing)
+        if hand_counts.shape[1:] != (self._faces_per_die,):
+            raise ValueError(
+                f"The policy table is for hands of dice with {self._faces_per_die} faces"
+            )
+
+        if ((hand_counts < 0) | (hand_counts > self._dice_per_player)).any():
+            raise ValueError("There are hands that aren't in the policy table")
+
+        if ((dice_in_play < 2) | (dice_in_play > self._max_dice_in_play)).any():
+            raise ValueError("The policy table has no entries for so many dice in play")
+
+        faces, counts = np.divmod(bid_ranks, Bid.MAX_COUNT)
+        if (
+            (bid_ranks != NO_BID)
+            & (
+                (bid_ranks < 0)
+                | (faces >= self._faces_per_die)
+                | (counts >= self._max_dice_in_play)
+            )
+        ).any():
+            raise ValueError("The policy table has no entries for some of the bids")
+
+        hand_ids = self._hand_id_array[hand_counts @ self._weights]
+        if (hand_ids == NO_ENTRY).any():
+            raise ValueError("There are hands that aren't in the policy table")
+
+        bids = np.where(
+            bid_ranks == NO_BID, 0, 1 + faces * self._max_dice_in_play + counts
+        )
+
+        entries = self._map()[dice_in_play, hand_ids, bids].astype(np.int64)
+        if (entries == NO_ENTRY).any():
+            raise ValueError("The policy table has no entry for some of the turns")
+
+        faces, counts = np.divmod(entries - 1, self._max_dice_in_play)
+        return np.where(entries == 0, CHALLENGE, faces * Bid.MAX_COUNT + counts)
+
+    def close(self):
+        """
+        Drops the memory-mapped table (it's mapped again on the next lookup)
+        """
+        self._table = None
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def dice_per_player(self):
+        return self._dice_per_player
+
+    @property
+    def faces_per_die(self):
+        return self._faces_per_die
+
+    @property
+    def max_dice_in_play(self):
+        return self._max_dice_in_play
+
+    @property
+    def mapped(self):
+        return self._table is not None
+
+
+def compile_policy(
+    strategy,
+    path,
+    dice_per_player=DICE_PER_PLAYER,
+    max_players=MAX_PLAYERS,
+    faces_per_die=FACES_PER_DIE,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    rng=None,
+):
+    """
+    Writes a policy table with the decisions of a Strategy for every turn in games with up to max_players,
+    with dice_per_player & faces_per_die, and returns its PolicyTable.
+    A strategy that decides at random is sampled once for each turn, from rng (or else from its own rng).
+    """
+    if not isinstance(strategy, Strategy):
+        raise TypeError("A policy table can only be compiled from a Strategy")
+
+    for arg in (dice_per_player, max_players, faces_per_die, chunk_size):
+        if not isinstance(arg, int):
+            raise TypeError(
+                "Non-integer dice_per_player, max_players, faces_per_die or chunk_size"
+            )
+
+    if dice_per_player < 1 or max_players < 2 or faces_per_die < 2 or chunk_size < 1:
+        raise ValueError(
+            "A policy table needs at least 1 die per player, 2 players & 2 faces per die"
+        )
+
+    max_dice_in_play = dice_per_player * max_players
+    if 1 + max_dice_in_play * faces_per_die > np.iinfo(_DTYPE).max:
+        raise ValueError("The table would have too many bids for its entries")
+
+    hands = _all_hands(dice_per_player, faces_per_die)
+    shape = _table_shape(len(hands), faces_per_die, max_dice_in_play)
+
+    with open(path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                MAGIC, VERSION, dice_per_player, faces_per_die, max_dice_in_play
+            )
+        )
+        f.truncate(_HEADER.size + _DTYPE.itemsize * int(np.prod(shape)))
+
+    entries = np.memmap(path, dtype=_DTYPE, mode="r+", offset=_HEADER.size, shape=shape)
+    entries[:] = NO_ENTRY
+
+    # All the turns that can happen: each hand, with each count of dice in play (the others have at least
+    # 1 die each), and each active bid (with a count up to the dice in play)
+    sizes = hands.sum(axis=1)
+    hand_ids = np.arange(len(hands))
+
+    for count_all_active_dice in range(2, max_dice_in_play + 1):
+        possible = (sizes < count_all_active_dice) & (
+            count_all_active_dice - sizes <= dice_per_player * (max_players - 1)
+        )
+
+        faces, counts = np.divmod(
+            np.arange(faces_per_die * count_all_active_dice), count_all_active_dice
+        )
+        bid_ranks = np.concatenate([[NO_BID], faces * Bid.MAX_COUNT + counts])
+        bids = np.concatenate([[0], 1 + faces * max_dice_in_play + counts])
+
+        turns = np.stack(
+            np.meshgrid(hand_ids[possible], np.arange(len(bids)), indexing="ij"),
+            axis=-1,
+        ).reshape(-1, 2)
+
+        for start in range(0, len(turns), chunk_size):
+            chunk = turns[start : start + chunk_size]
+            states = TurnStates(
+                hands[chunk[:, 0]],
+                bid_ranks[chunk[:, 1]],
+                np.full(len(chunk), count_all_active_dice, dtype=np.int64),
+            )
+            actions = np.asarray(strategy.decide_batch(states, rng))
+
+            faces_of_actions, counts_of_actions = np.divmod(actions, Bid.MAX_COUNT)
+            entries[count_all_active_dice, chunk[:, 0], bids[chunk[:, 1]]] = np.where(
+                actions == CHALLENGE,
+                0,
+                1 + faces_of_actions * max_dice_in_play + counts_of_actions,
+            )
+
+    entries.flush()
+    del entries
+
+    return PolicyTable(path)
+
+
+class PolicyStrategy(Strategy):
+    """
+    Plays the decisions of a PolicyTable - each batch of turns is looked up with a single (fancy) index
+    """
+    def __init__(self, table):
+        if not isinstance(table, PolicyTable):
+            raise TypeError("A PolicyStrategy expects a PolicyTable")
+
+        self._table = table
+
+    def decide_batch(self, states, rng=None):
+        return self._table.lookup_batch(states)
+
+    @property
+    def table(self):
+        return self._table
+
+
+class PolicyBot(Bot):
+    """
+    A PolicyBot is a bot that looks its turns up in a PolicyTable (e.g. one that's shared by many bots & processes)
+    """
+    def __init__(self, name, table):
+        super().__init__(name)
+
+        if isinstance(table, (str, os.PathLike)):
+            table = PolicyTable(table)
+
+        if not isinstance(table, PolicyTable):
+            raise TypeError(
+                "The table of a PolicyBot has to be a PolicyTable, or its path"
+            )
+
+        self._table = table
+
+    def play_turn(self, active_bid, count_all_active_dice):
+        """
+        Represents the bot playing their turn.
+        Returns either a Bid object, or None (which means a challenge to the previous player's bid)
+        """
+        # Check args
+        if not isinstance(count_all_active_dice, int):
+            raise TypeError("Non-integer for count_all_active_dice")
+
+        if not count_all_active_dice >= 2:
+            raise ValueError("count_all_active_dice must be >= 2, or the game is over")
+
+        return self._table.lookup(self.hand_counts, active_bid, count_all_active_dice)
+
+    @property
+    def table(self):
+        return self._table
@@ -0,0 +1,118 @@
+from functools import lru_cache
+from math import exp, lgamma, log, log1p
+
+# The most dice that can be in play at a standard table (5 players x 5 dice).
+# The tables go up to MAX_DICE, and the rows for more dice are only built (one by one) when they're needed.
+MAX_DICE = 25
+
+# The most rows for more than MAX_DICE dice that are kept at once (a row for n dice holds n + 2 floats)
+MAX_CACHED_ROWS = 128
+
+# The number of faces of a standard die
+FACES_PER_DIE = 6
+
+# The chance of a single unknown die matching a bid's face,
+# under classic rules (or for a bid on 1s), and with 'wild' ones
+P_FACE = 1 / FACES_PER_DIE
+P_FACE_OR_WILD = 2 / FACES_PER_DIE
+
+# The binomial tail tables that are currently in use, by p
+_tail_tables = {}
+
+
+def _binomial_terms(n, p):
+    """
+    Helper to binomial_tail_row(). Returns the probabilities of exactly k out of n dice matching, for 0 <= k <= n.
+    Each one is computed in log space, since comb(n, k) is too large for a float once n is above about 1000.
+    """
+    if p >= 1:
+        return [0.0] * n + [1.0]
+    if p <= 0:
+        return [1.0] + [0.0] * n
+
+    log_p, log_q, log_n_factorial = log(p), log1p(-p), lgamma(n + 1)
+    return [
+        exp(
+            log_n_factorial
+            - lgamma(k + 1)
+            - lgamma(n - k + 1)
+            + k * log_p
+            + (n - k) * log_q
+        )
+        for k in range(n + 1)
+    ]
+
+
+@lru_cache(maxsize=MAX_CACHED_ROWS)
+def binomial_tail_row(n, p):
+    """
+    Returns a row of binomial tails, where row[k] is the probability of at least k out of n dice matching,
+    when each one matches with probability p. The row has entries for 0 <= k <= n + 1.
+    """
+    tail = [0.0] * (n + 2)
+    terms = _binomial_terms(n, p)
+
+    for k in range(n, -1, -1):
+        tail[k] = tail[k + 1] + terms[k]
+
+    # Avoid rounding errors for the certain event
+    tail[0] = 1.0
+    return tuple(tail)
+
+
+@lru_cache(maxsize=None)
+def binomial_tail_table(max_dice, p):
+    """
+    Returns a table of binomial tails, where table[n] is binomial_tail_row(n, p), for rows up to n == max_dice
+    """
+    # The rows are built without the row cache, which is only for the rows beyond the tables
+    return tuple(binomial_tail_row.__wrapped__(n, p) for n in range(max_dice + 1))
+
+
+def probability_of_at_least(count, count_of_unknown_dice, p):
+    """
+    Returns the probability of at least count out of count_of_unknown_dice dice matching,
+    when each one matches with probability p. It's a single lookup in a precomputed table
+    (or in a row of its own, for more than MAX_DICE unknown dice).
+    """
+    if count <= 0:
+        return 1.0
+
+    if count > count_of_unknown_dice:
+        return 0.0
+
+    table = _tail_tables.get(p)
+    if table is None:
+        table = binomial_tail_table(MAX_DICE, p)
+        _tail_tables[p] = table
+
+    if count_of_unknown_dice < len(table):
+        return table[count_of_unknown_dice][count]
+
+    return binomial_tail_row(count_of_unknown_dice, p)[count]
+
+
+def probability_of_bid(
+    face,
+    count,
+    hand_counts,
+    count_of_unknown_dice,
+    wild_1s,
+    faces_per_die=FACES_PER_DIE,
+):
+    """
+    Returns the probability that a bid (of face & count) is true, given one's own hand.
+
+    Expects:
+    - hand_counts: the face-count vector of the own hand (see Hand.counts);
+    - count_of_unknown_dice: the number of dice in the other players' hands;
+    - faces_per_die: the number of faces of each die (P_FACE & P_FACE_OR_WILD are for FACES_PER_DIE).
+    """
+    if wild_1s and face != 1:
+        count_in_hand = hand_counts[face - 1] + hand_counts[0]
+        p = P_FACE_OR_WILD if faces_per_die == FACES_PER_DIE else 2 / faces_per_die
+    else:
+        count_in_hand = hand_counts[face - 1]
+        p = P_FACE if faces_per_die == FACES_PER_DIE else 1 / faces_per_die
+
+    return probability_of_at_least(count - count_in_hand, count_of_unknown_dice, p)
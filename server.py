@@ -0,0 +1,345 @@
+import asyncio
+import itertools
+
+from liarsdice import Bid, Game, Human
+from simulation import GameResult
+
+# A server that hosts many tables (games) in a single process, on an asyncio event loop.
+# Each table is a task that drives its Game & Rounds, in the same flow as main() in project.py:
+# - bot turns are played right away, and then the table yields to the other tables
+#   (or they're handed to an executor, for bots that take long to decide);
+# - human turns are awaited - the client of each Human player gets a TurnRequest for each of
+#   their turns (see Table.next_turn()), and answers it with a bid or a challenge.
+# Clients are plain coroutines (or threads) in the same process, so no network is needed to use it.
+
+
+class TurnRequest:
+    """
+    A TurnRequest asks a Human player to play their turn at a table.
+    It holds what the player can see, and is answered with respond() (a bid) or challenge().
+    Both can be called from any thread.
+    """
+    def __init__(self, table, round, player, count_all_active_dice, future):
+        self._table = table
+        self._round = round
+        self._player = player
+        self._count_all_active_dice = count_all_active_dice
+        self._future = future
+
+    def respond(self, bid):
+        """
+        Raises the active bid. Raises ValueError if the bid isn't a legal raise
+        (the request stays open, so another bid can be made).
+        """
+        if not isinstance(bid, Bid):
+            raise TypeError("A turn has to be answered with a Bid object")
+
+        if bid.die.face > self._table.game.faces_per_die:
+            raise ValueError(
+                f"The dice at the table have {self._table.game.faces_per_die} faces"
+            )
+
+        if bid.count > self._count_all_active_dice:
+            raise ValueError("There are less dice in play than the bid count")
+
+        active_bid = self._round.active_bid
+        if active_bid is not None and not Bid.is_higher(bid, active_bid):
+            raise ValueError("The new bid has to be higher than the active bid")
+
+        self._answer(bid)
+
+    def challenge(self):
+        """
+        Challenges the active bid (calls 'Liar'). Raises ValueError if there's no bid to challenge yet.
+        """
+        if self._round.active_bid is None:
+            raise ValueError("The first turn of a round has to be a bid")
+
+        self._answer(None)
+
+    def _answer(self, turn_result):
+        """
+        Helper to respond() & challenge(). Passes the answer to the table (on its event loop).
+        """
+        if self._future.done():
+            raise ValueError("The turn was already played")
+
+        loop = self._future.get_loop()
+        try:
+            in_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            in_loop = False
+
+        if in_loop:
+            self._set_result(turn_result)
+        else:
+            loop.call_soon_threadsafe(self._set_result, turn_result)
+
+    def _set_result(self, turn_result):
+        if not self._future.done():
+            self._future.set_result(turn_result)
+
+    @property
+    def table(self):
+        return self._table
+
+    @property
+    def player(self):
+        return self._player
+
+    @property
+    def round_number(self):
+        return self._round.number
+
+    @property
+    def hand(self):
+        return self._player.hand
+
+    @property
+    def active_bid(self):
+        return self._round.active_bid
+
+    @property
+    def active_bidder(self):
+        return self._round.active_bidder
+
+    @property
+    def count_all_active_dice(self):
+        return self._count_all_active_dice
+
+    @property
+    def answered(self):
+        return self._future.done()
+
+
+class Table:
+    """
+    A Table hosts a single game, with its own players (a player can't sit at two tables at once).
+    Created by TableManager.open_table(), which also starts it.
+    """
+    def __init__(
+        self, table_id, players, wild_1s, listener=None, executor=None, **game_args
+    ):
+        self._table_id = table_id
+        self._players = list(players)
+        self._executor = executor
+
+        for p in self._players:
+            p.reset()
+
+        # The Game checks the players & the rest of the args
+        self._game = Game(wild_1s, max_players=max(len(players), 2), **game_args)
+        self._game.players = self._players
+
+        if listener is not None:
+            self._game.add_listener(listener)
+
+        # A queue of TurnRequests for each human at the table (None means that the game is over)
+        self._requests = {
+            p: asyncio.Queue() for p in self._players if isinstance(p, Human)
+        }
+        self._task = None
+
+    def __str__(self):
+        return f"Table #{self._table_id}: {self._game}"
+
+    async def play(self):
+        """
+        Plays the game to the end, and returns its GameResult
+        """
+        try:
+            return await self._play()
+        finally:
+            for requests in self._requests.values():
+                requests.put_nowait(None)
+
+    async def _play(self):
+        """
+        Helper to .play(). Follows the same flow as main() in project.py, and simulation.play_game().
+        """
+        game = self._game
+
+        bids_per_round = []
+        while game.count_players_with_remaining_dice() > 1:
+            # Add & setup round
+            round = game.add_round()
+            round.draw_hands()
+
+            # Play turns
+            count_all_active_dice = round.get_count_of_all_active_dice()
+            count_of_bids = 0
+
+            while round.round_loser is None:
+                player = round.whose_turn
+
+                if isinstance(player, Human):
+                    turn_result = await self._human_turn(
+                        round, player, count_all_active_dice
+                    )
+                else:
+                    turn_result = await self._bot_turn(
+                        round, player, count_all_active_dice
+                    )
+
+                # If a challenge is issued
+                if turn_result is None:
+                    if round.evaluate_challenge(round.active_bid, game.wild_1s):
+                        loser = round.active_bidder
+                    else:
+                        loser = round.whose_turn
+
+                    loser.lose_a_die()
+                    round.set_round_loser_trusted(loser)
+                # If the bid was raised (human bids are checked by TurnRequest.respond())
+                else:
+                    round.set_active_bid_trusted(turn_result, player)
+                    round.rotate_turn()
+                    count_of_bids += 1
+
+            bids_per_round.append(count_of_bids)
+
+        # Declare winner
+        for seat, player in enumerate(game.players):
+            if player.dice_left > 0:
+                game.winner = player
+                winner = seat
+
+        return GameResult(winner, game.count_of_rounds, tuple(bids_per_round))
+
+    async def _human_turn(self, round, player, count_all_active_dice):
+        """
+        Sends a TurnRequest to the human's client, and waits for the answer
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._requests[player].put_nowait(
+            TurnRequest(self, round, player, count_all_active_dice, future)
+        )
+
+        return await future
+
+    async def _bot_turn(self, round, bot, count_all_active_dice):
+        """
+        Plays a bot's turn, without holding up the other tables for long
+        """
+        if self._executor is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, bot.play_turn, round.active_bid, count_all_active_dice
+            )
+
+        turn_result = bot.play_turn(round.active_bid, count_all_active_dice)
+
+        # Let the other tables play a turn
+        await asyncio.sleep(0)
+
+        return turn_result
+
+    async def next_turn(self, human):
+        """
+        Waits for the next turn of a human player at the table, and returns its TurnRequest
+        (or None, once the game is over).
+        """
+        if human not in self._requests:
+            raise ValueError("There is no such human player at the table")
+
+        return await self._requests[human].get()
+
+    async def result(self):
+        """
+        Waits for the game to end, and returns its GameResult
+        """
+        return await self._task
+
+    @property
+    def table_id(self):
+        return self._table_id
+
+    @property
+    def game(self):
+        return self._game
+
+    @property
+    def players(self):
+        return self._players
+
+    @property
+    def done(self):
+        return self._task is not None and self._task.done()
+
+
+class TableManager:
+    """
+    A TableManager hosts many tables at once, on the running asyncio event loop.
+
+    Bots that take long to decide can be given an executor (e.g. a ThreadPoolExecutor),
+    so that their turns are played off the event loop.
+        manager = TableManager()
+        human = Human("Human_Player")
+        table = manager.open_table([human, Bot("Bot_0")], wild_1s=False)
+        request = await table.next_turn(human)
+        request.respond(Bid(Die(3), 2))
+        ...
+        results = await manager.join()
+    """
+    def __init__(self, executor=None):
+        self._executor = executor
+        self._tables = {}
+        self._table_ids = itertools.count()
+
+        # The id of the table at which each player is playing
+        self._seated = {}
+
+    def open_table(self, players, wild_1s, listener=None, **game_args):
+        """
+        Opens a table with the given players, and starts its game. Returns the Table.
+        Any other args (e.g. rng, dice_per_player) are passed on to the Game.
+        """
+        for p in players:
+            if p in self._seated:
+                raise ValueError(f"{p.name} is already playing at another table")
+
+        table_id = next(self._table_ids)
+        table = Table(table_id, players, wild_1s, listener, self._executor, **game_args)
+        table._task = asyncio.get_running_loop().create_task(table.play())
+        table._task.add_done_callback(lambda _: self._unseat(table))
+        self._tables[table_id] = table
+
+        for p in table.players:
+            self._seated[p] = table_id
+
+        return table
+
+    def _unseat(self, table):
+        """
+        Frees the players of a table, once its game is over (so they can play at another one)
+        """
+        for p in table.players:
+            if self._seated.get(p) == table.table_id:
+                del self._seated[p]
+
+    def close_table(self, table_id):
+        """
+        Stops the game at a table (if it's still going on), and removes the table
+        """
+        table = self._tables.pop(table_id)
+        table._task.cancel()
+        self._unseat(table)
+
+    async def join(self):
+        """
+        Waits for the games at all tables to end, and returns a dict with their GameResults, by table id.
+        The finished tables are removed.
+        """
+        tables = dict(self._tables)
+        results = await asyncio.gather(*(t.result() for t in tables.values()))
+
+        for table_id in tables:
+            self._tables.pop(table_id, None)
+
+        return dict(zip(tables, results))
+
+    def table(self, table_id):
+        return self._tables[table_id]
+
+    @property
+    def tables(self):
+        return list(self._tables.values())
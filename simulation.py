@@ -0,0 +1,309 @@
+import os
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from liarsdice import DICE_PER_PLAYER, FACES_PER_DIE, Bot, Game
+
+# A compact summary of a finished game:
+# - winner: the index (seat) of the winning bot in the list of bots the game was played with;
+# - rounds: the number of rounds played;
+# - bids_per_round: a tuple with the number of bids that were made in each round.
+GameResult = namedtuple("GameResult", ["winner", "rounds", "bids_per_round"])
+
+
+def simulate_games(
+    bots,
+    wild_1s,
+    seed,
+    count_of_games,
+    first_game=0,
+    listener=None,
+    dice_per_player=DICE_PER_PLAYER,
+    faces_per_die=FACES_PER_DIE,
+):
+    """
+    Plays count_of_games complete bot-only games, without any I/O.
+    Returns a list with a GameResult for each game.
+    The table fits all the bots, and its dice can be set with dice_per_player & faces_per_die.
+
+    Each game gets its own RNG, seeded from the seed and the game's index (see game_rng()),
+    so every game can be replayed on its own (first_game is the index of the first game to be played),
+    and simulations don't share any random state (e.g. when run in parallel threads).
+    The bots are reset before each game, so the same Bot objects are reused for all of them.
+    If a listener is passed (e.g. an eventlog.EventLogWriter), it gets the events of all games.
+    """
+    _check_simulation_args(bots, seed, count_of_games)
+
+    results = []
+    for i in range(first_game, first_game + count_of_games):
+        results.append(
+            play_game(
+                bots,
+                wild_1s,
+                listener,
+                dice_per_player,
+                faces_per_die,
+                game_rng(seed, i),
+            )
+        )
+
+    return results
+
+
+def _check_simulation_args(bots, seed, count_of_games):
+    """
+    Helper to simulate_games() & run_tournament(). Checks the args they have in common.
+    """
+    if not isinstance(bots, list):
+        raise TypeError("The simulation expects a list of Bot objects")
+
+    for b in bots:
+        if not isinstance(b, Bot):
+            raise TypeError("The simulation expects a list of Bot objects")
+
+    if not isinstance(seed, int):
+        raise TypeError("Non-integer seed")
+
+    if not isinstance(count_of_games, int):
+        raise TypeError("Non-integer count_of_games")
+
+    if count_of_games < 0:
+        raise ValueError("count_of_games can't be negative")
+
+
+def game_seed(seed, index_of_game):
+    """
+    Returns the seed for the game with the given index in a simulation, seeded with seed
+    """
+    return f"{seed}:{index_of_game}"
+
+
+def game_rng(seed, index_of_game):
+    """
+    Returns the RNG for the game with the given index in a simulation, seeded with seed.
+    Each game gets a separate stream, and the same seed & index always give the same one.
+    """
+    return random.Random(game_seed(seed, index_of_game))
+
+
+def play_game(
+    bots,
+    wild_1s,
+    listener=None,
+    dice_per_player=DICE_PER_PLAYER,
+    faces_per_die=FACES_PER_DIE,
+    rng=None,
+):
+    """
+    Plays a single bot-only game to the end, and returns its GameResult.
+    Follows the same flow as main() in project.py, minus the prompts & announcements.
+    The game draws from rng (see Game), so passing the same seeded rng replays the same game.
+    """
+    for bot in bots:
+        bot.reset()
+
+    # Only the current round is needed to start the next one
+    game = Game(
+        wild_1s,
+        history=1,
+        max_players=max(len(bots), 2),
+        dice_per_player=dice_per_player,
+        faces_per_die=faces_per_die,
+        rng=rng,
+    )
+    game.players = list(bots)
+
+    if listener is not None:
+        game.add_listener(listener)
+
+    bids_per_round = []
+    while game.count_players_with_remaining_dice() > 1:
+        # Add & setup round
+        round = game.add_round()
+        round.draw_hands()
+
+        # Play turns
+        count_all_active_dice = round.get_count_of_all_active_dice()
+        count_of_bids = 0
+
+        while round.round_loser is None:
+            turn_result = round.whose_turn.play_turn(
+                round.active_bid, count_all_active_dice
+            )
+
+            # If a challenge is issued
+            if turn_result is None:
+                if round.evaluate_challenge(round.active_bid, game.wild_1s):
+                    loser = round.active_bidder
+                else:
+                    loser = round.whose_turn
+
+                loser.lose_a_die()
+                round.set_round_loser_trusted(loser)
+            # If the bid was raised (bots only make legal bids, so there's no need to check it again)
+            else:
+                round.set_active_bid_trusted(turn_result, round.whose_turn)
+                round.rotate_turn()
+                count_of_bids += 1
+
+        bids_per_round.append(count_of_bids)
+
+    # Declare winner
+    for seat, player in enumerate(game.players):
+        if player.dice_left > 0:
+            game.winner = player
+            winner = seat
+
+    return GameResult(winner, game.count_of_rounds, tuple(bids_per_round))
+
+
+class TournamentResult:
+    """
+    Holds the merged results of a tournament - the wins per seat, and the wins per bot
+    """
+    def __init__(self, bot_names):
+        self._bot_names = bot_names
+        self._count_of_games = 0
+        self._count_of_rounds = 0
+        self._wins_by_seat = [0] * len(bot_names)
+        self._wins_by_bot = [0] * len(bot_names)
+
+    def __eq__(self, other):
+        if not isinstance(other, TournamentResult):
+            return NotImplemented
+
+        return (
+            self._bot_names == other._bot_names
+            and self._count_of_games == other._count_of_games
+            and self._count_of_rounds == other._count_of_rounds
+            and self._wins_by_seat == other._wins_by_seat
+            and self._wins_by_bot == other._wins_by_bot
+        )
+
+    def __str__(self):
+        s = f"{self.count_of_games} games, {self.count_of_rounds} rounds\n"
+        for seat, rate in enumerate(self.win_rate_by_seat()):
+            s += f"Seat {seat}: {rate:.2%}\n"
+        for name, rate in self.win_rate_by_bot().items():
+            s += f"{name}: {rate:.2%}\n"
+
+        return s.rstrip("\n")
+
+    def add_game(self, seat_of_winner, bot_of_winner, count_of_rounds):
+        self._count_of_games += 1
+        self._count_of_rounds += count_of_rounds
+        self._wins_by_seat[seat_of_winner] += 1
+        self._wins_by_bot[bot_of_winner] += 1
+
+    def merge(self, other):
+        """
+        Adds the results of another part of the same tournament to this one
+        """
+        if self._bot_names != other._bot_names:
+            raise ValueError("Only results of the same bots can be merged")
+
+        self._count_of_games += other._count_of_games
+        self._count_of_rounds += other._count_of_rounds
+        for i in range(len(self._bot_names)):
+            self._wins_by_seat[i] += other._wins_by_seat[i]
+            self._wins_by_bot[i] += other._wins_by_bot[i]
+
+    def win_rate_by_seat(self):
+        """
+        Returns a list with the share of games won from each seat
+        """
+        return [w / max(self._count_of_games, 1) for w in self._wins_by_seat]
+
+    def win_rate_by_bot(self):
+        """
+        Returns a dict with the share of games won by each bot (by name)
+        """
+        return {
+            name: w / max(self._count_of_games, 1)
+            for name, w in zip(self._bot_names, self._wins_by_bot)
+        }
+
+    @property
+    def count_of_games(self):
+        return self._count_of_games
+
+    @property
+    def count_of_rounds(self):
+        return self._count_of_rounds
+
+    @property
+    def wins_by_seat(self):
+        return self._wins_by_seat
+
+    @property
+    def wins_by_bot(self):
+        return dict(zip(self._bot_names, self._wins_by_bot))
+
+
+def run_tournament(
+    bots, wild_1s, seed, count_of_games, workers=None, games_per_chunk=1000
+):
+    """
+    Plays count_of_games bot-only games, split across a pool of worker processes,
+    and returns the merged TournamentResult.
+
+    The bots take turns at the seats - in game i, bot (i + seat) % len(bots) sits at each seat.
+    Every game's RNG is seeded from the seed and its index (just like in simulate_games()), and the games
+    are split in chunks of a fixed size, so the results are the same regardless of the number of workers.
+    workers=None uses all the CPU cores, and workers=1 plays all games in the current process.
+    """
+    _check_simulation_args(bots, seed, count_of_games)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if not isinstance(workers, int) or not isinstance(games_per_chunk, int):
+        raise TypeError("Non-integer workers or games_per_chunk")
+
+    if workers < 1 or games_per_chunk < 1:
+        raise ValueError("workers and games_per_chunk must be > 0")
+
+    names = [b.name for b in bots]
+    if len(set(names)) != len(names):
+        raise ValueError("Each bot in a tournament must have a unique name")
+
+    # The bots are pickled for the workers without the games they were last seated in
+    # (see Player.__getstate__()), so each worker gets detached copies
+    chunks = []
+    for first_game in range(0, count_of_games, games_per_chunk):
+        count_in_chunk = min(games_per_chunk, count_of_games - first_game)
+        chunks.append((bots, wild_1s, seed, first_game, count_in_chunk))
+
+    result = TournamentResult(names)
+
+    if workers == 1 or len(chunks) < 2:
+        for chunk in chunks:
+            result.merge(_play_tournament_chunk(*chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            for chunk_result in executor.map(_play_tournament_chunk, *zip(*chunks)):
+                result.merge(chunk_result)
+
+    return result
+
+
+def _play_tournament_chunk(bots, wild_1s, seed, first_game, count_of_games):
+    """
+    Helper to run_tournament(). Plays a chunk of the games of a tournament (possibly in a worker process).
+    """
+    result = TournamentResult([b.name for b in bots])
+
+    for i in range(first_game, first_game + count_of_games):
+        shift = i % len(bots)
+        game_result = play_game(
+            bots[shift:] + bots[:shift], wild_1s, rng=game_rng(seed, i)
+        )
+
+        result.add_game(
+            game_result.winner,
+            (game_result.winner + shift) % len(bots),
+            game_result.rounds,
+        )
+
+    return result
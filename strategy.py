@@ -0,0 +1,311 @@
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from liarsdice import Bid, Bot
+from probability import MAX_DICE, binomial_tail_row, binomial_tail_table
+
+# A strategy decides the turns of a whole batch of seats (e.g. at thousands of tables) at once.
+# The state of each turn is what the player in turn can see, as arrays with one row per turn:
+# - hand_counts: an (n x faces_per_die) matrix - the face-count vector of each hand (see Hand.counts);
+# - bid_ranks: the rank of the active bid (see Bid.rank), or NO_BID at the start of a round;
+# - dice_in_play: the number of dice in play.
+# The actions are an array with the rank of the bid to make, or CHALLENGE.
+TurnStates = namedtuple("TurnStates", ["hand_counts", "bid_ranks", "dice_in_play"])
+
+NO_BID = -1
+CHALLENGE = -1
+
+
+def turn_states(hand_counts, active_bids, dice_in_play):
+    """
+    Returns the TurnStates for lists of hand counts, active bids (Bid objects or None) & counts of dice in play
+    """
+    return TurnStates(
+        np.asarray(hand_counts, dtype=np.int64).reshape(len(hand_counts), -1),
+        np.array(
+            [NO_BID if b is None else b.rank for b in active_bids], dtype=np.int64
+        ),
+        np.asarray(dice_in_play, dtype=np.int64),
+    )
+
+
+def bid_of_action(action):
+    """
+    Returns the Bid for an action (or None, for a challenge)
+    """
+    if action == CHALLENGE:
+        return None
+
+    face, count = divmod(int(action), Bid.MAX_COUNT)
+    return Bid.trusted(face + 1, count + 1)
+
+
+def _split_ranks(ranks):
+    """
+    Returns the faces & counts of an array of bid ranks
+    """
+    return ranks // Bid.MAX_COUNT + 1, ranks % Bid.MAX_COUNT + 1
+
+
+class Strategy(ABC):
+    """
+    The base class of all strategies. Subclasses implement decide_batch(states, rng) -> actions,
+    and decide() plays a single turn through it (as a batch of 1).
+
+    Strategies that decide at random draw from the rng passed to them (a numpy.random.Generator),
+    so that the caller - e.g. a bot in a seeded game - decides where the randomness comes from.
+    """
+    def decide(self, hand_counts, active_bid, count_all_active_dice, rng=None):
+        """
+        Decides a single turn. Returns either a Bid object, or None (a challenge).
+        """
+        states = turn_states([hand_counts], [active_bid], [count_all_active_dice])
+        return bid_of_action(self.decide_batch(states, rng)[0])
+
+    @abstractmethod
+    def decide_batch(self, states, rng=None):
+        """
+        Decides the turns of a batch of TurnStates, and returns an array of actions
+        """
+
+
+def _generator(rng, own_rng):
+    """
+    Returns the rng a random strategy draws from - the one passed to it, or else its own
+    """
+    if rng is None:
+        rng = own_rng
+
+    if not isinstance(rng, np.random.Generator):
+        raise TypeError(
+            "A random strategy needs a numpy.random.Generator (passed to it, or its own)"
+        )
+
+    return rng
+
+
+class BaselineStrategy(Strategy):
+    """
+    The strategy of Bot, for a batch of turns (with the same odds, drawn from a numpy.random.Generator):
+    - challenge 20% of the time (or always, when the active bid can't be raised);
+    - otherwise, raise by face or by count (50/50, unless the rules force one of them).
+      By face, the bot bids on the face it has most of, and by count - on a random count up to all the dice in play.
+    The odds are drawn from the rng passed to decide_batch(), or else from the strategy's own rng (if it has one).
+    """
+    def __init__(self, rng=None):
+        if rng is not None and not isinstance(rng, np.random.Generator):
+            raise TypeError(
+                "The rng of a BaselineStrategy has to be a numpy.random.Generator"
+            )
+
+        self._rng = rng
+
+    def decide_batch(self, states, rng=None):
+        hand_counts, bid_ranks, dice_in_play = states
+        n, faces_per_die = hand_counts.shape
+        rng = _generator(rng, self._rng)
+
+        has_bid = bid_ranks != NO_BID
+        bid_faces, bid_counts = _split_ranks(np.maximum(bid_ranks, 0))
+
+        # Decide to bid or challenge
+        is_max_bid = (
+            has_bid & (bid_faces == faces_per_die) & (bid_counts == dice_in_play)
+        )
+        challenge = has_bid & (is_max_bid | (rng.random(n) < 0.2))
+
+        # Decide whether to raise by face, or by count
+        by_face = (
+            ~has_bid
+            | ((bid_faces < faces_per_die) & (bid_counts == dice_in_play))
+            | ((bid_faces < faces_per_die) & (rng.random(n) < 0.5))
+        )
+
+        # The face with most occurences in the hand (ties are broken at random,
+        # just like Bot's ties go to the face that comes first in its randomly rolled hand)
+        most_common_face = (
+            np.argmax(hand_counts + rng.random((n, faces_per_die)) * 0.5, axis=1) + 1
+        )
+        count_in_hand = hand_counts[np.arange(n), most_common_face - 1]
+        count_of_faces = np.count_nonzero(hand_counts, axis=1)
+
+        # By face - the first bid is on the most common face, and later ones on it (if it's higher),
+        # or on the next face, for a count of 1
+        use_most_common = (count_of_faces > 1) & (most_common_face > bid_faces)
+        raised_faces = np.where(
+            has_bid,
+            np.where(use_most_common, most_common_face, bid_faces + 1),
+            most_common_face,
+        )
+        raised_counts = np.where(has_bid, 1, count_in_hand)
+
+        # By count - a random count above the active one
+        low = bid_counts + 1
+        random_counts = low + (
+            rng.random(n) * np.maximum(dice_in_play - low + 1, 1)
+        ).astype(np.int64)
+
+        faces = np.where(by_face, raised_faces, bid_faces)
+        counts = np.where(by_face, raised_counts, random_counts)
+
+        actions = (faces - 1) * Bid.MAX_COUNT + (counts - 1)
+        return np.where(challenge, CHALLENGE, actions)
+
+
+@lru_cache(maxsize=None)
+def _tail_array(max_dice, p):
+    """
+    Returns the binomial tail table of probability.binomial_tail_table() as a dense array,
+    where array[n][k] == 0.0 beyond the last entry of row n
+    """
+    table = binomial_tail_table(max_dice, p)
+
+    array = np.zeros((max_dice + 1, max_dice + 2))
+    for n, row in enumerate(table):
+        array[n, : len(row)] = row
+
+    return array
+
+
+def _tails(count_of_unknown_dice, p):
+    """
+    Returns the binomial tails for a batch of counts of unknown dice, as a dense array & the index of each
+    count's row in it (array[index[i]][k] == 0.0 beyond the last entry of the row).
+    Up to MAX_DICE, that's the whole (cached) table. Beyond it, only the rows of the counts in the batch are
+    built, since a table for all the counts would take O(n^2) memory.
+    """
+    if count_of_unknown_dice.max(initial=0) <= MAX_DICE:
+        return _tail_array(MAX_DICE, p), count_of_unknown_dice
+
+    counts, index = np.unique(count_of_unknown_dice, return_inverse=True)
+    array = np.zeros((len(counts), counts[-1] + 2))
+    for i, n in enumerate(counts.tolist()):
+        array[i, : n + 2] = binomial_tail_row(n, p)
+
+    return array, index.reshape(count_of_unknown_dice.shape)
+
+
+class ProbabilityStrategy(Strategy):
+    """
+    The strategy of ProbabilityBot, for a batch of turns: challenge bids that are less likely than
+    challenge_threshold (given one's own hand), and otherwise make the legal bid most likely to be true.
+    Makes the same decisions as ProbabilityBot.
+    """
+    def __init__(self, wild_1s=False, challenge_threshold=0.5):
+        if not isinstance(wild_1s, bool):
+            raise TypeError(
+                "The 'wild_1s' property of a ProbabilityStrategy has to be Boolean"
+            )
+
+        if not isinstance(challenge_threshold, (int, float)):
+            raise TypeError("The challenge_threshold has to be a number")
+
+        if not 1 >= challenge_threshold >= 0:
+            raise ValueError("The challenge_threshold has to be between 0 and 1")
+
+        self._wild_1s = wild_1s
+        self._challenge_threshold = challenge_threshold
+
+    def _probabilities(self, faces, counts, hand_counts, count_of_unknown_dice):
+        """
+        Vectorized probability.probability_of_bid() - faces & counts are (n x k) matrices of bids
+        """
+        n, faces_per_die = hand_counts.shape
+        rows = np.arange(n)[:, None]
+
+        count_in_hand = hand_counts[rows, faces - 1]
+        wild = self._wild_1s & (faces != 1)
+        count_in_hand = count_in_hand + np.where(wild, hand_counts[:, :1], 0)
+
+        # The same tables (and rows) as probability_of_bid() uses, so the results are exactly the same
+        tail_face, index = _tails(count_of_unknown_dice, 1 / faces_per_die)
+        tail_wild, _ = _tails(count_of_unknown_dice, 2 / faces_per_die)
+
+        needed = np.clip(counts - count_in_hand, 0, tail_face.shape[1] - 1)
+        index = index[:, None]
+
+        return np.where(wild, tail_wild[index, needed], tail_face[index, needed])
+
+    def decide_batch(self, states, rng=None):
+        hand_counts, bid_ranks, dice_in_play = states
+        n, faces_per_die = hand_counts.shape
+
+        count_of_unknown_dice = dice_in_play - hand_counts.sum(axis=1)
+        has_bid = bid_ranks != NO_BID
+        bid_faces, bid_counts = _split_ranks(np.maximum(bid_ranks, 0))
+        bid_faces = np.where(has_bid, bid_faces, 1)
+        bid_counts = np.where(has_bid, bid_counts, 0)
+
+        # Decide to bid or challenge
+        p_active = self._probabilities(
+            bid_faces[:, None], bid_counts[:, None], hand_counts, count_of_unknown_dice
+        )[:, 0]
+        challenge = has_bid & (p_active < self._challenge_threshold)
+
+        # The lowest legal bid on each face (faces below the active bid's can't be bid on)
+        faces = np.broadcast_to(np.arange(1, faces_per_die + 1), (n, faces_per_die))
+        counts = np.where(faces == bid_faces[:, None], bid_counts[:, None] + 1, 1)
+        legal = (faces >= bid_faces[:, None]) & (counts <= dice_in_play[:, None])
+
+        p = self._probabilities(faces, counts, hand_counts, count_of_unknown_dice)
+        p = np.where(legal, p, -1.0)
+
+        # Pick the most likely bid (or, out of equally likely ones, the first one on the face the bot has most of)
+        best = p == p.max(axis=1, keepdims=True)
+        tie_counts = np.where(best, hand_counts, -1)
+        best_face = np.argmax(
+            tie_counts == tie_counts.max(axis=1, keepdims=True), axis=1
+        )
+
+        rows = np.arange(n)
+        actions = best_face * Bid.MAX_COUNT + (counts[rows, best_face] - 1)
+
+        # If there is no way to raise the bid, it's a challenge
+        no_raise = ~legal.any(axis=1)
+        return np.where(challenge | no_raise, CHALLENGE, actions)
+
+    @property
+    def wild_1s(self):
+        return self._wild_1s
+
+    @property
+    def challenge_threshold(self):
+        return self._challenge_threshold
+
+
+class StrategyBot(Bot):
+    """
+    A StrategyBot is a bot that plays its turns with a Strategy (e.g. one that's shared by many bots).
+    Each turn's randomness is drawn from the bot's game RNG, so seeded games can be replayed.
+    """
+    def __init__(self, name, strategy):
+        super().__init__(name)
+
+        if not isinstance(strategy, Strategy):
+            raise TypeError("The strategy of a StrategyBot has to be a Strategy object")
+
+        self._strategy = strategy
+
+    def play_turn(self, active_bid, count_all_active_dice):
+        """
+        Represents the bot playing their turn.
+        Returns either a Bid object, or None (which means a challenge to the previous player's bid)
+        """
+        # Check args
+        if not isinstance(count_all_active_dice, int):
+            raise TypeError("Non-integer for count_all_active_dice")
+
+        if not count_all_active_dice >= 2:
+            raise ValueError("count_all_active_dice must be >= 2, or the game is over")
+
+        rng = np.random.default_rng(self._rng().getrandbits(64))
+        return self._strategy.decide(
+            self.hand_counts, active_bid, count_all_active_dice, rng
+        )
+
+    @property
+    def strategy(self):
+        return self._strategy
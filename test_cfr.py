@@ -0,0 +1,131 @@
+import random
+from math import comb
+
+import numpy as np
+import pytest
+
+from cfr import CFRSolution, CFRSolver, CFRStrategy, HandIndex, hand_histograms, solve
+from strategy import CHALLENGE, BaselineStrategy, turn_states
+from vectorized import simulate_games_lockstep
+
+pytestmark = pytest.mark.usefixtures("pristine_liarsdice")
+
+
+@pytest.fixture(scope="module")
+def solution():
+    return solve(2, False, 100, seed=3)
+
+
+def test_hand_histograms():
+    histograms, probabilities = hand_histograms(3)
+    assert histograms.shape == (comb(8, 3), 6)
+    assert (histograms.sum(axis=1) == 3).all()
+    assert probabilities.sum() == pytest.approx(1)
+    assert probabilities[0] == pytest.approx(1 / 216)
+
+    hands = HandIndex(3)
+    assert len(hands) == 56
+    assert hands.ids(histograms).tolist() == list(range(56))
+    assert hands.ids([[0, 1, 0, 0, 2, 0]]).tolist() == [
+        histograms.tolist().index([0, 1, 0, 0, 2, 0])
+    ]
+
+
+def test_cfr_solver():
+    solver = CFRSolver((1, 1), False, faces_per_die=3, seed=0)
+    solver.train(300, batch_size=64)
+    assert solver.iterations == 300
+    assert solver.views == [(1, 1)]
+    assert solver.count_of_bids == 6
+    assert 0 < solver.value((1, 1)) < 1
+
+    # Legal actions only (no challenge at the start of the round, no bids below the active one)
+    table = solver.strategy_table((1, 1))
+    assert table.sum(axis=2) == pytest.approx(np.ones(table.shape[:2]))
+    assert (table[:, 0, 6] == 0).all()
+    assert (table[:, solver.history_id([3]), :4] == 0).all()
+
+    # A bid that's sure to be true (on the face of one's own die) isn't challenged,
+    # and one that's sure to be a lie always is (bids are indexed by rank - (face - 1) * 2 + (count - 1))
+    assert solver.action_probabilities((1, 1), [0, 1, 0], [2])[6] < 0.05
+    assert solver.action_probabilities((1, 1), [1, 0, 0], [3])[6] > 0.95
+
+
+def test_solve(solution):
+    values = solution.values
+    assert sorted(values) == [(1, 1), (1, 2), (2, 1), (2, 2)]
+    for p in values.values():
+        assert 0 < p < 1
+
+    # Having more dice helps
+    assert values[(2, 1)] > values[(1, 1)] > values[(1, 2)]
+
+    assert solution.solver((2, 1)) is solution.solver((1, 2))
+    probabilities = solution.action_probabilities((2, 1), [1, 0, 0, 0, 0, 1], [])
+    assert len(probabilities) == 19
+    assert probabilities.sum() == pytest.approx(1)
+
+
+def test_solve_workers():
+    a = solve(2, True, 20, faces_per_die=3, seed=5, workers=1)
+    b = solve(2, True, 20, faces_per_die=3, seed=5, workers=2)
+
+    assert a.values == b.values
+
+
+def test_cfr_strategy(solution):
+    strategy = CFRStrategy(solution, np.random.default_rng(0))
+
+    actions = strategy.decide_batch(
+        turn_states([[1, 0, 0, 0, 0, 1], [0, 0, 0, 2, 0, 0]], [None, None], [4, 4])
+    )
+    assert (actions != CHALLENGE).all()
+    assert strategy.decide([0, 0, 1, 0, 0, 0], None, 3) is not None
+
+    # Without an rng of its own, it has to be given one
+    states = turn_states([[1, 0, 0, 0, 0, 1]], [None], [4])
+    unseeded = CFRStrategy(solution)
+    assert len(unseeded.decide_batch(states, np.random.default_rng(2))) == 1
+    with pytest.raises(TypeError):
+        unseeded.decide_batch(states)
+    with pytest.raises(TypeError):
+        CFRStrategy(solution, random.Random())
+
+    # Heads-up with 2 dice each, it beats the baseline strategy most of the time
+    baseline = BaselineStrategy(np.random.default_rng(1))
+    results = simulate_games_lockstep(
+        [strategy, baseline], False, 7, 2000, dice_per_player=2
+    )
+    assert (results.winners == 0).mean() > 0.7
+
+
+def test_cfr_bad_args(solution):
+    with pytest.raises(TypeError):
+        CFRSolver((1, 1), 0)
+    with pytest.raises(TypeError):
+        CFRSolver([1, 1], False)
+    with pytest.raises(ValueError):
+        CFRSolver((0, 1), False)
+    with pytest.raises(ValueError):
+        CFRSolver((1, 1), False, memory=0)
+
+    # The rounds with less dice have to be solved first
+    with pytest.raises(ValueError):
+        CFRSolver((2, 2), False)
+
+    solver = CFRSolver((1, 1), False)
+    with pytest.raises(ValueError):
+        solver.train(-1)
+    with pytest.raises(ValueError):
+        solver.history_id([5, 2])
+    with pytest.raises(ValueError):
+        solver.value((1, 2))
+
+    with pytest.raises(ValueError):
+        solve(0, False, 10)
+    with pytest.raises(TypeError):
+        CFRStrategy(solver)
+    with pytest.raises(ValueError):
+        CFRStrategy(CFRSolution({(1, 1): CFRSolver((1, 1), False, memory=2)}, {}))
+    with pytest.raises(ValueError):
+        solution.solver((3, 1))
@@ -0,0 +1,155 @@
+import pytest
+
+from eventlog import (
+    INDEX_SUFFIX,
+    EventLogReader,
+    EventLogWriter,
+    build_index,
+    decode_event,
+    decode_events,
+    decode_varint,
+    encode_event,
+    encode_varint,
+)
+from liarsdice import Bot, Event
+from simulation import simulate_games
+
+pytestmark = pytest.mark.usefixtures("pristine_liarsdice")
+
+
+def test_varint():
+    for n in [0, 1, 127, 128, 300, 16383, 16384, 2**40]:
+        out = bytearray()
+        encode_varint(n, out)
+        assert decode_varint(out, 0) == (n, len(out))
+
+    out = bytearray()
+    encode_varint(5, out)
+    assert len(out) == 1
+
+
+def test_encode_decode_event():
+    events = [
+        (Event.GAME_START, 3, True, 5, 6),
+        (Event.ROUND_START, 1, 0),
+        (Event.HANDS, ((0, b"\x01\x02\x06"), (1, b"\x05"), (2, b""))),
+        (Event.BID, 2, 5, 3),
+        (Event.CHALLENGE, 0, 2, False),
+        (Event.DIE_LOST, 0),
+        (Event.ELIMINATION, 0),
+        (Event.WINNER, 1),
+    ]
+
+    out = bytearray()
+    for e in events:
+        encode_event(e, out)
+
+    assert list(decode_events(out)) == events
+
+    # Most events only take a few bytes
+    out = bytearray()
+    encode_event((Event.BID, 2, 5, 3), out)
+    assert len(out) == 5
+
+    event, offset = decode_event(out, 0)
+    assert event == (Event.BID, 2, 5, 3)
+    assert offset == len(out)
+
+
+def test_game_events():
+    bots = [Bot("Bot1"), Bot("Bot2"), Bot("Bot3")]
+    events = []
+
+    [result] = simulate_games(bots, True, 1, 1, listener=events.append)
+
+    kinds = [e[0] for e in events]
+    assert events[0] == (Event.GAME_START, 3, True, 5, 6)
+    assert events[1] == (Event.ROUND_START, 1, 0)
+    assert events[-1] == (Event.WINNER, result.winner)
+
+    assert kinds.count(Event.ROUND_START) == result.rounds
+    assert kinds.count(Event.HANDS) == result.rounds
+    assert kinds.count(Event.CHALLENGE) == result.rounds
+    assert kinds.count(Event.DIE_LOST) == result.rounds
+    assert kinds.count(Event.ELIMINATION) == 2
+    assert kinds.count(Event.BID) == sum(result.bids_per_round)
+
+    # The loser of a challenge is the bidder if the bid was a lie, and the challenger otherwise
+    for i, e in enumerate(events):
+        if e[0] == Event.CHALLENGE:
+            _, challenger, bidder, bid_was_a_lie = e
+            assert events[i + 1] == (
+                Event.DIE_LOST,
+                bidder if bid_was_a_lie else challenger,
+            )
+
+
+def test_event_log_writer(tmp_path):
+    path = tmp_path / "games.log"
+    bots = [Bot("Bot1"), Bot("Bot2")]
+    events = []
+
+    with EventLogWriter(path, buffer_size=64) as log:
+        simulate_games(bots, False, 2, 3, listener=log)
+
+    simulate_games(bots, False, 2, 3, listener=events.append)
+
+    assert list(decode_events(path.read_bytes())) == events
+
+
+def test_event_log_writer_bad_buffer_size(tmp_path):
+    with pytest.raises(ValueError):
+        EventLogWriter(tmp_path / "games.log", buffer_size=0)
+
+    with pytest.raises(TypeError):
+        EventLogWriter(tmp_path / "games.log", buffer_size="1")
+
+
+def test_event_log_reader(tmp_path):
+    path = tmp_path / "games.log"
+    bots = [Bot("Bot1"), Bot("Bot2"), Bot("Bot3")]
+    events = []
+
+    # Written in two sessions, so the index is appended to
+    with EventLogWriter(path, buffer_size=64) as log:
+        simulate_games(bots, True, 5, 3, listener=log)
+    with EventLogWriter(path) as log:
+        results = simulate_games(bots, True, 5, 2, first_game=3, listener=log)
+
+    simulate_games(bots, True, 5, 5, listener=events.append)
+    games = []
+    for e in events:
+        if e[0] == Event.GAME_START:
+            games.append([])
+        games[-1].append(e)
+
+    with EventLogReader(path) as log:
+        assert len(log) == 5
+        assert [list(g.events()) for g in log] == games
+        assert list(log[3].events()) == games[3]
+        assert list(log[-1].events()) == games[4]
+        assert len(list(log.game(4).rounds())) == results[1].rounds
+        assert sum(g.size for g in log) == path.stat().st_size
+
+        with pytest.raises(IndexError):
+            log.game(5)
+
+        with pytest.raises(TypeError):
+            log.game("1")
+
+    # A missing index is rebuilt from the log
+    offsets = build_index(path)
+    (tmp_path / ("games.log" + INDEX_SUFFIX)).unlink()
+    with EventLogReader(path) as log:
+        assert len(log) == 5
+        assert [list(g.events()) for g in log] == games
+    assert build_index(path) == offsets
+
+
+def test_event_log_reader_empty(tmp_path):
+    path = tmp_path / "games.log"
+    path.write_bytes(b"")
+
+    with EventLogReader(path) as log:
+        assert len(log) == 0
+        assert list(log) == []
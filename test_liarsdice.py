@@ -1,6 +1,22 @@
+import pickle
 import pytest
-
-from liarsdice import Bid, Bot, Die, Game, Human, Player, Round
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from liarsdice import (
+    HISTORY_SUMMARIES,
+    Bid,
+    Bot,
+    Die,
+    Event,
+    Game,
+    Hand,
+    Human,
+    Player,
+    ProbabilityBot,
+    Round,
+    RoundSummary,
+)
 from unittest.mock import patch, PropertyMock
 
 
@@ -16,6 +32,24 @@ def test_die_init_no_args():
         Die()
 
 
+def test_die_is_flyweight():
+    assert Die(3) is Die(3)
+    assert Die(3) is not Die(4)
+
+    with pytest.raises(AttributeError):
+        Die(3)._face = 4
+
+    with pytest.raises(AttributeError):
+        Die(3).foo = 4
+
+    assert pickle.loads(pickle.dumps(Die(5))) is Die(5)
+
+
+def test_die_trusted():
+    for i in range(1, 7):
+        assert Die.trusted(i) is Die(i)
+
+
 def test_die_stringify_dice_bad_input():
     with pytest.raises(TypeError):
         Die.stringify_dice(1)
@@ -39,6 +73,32 @@ def test_die_stringify_dice_bad_input():
         Die.stringify_dice([Die(1), None])
 
 
+def test_die_stringify_dice_default_case():
+    s = Die.stringify_dice([Die(1), Die(6)])
+    assert s == (
+        " +-------+ +-------+\n"
+        " |       | | O   O |\n"
+        " |   O   | | O   O |\n"
+        " |       | | O   O |\n"
+        " +-------+ +-------+"
+    )
+
+    # Rendered once, and reused afterwards
+    assert Die.stringify_dice([Die(1), Die(6)]) is s
+    assert Die.stringify_faces(b"\x01\x06") == s
+
+
+def test_die_stringify_faces_invalid_face():
+    with pytest.raises(ValueError):
+        Die.stringify_faces(b"\x00")
+
+    with pytest.raises(ValueError):
+        Die.stringify_faces(b"\x01\x07")
+
+    with pytest.raises(ValueError):
+        Die.stringify_faces(bytes([12]), 10)
+
+
 def test_die_init_invalid_face():
     with pytest.raises(TypeError):
         Die(None)
@@ -190,6 +250,162 @@ def test_bid_is_higher():
         assert Bid.is_higher(Bid(Die(i), i), Bid(Die(i), i)) == False
 
 
+def test_bid_is_flyweight():
+    assert Bid(Die(3), 2) is Bid(Die(3), 2)
+    assert Bid(Die(3), 2) is Bid(Die(3), 2, Bid(Die(2), 5), 10)
+    assert Bid(Die(3), 2) is not Bid(Die(3), 3)
+
+    with pytest.raises(AttributeError):
+        Bid(Die(3), 2)._count = 4
+
+    assert pickle.loads(pickle.dumps(Bid(Die(4), 7))) is Bid(Die(4), 7)
+
+    # Validation still applies to bids that have already been created
+    Bid(Die(2), 2)
+    with pytest.raises(ValueError):
+        Bid(Die(2), 2, Bid(Die(2), 2))
+
+    strategy = {Bid(Die(1), 1): "raise"}
+    assert strategy[Bid(Die(1), 1)] == "raise"
+
+
+def test_bid_trusted():
+    assert Bid.trusted(4, 3) is Bid(Die(4), 3)
+    assert Bid.trusted(6, 25) is Bid(Die(6), 25)
+
+
+def test_bid_rank():
+    assert Bid(Die(1), 1).rank == 0
+    assert Bid(Die(1), 25).rank == 24
+    assert Bid(Die(2), 1).rank == Bid.MAX_COUNT
+    assert Bid(Die(6), 25).rank == 5 * Bid.MAX_COUNT + 24
+    assert Bid(Die(8, 10), 500).rank == 7 * Bid.MAX_COUNT + 499
+
+    with pytest.raises(ValueError):
+        Bid(Die(1), Bid.MAX_COUNT + 1)
+
+
+def test_bid_legal_bids():
+    bids = Bid.legal_bids(5)
+    assert len(bids) == 30
+    assert bids is Bid.legal_bids(5)
+
+    for i in range(len(bids) - 1):
+        assert Bid.is_higher(bids[i + 1], bids[i]) == True
+
+    assert bids[(3 - 1) * 5 + (4 - 1)].die.face == 3
+    assert bids[(3 - 1) * 5 + (4 - 1)].count == 4
+
+    assert len(Bid.legal_bids(25)) == 150
+
+    with pytest.raises(ValueError):
+        Bid.legal_bids(1)
+
+    with pytest.raises(ValueError):
+        Bid.legal_bids(Bid.MAX_COUNT + 1)
+
+    with pytest.raises(TypeError):
+        Bid.legal_bids("5")
+
+    # Dice with other numbers of faces
+    bids = Bid.legal_bids(50, 10)
+    assert len(bids) == 500
+    assert bids[-1] is Bid(Die(10, 10), 50)
+    assert Bid.legal_raises(Bid(Die(9, 10), 50), 50, 10) == bids[450:]
+
+    # Only the tuples of the most recently used table sizes are kept
+    for count_all_active_dice in range(100, 200):
+        Bid.legal_bids(count_all_active_dice)
+    assert Bid.legal_bids(50, 10) is not bids
+    assert Bid.legal_bids(50, 10) == bids
+
+
+def test_bid_legal_raises():
+    assert Bid.legal_raises(None, 10) == Bid.legal_bids(10)
+
+    for face in range(1, 7):
+        for count in range(1, 11):
+            active_bid = Bid(Die(face), count)
+            raises = Bid.legal_raises(active_bid, 10)
+
+            # Each raise is legal, and all legal raises are there
+            for b in raises:
+                assert isinstance(Bid(b.die, b.count, active_bid, 10), Bid)
+            assert len(raises) == (6 - face) * 10 + (10 - count)
+
+    assert Bid.legal_raises(Bid(Die(6), 10), 10) == ()
+    assert Bid.legal_raises(Bid(Die(3), 20), 10) == Bid.legal_raises(
+        Bid(Die(3), 10), 10
+    )
+
+
+# Tests for Hand class
+def test_hand_init_default_case():
+    h = Hand([1, 2, 2, 6])
+    assert len(h) == 4
+    assert h.faces == b"\x01\x02\x02\x06"
+    assert h.counts == (1, 2, 0, 0, 0, 1)
+
+    assert len(Hand(b"")) == 0
+    assert Hand(b"").counts == (0, 0, 0, 0, 0, 0)
+
+
+def test_hand_init_invalid_face():
+    with pytest.raises(ValueError):
+        Hand([1, 0])
+
+    with pytest.raises(ValueError):
+        Hand([7, 1])
+
+    with pytest.raises(TypeError):
+        Hand(["1"])
+
+    with pytest.raises(TypeError):
+        Hand(None)
+
+
+def test_hand_trusted():
+    h = Hand.trusted(b"\x01\x05\x05")
+    assert isinstance(h, Hand)
+    assert h.counts == (1, 0, 0, 0, 2, 0)
+
+
+def test_hand_to_dice():
+    h = Hand([3, 1, 5])
+    dice = h.to_dice()
+
+    assert isinstance(dice, list)
+    assert [d.face for d in dice] == [3, 1, 5]
+    assert [d.face for d in h] == [3, 1, 5]
+    assert h[2].face == 5
+
+
+def test_hand_roll_faces():
+    assert Hand.roll_faces(0) == b""
+
+    faces = Hand.roll_faces(60000)
+    assert len(faces) == 60000
+
+    # All faces come up (about) equally often
+    h = Hand(faces)
+    for count in h.counts:
+        assert abs(count / 60000 - 1 / 6) < 0.01
+
+    random.seed(1)
+    faces = Hand.roll_faces(25)
+    random.seed(1)
+    assert Hand.roll_faces(25) == faces
+
+
+def test_hand_most_common_face():
+    assert Hand([2, 3, 3, 1]).most_common_face() == 3
+    assert Hand([6]).most_common_face() == 6
+
+    # Ties go to the face that comes first in the hand
+    assert Hand([4, 2, 2, 4, 1]).most_common_face() == 4
+    assert Hand([5, 1, 3]).most_common_face() == 5
+
+
 # Tests for Player class
 def test_player_init_default_case():
     assert isinstance(Player("1"), Player)
@@ -318,7 +534,7 @@ def test_bot_play_turn_challenge():
 def test_bot_play_turn_raise():
     bot = Bot("Bot1")
     type(bot)._dice_left = PropertyMock(return_value=3)
-    type(bot)._hand = PropertyMock(return_value=[Die(1), Die(2), Die(3)])
+    type(bot)._hand = PropertyMock(return_value=Hand([1, 2, 3]))
 
     active_bid = None
     assert isinstance(bot.play_turn(active_bid, 5), Bid)
@@ -357,6 +573,66 @@ def test_bot_play_turn_bad_count_all_active_dice():
         bot.play_turn(active_bid, "5")
 
 
+# Tests for ProbabilityBot class
+def test_probability_bot_init_default_case():
+    assert isinstance(ProbabilityBot("Bot1"), Bot)
+    assert ProbabilityBot("Bot1", True, 0.3).challenge_threshold == 0.3
+
+
+def test_probability_bot_init_bad_args():
+    with pytest.raises(TypeError):
+        ProbabilityBot("Bot1", 1)
+
+    with pytest.raises(TypeError):
+        ProbabilityBot("Bot1", False, "0.5")
+
+    with pytest.raises(ValueError):
+        ProbabilityBot("Bot1", False, 1.5)
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_probability_bot_play_turn_challenge():
+    bot = ProbabilityBot("Bot1")
+    bot._hand = Hand([2, 2, 3, 4, 5])
+
+    # There are no 6s in the bot's hand, and 5 more dice in play
+    assert bot.play_turn(Bid(Die(6), 5), 10) == None
+    assert bot.play_turn(Bid(Die(6), 10), 10) == None
+
+    # ... but 1s are wild
+    bot = ProbabilityBot("Bot1", True)
+    bot._hand = Hand([1, 1, 6, 6, 6])
+    assert isinstance(bot.play_turn(Bid(Die(6), 5), 10), Bid)
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_probability_bot_play_turn_raise():
+    bot = ProbabilityBot("Bot1")
+    bot._hand = Hand([1, 2, 3, 3, 3])
+
+    # The first bid is on the face the bot has most of
+    first_bid = bot.play_turn(None, 10)
+    assert first_bid.die.face == 3
+
+    for face in range(1, 7):
+        for count in range(1, 3):
+            active_bid = Bid(Die(face), count, None, 10)
+            bid = bot.play_turn(active_bid, 10)
+
+            if bid is not None:
+                assert Bid.is_higher(bid, active_bid) == True
+
+
+def test_probability_bot_play_turn_bad_count_all_active_dice():
+    bot = ProbabilityBot("Bot1")
+
+    with pytest.raises(ValueError):
+        bot.play_turn(None, 1)
+
+    with pytest.raises(TypeError):
+        bot.play_turn(None, 5.0)
+
+
 # Tests for Round class
 def test_round_init_default_case():
     p1 = Human("Player1")
@@ -369,6 +645,43 @@ def test_round_init_default_case():
     assert isinstance(Round(2, players, p2), Round)
 
 
+def test_round_trusted():
+    p1 = Human("Player1")
+    p2 = Bot("Bot1")
+
+    r = Round.trusted(3, [p1, p2], p2)
+    assert isinstance(r, Round)
+    assert r.number == 3
+    assert r.players == [p1, p2]
+    assert r.whose_turn == p2
+    assert r.active_bid is None
+    assert r.active_bidder is None
+    assert r.round_loser is None
+
+
+def test_round_set_active_bid_trusted():
+    p1 = Human("Player1")
+    p2 = Bot("Bot1")
+
+    r = Round(1, [p1, p2], p1)
+    r.set_active_bid_trusted(Bid(Die(2), 3), p1)
+    assert r.active_bid == Bid(Die(2), 3)
+    assert r.active_bidder == p1
+
+
+def test_round_set_round_loser_trusted():
+    p1 = Human("Player1")
+    p2 = Bot("Bot1")
+
+    r = Round(1, [p1, p2], p1)
+    r.set_round_loser_trusted(p2)
+    assert r.round_loser == p2
+
+    # The loser can't change afterwards
+    r.set_round_loser_trusted(p1)
+    assert r.round_loser == p2
+
+
 def test_round_init_no_args():
     with pytest.raises(TypeError):
         Round()
@@ -688,48 +1001,48 @@ def test_round_evaluate_challenge():
     type(r)._active_bidder = PropertyMock(return_value=p1)
 
     # Test successful challenge - classic rules
-    type(p1)._hand = PropertyMock(return_value=[Die(2), Die(2), Die(2), Die(2), Die(2)])
-    type(p2)._hand = PropertyMock(return_value=[Die(2), Die(2), Die(2), Die(2), Die(2)])
-    type(p3)._hand = PropertyMock(return_value=[Die(2), Die(2), Die(2), Die(2), Die(2)])
+    type(p1)._hand = PropertyMock(return_value=Hand([2, 2, 2, 2, 2]))
+    type(p2)._hand = PropertyMock(return_value=Hand([2, 2, 2, 2, 2]))
+    type(p3)._hand = PropertyMock(return_value=Hand([2, 2, 2, 2, 2]))
 
     assert r.evaluate_challenge(b1, False) == True
 
     # Test successful challenge - wild 1s
-    type(p1)._hand = PropertyMock(return_value=[Die(1), Die(2), Die(2), Die(2), Die(2)])
-    p2._hand = [Die(1), Die(2), Die(2), Die(2), Die(2)]
-    p3._hand = [Die(2), Die(2), Die(2), Die(2), Die(2)]
+    type(p1)._hand = PropertyMock(return_value=Hand([1, 2, 2, 2, 2]))
+    p2._hand = Hand([1, 2, 2, 2, 2])
+    p3._hand = Hand([2, 2, 2, 2, 2])
 
     assert r.evaluate_challenge(b1, True) == True
 
     # Test unsuccessful challenge - classic rules
-    type(p1)._hand = PropertyMock(return_value=[Die(5), Die(2), Die(2), Die(2), Die(2)])
-    type(p2)._hand = PropertyMock(return_value=[Die(5), Die(2), Die(2), Die(2), Die(2)])
-    type(p3)._hand = PropertyMock(return_value=[Die(5), Die(2), Die(2), Die(2), Die(2)])
+    type(p1)._hand = PropertyMock(return_value=Hand([5, 2, 2, 2, 2]))
+    type(p2)._hand = PropertyMock(return_value=Hand([5, 2, 2, 2, 2]))
+    type(p3)._hand = PropertyMock(return_value=Hand([5, 2, 2, 2, 2]))
 
     assert r.evaluate_challenge(b1, False) == False
 
-    type(p1)._hand = PropertyMock(return_value=[Die(5), Die(5), Die(2), Die(2), Die(2)])
-    type(p2)._hand = PropertyMock(return_value=[Die(5), Die(2), Die(2), Die(2), Die(2)])
-    type(p3)._hand = PropertyMock(return_value=[Die(5), Die(2), Die(2), Die(2), Die(2)])
+    type(p1)._hand = PropertyMock(return_value=Hand([5, 5, 2, 2, 2]))
+    type(p2)._hand = PropertyMock(return_value=Hand([5, 2, 2, 2, 2]))
+    type(p3)._hand = PropertyMock(return_value=Hand([5, 2, 2, 2, 2]))
 
     assert r.evaluate_challenge(b1, False) == False
 
     # Test unsuccessful challenge - wild 1s
-    type(p1)._hand = PropertyMock(return_value=[Die(5), Die(2), Die(2), Die(2), Die(2)])
-    p2._hand = [Die(5), Die(2), Die(2), Die(2), Die(2)]
-    p3._hand = [Die(1), Die(2), Die(2), Die(2), Die(2)]
+    type(p1)._hand = PropertyMock(return_value=Hand([5, 2, 2, 2, 2]))
+    p2._hand = Hand([5, 2, 2, 2, 2])
+    p3._hand = Hand([1, 2, 2, 2, 2])
 
     assert r.evaluate_challenge(b1, True) == False
 
-    type(p1)._hand = PropertyMock(return_value=[Die(5), Die(2), Die(2), Die(2), Die(2)])
-    type(p2)._hand = PropertyMock(return_value=[Die(1), Die(2), Die(2), Die(2), Die(2)])
-    type(p3)._hand = PropertyMock(return_value=[Die(1), Die(2), Die(2), Die(2), Die(2)])
+    type(p1)._hand = PropertyMock(return_value=Hand([5, 2, 2, 2, 2]))
+    type(p2)._hand = PropertyMock(return_value=Hand([1, 2, 2, 2, 2]))
+    type(p3)._hand = PropertyMock(return_value=Hand([1, 2, 2, 2, 2]))
 
     assert r.evaluate_challenge(b1, True) == False
 
-    type(p1)._hand = PropertyMock(return_value=[Die(1), Die(2), Die(2), Die(2), Die(2)])
-    type(p2)._hand = PropertyMock(return_value=[Die(1), Die(2), Die(2), Die(2), Die(2)])
-    type(p3)._hand = PropertyMock(return_value=[Die(1), Die(2), Die(2), Die(2), Die(2)])
+    type(p1)._hand = PropertyMock(return_value=Hand([1, 2, 2, 2, 2]))
+    type(p2)._hand = PropertyMock(return_value=Hand([1, 2, 2, 2, 2]))
+    type(p3)._hand = PropertyMock(return_value=Hand([1, 2, 2, 2, 2]))
 
     assert r.evaluate_challenge(b1, True) == False
 
@@ -868,29 +1181,47 @@ def test_game_add_round():
             assert r.number == i
 
 
+@pytest.mark.usefixtures("pristine_liarsdice")
 def test_game_count_players_with_remaining_dice():
     game = Game(False)
 
     p1 = Human("Player1")
     p2 = Bot("Bot1")
+    p3 = Bot("Bot2")
 
     with pytest.raises(TypeError):
         game.count_players_with_remaining_dice()
 
-    game.players = [p1, p2]
+    game.players = [p1, p2, p3]
+    assert game.count_players_with_remaining_dice() == 3
+    assert game.count_of_all_dice == 15
+
+    for _ in range(5):
+        p1.lose_a_die()
     assert game.count_players_with_remaining_dice() == 2
+    assert game.count_of_all_dice == 10
 
-    type(p1)._dice_left = PropertyMock(return_value=0)
-    type(p2)._dice_left = PropertyMock(return_value=0)
-    assert game.count_players_with_remaining_dice() == 0
+    # Losing a die with no dice left changes nothing
+    p1.lose_a_die()
+    p2.lose_a_die()
+    assert game.count_players_with_remaining_dice() == 2
+    assert game.count_of_all_dice == 9
 
-    type(p1)._dice_left = PropertyMock(return_value=1)
-    type(p2)._dice_left = PropertyMock(return_value=0)
+    for _ in range(4):
+        p2.lose_a_die()
     assert game.count_players_with_remaining_dice() == 1
+    assert game.count_of_all_dice == 5
 
-    type(p1)._dice_left = PropertyMock(return_value=0)
-    type(p2)._dice_left = PropertyMock(return_value=1)
-    assert game.count_players_with_remaining_dice() == 1
+    # Rounds of the game read the game's count
+    round = game.add_round()
+    assert round.get_count_of_all_active_dice() == 5
+    p3.lose_a_die()
+    assert round.get_count_of_all_active_dice() == 4
+
+    # Resetting a player detaches them from the game
+    p3.reset()
+    p3.lose_a_die()
+    assert game.count_of_all_dice == 4
 
 
 def test_game_players_setter():
@@ -1000,3 +1331,314 @@ def test_game_winner_setter():
     type(p3)._dice_left = PropertyMock(return_value=0)
     game.winner = p1
     assert game.winner == p1
+
+
+def test_game_add_listener():
+    game = Game(False)
+    assert game.has_listeners == False
+
+    with pytest.raises(TypeError):
+        game.add_listener(None)
+
+    events = []
+    game.add_listener(events.append)
+    assert game.has_listeners == True
+
+    game.emit((Event.WINNER, 0))
+    assert events == [(Event.WINNER, 0)]
+
+
+def _play_game_where_p1_loses(game):
+    p1 = Player("Player_1")
+    p2 = Player("Player_2")
+    game.players = [p1, p2]
+
+    while p1.dice_left > 0:
+        round = game.add_round()
+        round.set_active_bid_trusted(Bid.trusted(6, 2), round.whose_turn)
+        p1.lose_a_die()
+        round.set_round_loser_trusted(p1)
+
+    game.winner = p2
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_game_history():
+    game = Game(False)
+    _play_game_where_p1_loses(game)
+    assert [r.number for r in game.rounds] == [1, 2, 3, 4, 5]
+    assert game.count_of_rounds == 5
+    assert game.summaries is None
+
+    game = Game(False, history=2)
+    assert game.count_of_rounds == 0
+    _play_game_where_p1_loses(game)
+    assert [r.number for r in game.rounds] == [4, 5]
+    assert game.count_of_rounds == 5
+    assert str(game).startswith("The game ended in round #5")
+
+    game = Game(False, history=HISTORY_SUMMARIES)
+    _play_game_where_p1_loses(game)
+    assert [r.number for r in game.rounds] == [5]
+    assert game.summaries == [
+        RoundSummary(n, 0, Bid(Die(6), 2), (5 - n, 5)) for n in range(1, 6)
+    ]
+
+
+def test_game_history_bad_args():
+    for history in [0, -1]:
+        with pytest.raises(ValueError):
+            Game(False, history=history)
+
+    for history in ["some", True, 1.5, None]:
+        with pytest.raises(ValueError):
+            Game(False, history=history)
+
+
+# Tests that need the classes without the mocks left by the tests above
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_round_face_counts():
+    players = [Player("Player1"), Player("Player2"), Player("Player3")]
+    players[2].lose_a_die()
+
+    r = Round(1, players, players[0])
+    assert r.face_counts is None
+
+    r.draw_hands()
+    assert sum(r.face_counts) == 14
+    for i in range(6):
+        assert r.face_counts[i] == sum(p.hand_counts[i] for p in players)
+
+    # The counts give the same result as counting each hand
+    r2 = Round(1, players, players[0])
+    for face in range(1, 7):
+        for count in range(1, 15):
+            for wild_1s in [False, True]:
+                bid = Bid(Die(face), count)
+                assert r.evaluate_challenge(bid, wild_1s) == r2.evaluate_challenge(
+                    bid, wild_1s
+                )
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_game_seat_ring():
+    players = [Player(f"Player{i}") for i in range(4)]
+    game = Game(False)
+    game.players = players
+
+    round = game.add_round()
+    for p in players[1:] + players[:2]:
+        round.rotate_turn()
+        assert round.whose_turn is p
+
+    # The challenger (Player1) loses their last die - the next round starts with Player2
+    for _ in range(5):
+        players[1].lose_a_die()
+    round.set_round_loser_trusted(players[1])
+
+    round = game.add_round()
+    assert round.whose_turn is players[2]
+    for p in [players[3], players[0], players[2]]:
+        round.rotate_turn()
+        assert round.whose_turn is p
+
+    # The bidder (Player3) loses their last die, while it's Player0's turn - the next round starts with Player2
+    round.rotate_turn()
+    round.rotate_turn()
+    assert round.whose_turn is players[0]
+    for _ in range(5):
+        players[3].lose_a_die()
+    round.set_round_loser_trusted(players[3])
+
+    round = game.add_round()
+    assert round.players == [players[0], players[2]]
+    assert round.whose_turn is players[2]
+    round.rotate_turn()
+    assert round.whose_turn is players[0]
+    round.rotate_turn()
+    assert round.whose_turn is players[2]
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_game_table_sizes():
+    game = Game(False, max_players=50, dice_per_player=10, faces_per_die=10)
+    assert (game.max_players, game.dice_per_player, game.faces_per_die) == (50, 10, 10)
+
+    players = [Player(f"Player{i}") for i in range(50)]
+    game.players = players
+    assert game.count_of_all_dice == 500
+    assert all(p.dice_left == 10 for p in players)
+
+    round = game.add_round()
+    round.draw_hands()
+    assert len(round.face_counts) == 10
+    assert sum(round.face_counts) == 500
+    for p in players:
+        assert len(p.hand) == 10
+        assert len(p.hand_counts) == 10
+        assert max(p.hand_faces) <= 10
+
+    for p in players[1:] + players[:1]:
+        round.rotate_turn()
+        assert round.whose_turn is p
+
+    with pytest.raises(ValueError):
+        Game(False).players = [Player(f"Player{i}") for i in range(6)]
+
+
+def test_game_table_sizes_bad_args():
+    with pytest.raises(TypeError):
+        Game(False, max_players="5")
+
+    with pytest.raises(ValueError):
+        Game(False, max_players=1)
+
+    with pytest.raises(ValueError):
+        Game(False, dice_per_player=0)
+
+    with pytest.raises(ValueError):
+        Game(False, faces_per_die=1)
+
+    with pytest.raises(ValueError):
+        Game(False, faces_per_die=Die.MAX_FACES + 1)
+
+    with pytest.raises(ValueError):
+        Game(False, max_players=Bid.MAX_COUNT, dice_per_player=2)
+
+
+def test_die_faces_per_die():
+    assert Die(8, 10) is Die(8, 10)
+    assert Die(3, 10) is Die(3)
+
+    with pytest.raises(ValueError):
+        Die(11, 10)
+
+    # A die above 6 shows its number
+    assert "|  12   |" in Die.stringify_faces(bytes([12, 1]), 20)
+
+    h = Hand([10, 7, 7], 10)
+    assert h.counts == (0, 0, 0, 0, 0, 0, 2, 0, 0, 1)
+    assert h.most_common_face() == 7
+    assert [d.face for d in h] == [10, 7, 7]
+
+    with pytest.raises(ValueError):
+        Hand([7])
+
+    faces = Hand.roll_faces(20000, 20)
+    assert set(faces) == set(range(1, 21))
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_game_rng():
+    assert Game(False).rng is random
+
+    with pytest.raises(TypeError):
+        Game(False, rng=42)
+
+    # Games with the same seed roll the same dice, whatever happens to the global random state
+    hands = []
+    for seed in [1, 1, 2]:
+        game = Game(False, rng=random.Random(seed))
+        game.players = [Bot("Bot1"), Bot("Bot2")]
+        random.seed(seed * 10)
+
+        round = game.add_round()
+        round.draw_hands()
+        hands.append([p.hand_faces for p in game.players])
+
+    assert hands[0] == hands[1]
+    assert hands[0] != hands[2]
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_game_players_deals_dice_per_player():
+    # Players who lost dice (e.g. in a previous game) start a new game with the table's dice_per_player
+    bots = [Bot("Bot1"), Bot("Bot2")]
+    bots[0]._dice_left = 1
+    bots[1]._dice_left = 0
+
+    game = Game(False, dice_per_player=3)
+    game.players = bots
+    assert [p.dice_left for p in bots] == [3, 3]
+    assert game.count_of_all_dice == 6
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_die_faces_per_die_type():
+    with pytest.raises(TypeError):
+        Die(3, "6")
+
+    with pytest.raises(TypeError):
+        Die(3, 6.0)
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_flyweights_shared_across_threads():
+    # Threads that create the same (new) dice & bids at once all get the same objects
+    def create(_):
+        return [Bid(Die(2, 200), count) for count in range(3000, 4000)] + [
+            Die(face, 255) for face in range(100, 256)
+        ]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(create, range(8)))
+
+    for objects in zip(*results):
+        assert all(o is objects[0] for o in objects)
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_flyweight_subclasses():
+    class MyDie(Die):
+        __slots__ = ()
+
+    class MyBid(Bid):
+        __slots__ = ()
+
+    # Subclasses aren't interned, and don't take the place of the shared objects
+    assert type(MyDie(3)) is MyDie
+    assert MyDie(3) is not MyDie(3)
+    assert type(MyDie.trusted(3)) is MyDie
+    assert type(Die(3)) is Die
+
+    assert type(MyBid(Die(3), 2)) is MyBid
+    assert type(MyBid.trusted(3, 2)) is MyBid
+    assert type(Bid(Die(3), 2)) is Bid
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_player_pickled_without_game():
+    # A game with the default rng (the random module) can't be pickled, but its players can
+    bots = [Bot("Bot1"), Bot("Bot2")]
+    game = Game(False)
+    game.players = bots
+    game.add_round().draw_hands()
+
+    copy = pickle.loads(pickle.dumps(bots[0]))
+    assert copy.name == "Bot1"
+    assert copy.dice_left == bots[0].dice_left
+    assert copy.hand == bots[0].hand
+    assert copy._game is None
+    assert bots[0]._game is game
+
+
+@pytest.mark.usefixtures("pristine_liarsdice")
+def test_probability_bot_plays_by_the_game_rules():
+    bot = ProbabilityBot("Bot1")
+    assert bot.wild_1s is False
+
+    game = Game(True)
+    game.players = [bot, Bot("Bot2")]
+    assert bot.wild_1s is True
+
+    # Seated at a game with wild 1s, it plays just like a bot created with wild_1s=True
+    wild_bot = ProbabilityBot("Bot3", wild_1s=True)
+    bot._hand = wild_bot._hand = Hand([1, 1, 1, 2, 5])
+    assert bot.play_turn(Bid(Die(5), 4), 10) is wild_bot.play_turn(Bid(Die(5), 4), 10)
+    assert bot.play_turn(Bid(Die(5), 4), 10) is not None
+
+    # Out of the game, it goes back to its own rules
+    bot.reset()
+    bot._hand = Hand([1, 1, 1, 2, 5])
+    assert bot.wild_1s is False
+    assert bot.play_turn(Bid(Die(5), 4), 10) is None
@@ -0,0 +1,106 @@
+import pickle
+import time
+
+import pytest
+
+from liarsdice import Bid, Bot, Die, Event, Hand
+from montecarlo import MonteCarloBot
+from simulation import simulate_games
+
+pytestmark = pytest.mark.usefixtures("pristine_liarsdice")
+
+
+def test_monte_carlo_bot_play_turn():
+    bot = MonteCarloBot("Bot_0", samples=512)
+    bot._hand = Hand([3, 3, 4, 5, 5])
+
+    # A bid that's sure to be true is raised, and one that's sure to be a lie is challenged
+    for _ in range(20):
+        assert bot.play_turn(Bid(Die(3), 2), 10) is not None
+        assert bot.play_turn(Bid(Die(6), 10), 10) is None
+    assert bot.samples_taken == 512
+
+    # The first bid is on a face the bot has
+    assert bot.play_turn(None, 10) in (Bid(Die(3), 1), Bid(Die(5), 1))
+
+    # With wild 1s, the 1s count towards the bid
+    bot = MonteCarloBot("Bot_1", wild_1s=True)
+    bot._hand = Hand([1, 1, 1, 2, 2])
+    assert bot.play_turn(Bid(Die(6), 3), 6) is not None
+
+
+def test_monte_carlo_bot_time_budget():
+    bot = MonteCarloBot("Bot_0", samples=10**9, time_budget=0.002, batch_size=64)
+    bot._hand = Hand([1, 2, 3, 4, 5])
+
+    start = time.perf_counter()
+    bot.play_turn(Bid(Die(2), 4), 25)
+    assert time.perf_counter() - start < 0.1
+    assert 64 <= bot.samples_taken < 10**9
+    assert bot.samples_taken % 64 == 0
+
+
+def test_monte_carlo_bot_observe():
+    bot = MonteCarloBot("Bot_0")
+    bot.observe((Event.BID, 1, 3, 2))
+    bot.observe((Event.BID, 2, 4, 2))
+    assert bot._bids == [(1, 3, 2), (2, 4, 2)]
+
+    bot.observe((Event.ROUND_START, 2, 1))
+    assert bot._bids == []
+
+
+def test_monte_carlo_bot_game():
+    bots = [MonteCarloBot("Bot_0", samples=256), Bot("Bot_1"), Bot("Bot_2")]
+    a = simulate_games(bots, False, 5, 30)
+    b = simulate_games(bots, False, 5, 30)
+    assert a == b
+
+    # It follows the bids of each game it plays in
+    assert bots[0]._followed_game is not None
+
+    # And wins most of its games against the baseline bots
+    assert sum(r.winner == 0 for r in a) > 20
+
+
+def test_monte_carlo_bot_plays_by_the_game_rules():
+    bot = MonteCarloBot("Bot_0", samples=64)
+    simulate_games([bot, Bot("Bot_1")], True, 3, 1)
+    assert bot.wild_1s is True
+
+    bot.reset()
+    assert bot.wild_1s is False
+
+
+def test_monte_carlo_bot_pickled_without_game():
+    bot = MonteCarloBot("Bot_0", samples=64)
+    simulate_games([bot, Bot("Bot_1")], False, 3, 2)
+    assert bot._followed_game is not None
+
+    copy = pickle.loads(pickle.dumps(bot))
+    assert copy._game is None and copy._followed_game is None
+    assert copy.samples == 64
+
+
+def test_monte_carlo_bot_bad_args():
+    with pytest.raises(TypeError):
+        MonteCarloBot("Bot_0", wild_1s=1)
+    with pytest.raises(ValueError):
+        MonteCarloBot("Bot_0", challenge_threshold=2)
+    with pytest.raises(ValueError):
+        MonteCarloBot("Bot_0", trust=-1)
+    with pytest.raises(TypeError):
+        MonteCarloBot("Bot_0", samples=1.5)
+    with pytest.raises(ValueError):
+        MonteCarloBot("Bot_0", samples=0)
+    with pytest.raises(TypeError):
+        MonteCarloBot("Bot_0", time_budget="1ms")
+    with pytest.raises(ValueError):
+        MonteCarloBot("Bot_0", time_budget=0)
+
+    bot = MonteCarloBot("Bot_0")
+    bot._hand = Hand([1, 2])
+    with pytest.raises(TypeError):
+        bot.play_turn(None, "3")
+    with pytest.raises(ValueError):
+        bot.play_turn(None, 1)
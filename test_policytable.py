@@ -0,0 +1,143 @@
+import random
+
+import numpy as np
+import pytest
+
+from liarsdice import Bid, Die, Hand, ProbabilityBot
+from policytable import PolicyBot, PolicyStrategy, PolicyTable, compile_policy
+from simulation import simulate_games
+from strategy import BaselineStrategy, ProbabilityStrategy, turn_states
+from vectorized import simulate_games_lockstep
+
+pytestmark = pytest.mark.usefixtures("pristine_liarsdice")
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("policy") / "probability.tbl"
+    compile_policy(ProbabilityStrategy(True), path, dice_per_player=3, max_players=4)
+    return path
+
+
+def test_policy_table(table_path):
+    table = PolicyTable(table_path)
+    assert table.dice_per_player == 3
+    assert table.faces_per_die == 6
+    assert table.max_dice_in_play == 12
+
+    # The table is only mapped on the first lookup
+    assert not table.mapped
+    assert table.lookup((0, 0, 3, 0, 0, 0), None, 6) is Bid(Die(3), 1)
+    assert table.mapped
+    assert table.lookup((0, 0, 3, 0, 0, 0), Bid(Die(6), 12), 12) is None
+
+    table.close()
+    assert not table.mapped
+
+
+def test_policy_bot_matches_probability_bot(table_path):
+    random.seed(2)
+    policy_bot = PolicyBot("Bot_0", table_path)
+    probability_bot = ProbabilityBot("Bot_1", wild_1s=True)
+
+    for _ in range(2000):
+        hand = Hand([random.randint(1, 6) for _ in range(random.randint(1, 3))])
+        dice_in_play = random.randint(len(hand) + 1, len(hand) + 9)
+
+        active_bid = None
+        if random.random() > 0.2:
+            active_bid = Bid(Die(random.randint(1, 6)), random.randint(1, dice_in_play))
+
+        policy_bot._hand = hand
+        probability_bot._hand = hand
+        assert policy_bot.play_turn(active_bid, dice_in_play) is (
+            probability_bot.play_turn(active_bid, dice_in_play)
+        )
+
+
+def test_policy_strategy(table_path):
+    strategy = PolicyStrategy(PolicyTable(table_path))
+    a = simulate_games_lockstep([strategy] * 3, True, 4, 500, dice_per_player=3)
+    b = simulate_games_lockstep(
+        [ProbabilityStrategy(True)] * 3, True, 4, 500, dice_per_player=3
+    )
+
+    for x, y in zip(a, b):
+        assert x.tolist() == y.tolist()
+
+
+def test_policy_bot_game(table_path):
+    bots = [PolicyBot(f"Bot_{i}", PolicyTable(table_path)) for i in range(4)]
+    results = simulate_games(bots, True, 1, 20, dice_per_player=3)
+
+    assert len(results) == 20
+    assert all(r.rounds >= 9 for r in results)
+
+
+def test_compile_policy_rng(tmp_path):
+    # A random strategy is sampled from the rng passed to compile_policy()
+    tables = [
+        compile_policy(
+            BaselineStrategy(),
+            tmp_path / f"baseline_{i}.tbl",
+            dice_per_player=2,
+            max_players=2,
+            rng=np.random.default_rng(4),
+        )
+        for i in range(2)
+    ]
+    assert tables[0].path.read_bytes() == tables[1].path.read_bytes()
+
+    with pytest.raises(TypeError):
+        compile_policy(BaselineStrategy(), tmp_path / "baseline.tbl", dice_per_player=2)
+
+
+def test_policy_table_bad_args(table_path, tmp_path):
+    path = tmp_path / "not_a_table"
+    path.write_bytes(b"LDPX" + bytes(20))
+    with pytest.raises(ValueError):
+        PolicyTable(path)
+
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        PolicyTable(path)
+
+    with pytest.raises(TypeError):
+        compile_policy(ProbabilityBot("Bot_0"), tmp_path / "table")
+    with pytest.raises(ValueError):
+        compile_policy(ProbabilityStrategy(), tmp_path / "table", max_players=1)
+
+    with pytest.raises(TypeError):
+        PolicyBot("Bot_0", None)
+    with pytest.raises(TypeError):
+        PolicyStrategy(table_path)
+
+    table = PolicyTable(table_path)
+    with pytest.raises(ValueError):
+        table.lookup((0, 0, 3, 0, 0, 0), None, 13)
+    with pytest.raises(ValueError):
+        table.lookup((1, 1, 1, 1, 0, 0), None, 10)
+
+    # A single die can't be one of 12 dice in play, with 4 players of up to 3 dice
+    with pytest.raises(ValueError):
+        table.lookup((1, 0, 0, 0, 0, 0), None, 12)
+    with pytest.raises(ValueError):
+        table.lookup((1, 0, 0, 0, 0, 0), Bid(Die(7, 10), 1), 6)
+
+    # Batches with values out of the table's ranges are rejected, instead of aliasing other entries
+    for hand_counts, active_bid, dice_in_play in [
+        ((0, 0, 3, 0, 0, 0), None, -1),
+        ((0, 0, 3, 0, 0, 0), None, 13),
+        ((0, 0, 4, 0, 0, 0), None, 6),
+        ((0, 0, 3, 0, 0, 0, 0), None, 6),
+        ((0, 0, 0, 0, 0, 0), None, 6),
+        ((0, 0, 3, 0, 0, 0), Bid(Die(3), 13), 6),
+        ((0, 0, 3, 0, 0, 0), Bid(Die(7, 10), 1), 6),
+    ]:
+        with pytest.raises(ValueError):
+            table.lookup_batch(turn_states([hand_counts], [active_bid], [dice_in_play]))
+
+    # Truncated tables are rejected when they're opened
+    path.write_bytes(table_path.read_bytes()[:-2])
+    with pytest.raises(ValueError):
+        PolicyTable(path)
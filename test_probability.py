@@ -0,0 +1,100 @@
+import itertools
+import pytest
+from fractions import Fraction
+from math import comb
+
+from probability import (
+    P_FACE,
+    P_FACE_OR_WILD,
+    binomial_tail_row,
+    binomial_tail_table,
+    probability_of_at_least,
+    probability_of_bid,
+)
+
+
+def test_binomial_tail_table():
+    table = binomial_tail_table(5, P_FACE)
+    assert len(table) == 6
+
+    for n, row in enumerate(table):
+        assert len(row) == n + 2
+        assert row[0] == 1.0
+        assert row[n + 1] == 0.0
+
+        # Tails can only go down
+        for k in range(n + 1):
+            assert row[k] >= row[k + 1]
+
+    assert table[1][1] == pytest.approx(1 / 6)
+    assert table[2][2] == pytest.approx(1 / 36)
+    assert table[2][1] == pytest.approx(11 / 36)
+
+    # The tables are only built once
+    assert binomial_tail_table(5, P_FACE) is table
+
+
+def test_binomial_tail_row():
+    assert binomial_tail_row(2, P_FACE) == binomial_tail_table(5, P_FACE)[2]
+
+    # Rows for many dice are built on their own, without the rows below them
+    row = binomial_tail_row(60000, P_FACE)
+    assert len(row) == 60002
+    assert row[10000] == pytest.approx(0.5, abs=0.01)
+
+    # Wild 1s on 2-faced dice always match
+    assert binomial_tail_row(3, 1.0) == (1.0, 1.0, 1.0, 1.0, 0.0)
+
+
+def test_probability_of_at_least():
+    assert probability_of_at_least(0, 10, P_FACE) == 1.0
+    assert probability_of_at_least(-3, 10, P_FACE) == 1.0
+    assert probability_of_at_least(11, 10, P_FACE) == 0.0
+    assert probability_of_at_least(1, 0, P_FACE) == 0.0
+
+    assert probability_of_at_least(3, 3, P_FACE_OR_WILD) == pytest.approx(1 / 27)
+
+    # Beyond the default table size
+    assert probability_of_at_least(40, 40, P_FACE) == pytest.approx((1 / 6) ** 40)
+
+
+def test_probability_of_at_least_many_dice():
+    # comb(n, k) doesn't fit in a float for these n, so the tails can't be computed with it directly
+    for count, count_of_unknown_dice in [(100, 1100), (350, 2000), (400, 2000)]:
+        exact = (
+            sum(
+                Fraction(
+                    comb(count_of_unknown_dice, k) * 5 ** (count_of_unknown_dice - k)
+                )
+                for k in range(count, count_of_unknown_dice + 1)
+            )
+            / 6**count_of_unknown_dice
+        )
+
+        assert probability_of_at_least(
+            count, count_of_unknown_dice, P_FACE
+        ) == pytest.approx(float(exact), rel=1e-9)
+
+
+def test_probability_of_bid_matches_enumeration():
+    hand_counts = (1, 0, 2, 0, 0, 0)  # One 1, and two 3s
+    count_of_unknown_dice = 3
+
+    for wild_1s in [False, True]:
+        for face in range(1, 7):
+            for count in range(1, 7):
+                count_true = 0
+                count_all = 0
+                for unknown in itertools.product(
+                    range(1, 7), repeat=count_of_unknown_dice
+                ):
+                    all_faces = list(unknown) + [1, 3, 3]
+                    matching = sum(
+                        1 for f in all_faces if f == face or (wild_1s and f == 1)
+                    )
+                    count_true += matching >= count
+                    count_all += 1
+
+                assert probability_of_bid(
+                    face, count, hand_counts, count_of_unknown_dice, wild_1s
+                ) == pytest.approx(count_true / count_all)
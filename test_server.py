@@ -0,0 +1,127 @@
+import asyncio
+import threading
+
+import pytest
+
+from liarsdice import Bid, Bot, Die, Event, Human, ProbabilityBot
+from server import TableManager
+from simulation import game_rng, simulate_games
+
+pytestmark = pytest.mark.usefixtures("pristine_liarsdice")
+
+
+def test_table_manager_bot_tables():
+    async def play():
+        manager = TableManager()
+        for i in range(200):
+            bots = [Bot(f"Bot1_{i}"), Bot(f"Bot2_{i}"), ProbabilityBot(f"Bot3_{i}")]
+            manager.open_table(bots, True, rng=game_rng(5, i))
+
+        assert len(manager.tables) == 200
+        return await manager.join()
+
+    results = asyncio.run(play())
+
+    # The tables play the same games as a simulation with the same seeds
+    bots = [Bot("Bot1"), Bot("Bot2"), ProbabilityBot("Bot3")]
+    assert [results[i] for i in range(200)] == simulate_games(bots, True, 5, 200)
+
+
+def test_table_manager_human_table():
+    async def client(table, human):
+        count_of_turns = 0
+        while True:
+            request = await table.next_turn(human)
+            if request is None:
+                return count_of_turns
+
+            count_of_turns += 1
+            assert request.hand == human.hand
+
+            if request.active_bid is None:
+                with pytest.raises(ValueError):
+                    request.challenge()
+
+                with pytest.raises(ValueError):
+                    request.respond(Bid(Die(1), request.count_all_active_dice + 1))
+
+                # The table plays with 6-faced dice
+                with pytest.raises(ValueError):
+                    request.respond(Bid(Die(7, 10), 1))
+
+                request.respond(Bid(Die(1), 1))
+            else:
+                with pytest.raises(ValueError):
+                    request.respond(request.active_bid)
+
+                request.challenge()
+
+            assert request.answered
+
+    async def play():
+        manager = TableManager()
+        human = Human("Human_Player")
+        events = []
+        table = manager.open_table(
+            [human, Bot("Bot1"), Bot("Bot2")], False, listener=events.append
+        )
+
+        with pytest.raises(ValueError):
+            manager.open_table([human, Bot("Bot3")], False)
+
+        count_of_turns, results = await asyncio.gather(
+            client(table, human), manager.join()
+        )
+        return count_of_turns, results[table.table_id], events
+
+    count_of_turns, result, events = asyncio.run(play())
+
+    assert count_of_turns > 0
+    assert sum(e[0] == Event.ROUND_START for e in events) == result.rounds
+    assert events[-1] == (Event.WINNER, result.winner)
+
+
+def test_table_manager_answers_from_threads():
+    async def play():
+        manager = TableManager()
+        human = Human("Human_Player")
+        table = manager.open_table([human, Bot("Bot1")], False)
+
+        while True:
+            request = await table.next_turn(human)
+            if request is None:
+                break
+
+            # The answer comes from another thread
+            if request.active_bid is None:
+                answer = lambda: request.respond(Bid(Die(6), 1))
+            else:
+                answer = request.challenge
+            thread = threading.Thread(target=answer)
+            thread.start()
+            thread.join()
+
+        return await table.result()
+
+    result = asyncio.run(play())
+    assert 0 <= result.winner <= 1
+
+
+def test_table_manager_close_table():
+    async def play():
+        manager = TableManager()
+        human = Human("Human_Player")
+        table = manager.open_table([human, Bot("Bot1")], False)
+
+        # The human never plays, so the game waits for them until the table is closed
+        await asyncio.sleep(0)
+        manager.close_table(table.table_id)
+        assert manager.tables == []
+
+        assert await table.next_turn(human) is not None
+        assert await table.next_turn(human) is None
+
+        # The human can sit at another table
+        manager.open_table([human, Bot("Bot2")], False)
+
+    asyncio.run(play())
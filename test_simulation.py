@@ -0,0 +1,172 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from eventlog import EventLogWriter
+from liarsdice import Bot, Human, ProbabilityBot
+from simulation import (
+    GameResult,
+    game_rng,
+    play_game,
+    run_tournament,
+    simulate_games,
+)
+
+pytestmark = pytest.mark.usefixtures("pristine_liarsdice")
+
+
+def test_simulate_games_default_case():
+    bots = [Bot("Bot1"), Bot("Bot2"), Bot("Bot3")]
+
+    for wild_1s in [False, True]:
+        results = simulate_games(bots, wild_1s, 42, 20)
+        assert len(results) == 20
+
+        for r in results:
+            assert isinstance(r, GameResult)
+            assert 0 <= r.winner < len(bots)
+            assert r.rounds == len(r.bids_per_round)
+
+            # The first player in each round always has to bid
+            for count_of_bids in r.bids_per_round:
+                assert count_of_bids >= 1
+
+
+def test_simulate_games_is_deterministic():
+    bots = [Bot("Bot1"), Bot("Bot2"), Bot("Bot3"), Bot("Bot4")]
+
+    assert simulate_games(bots, False, 7, 10) == simulate_games(bots, False, 7, 10)
+    assert simulate_games(bots, False, 7, 10) != simulate_games(bots, False, 8, 10)
+
+
+def test_simulate_games_replay_single_game():
+    bots = [Bot("Bot1"), Bot("Bot2"), ProbabilityBot("Bot3")]
+    results = simulate_games(bots, True, 11, 5)
+
+    assert play_game(bots, True, rng=game_rng(11, 3)) == results[3]
+
+
+def test_simulate_games_leaves_global_random_alone():
+    state = random.getstate()
+    simulate_games([Bot("Bot1"), Bot("Bot2")], False, 5, 5)
+    assert random.getstate() == state
+
+
+def test_simulate_games_in_threads():
+    def simulate(seed):
+        return simulate_games([Bot("Bot1"), Bot("Bot2"), Bot("Bot3")], False, seed, 20)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(simulate, range(8)))
+
+    assert results == [simulate(seed) for seed in range(8)]
+
+
+def test_simulate_games_bad_args():
+    with pytest.raises(TypeError):
+        simulate_games(None, False, 1, 1)
+
+    with pytest.raises(TypeError):
+        simulate_games([Bot("Bot1"), Human("Player1")], False, 1, 1)
+
+    with pytest.raises(TypeError):
+        simulate_games([Bot("Bot1"), Bot("Bot2")], False, "1", 1)
+
+    with pytest.raises(TypeError):
+        simulate_games([Bot("Bot1"), Bot("Bot2")], False, 1, 1.0)
+
+    with pytest.raises(ValueError):
+        simulate_games([Bot("Bot1"), Bot("Bot2")], False, 1, -1)
+
+    with pytest.raises(ValueError):
+        simulate_games([Bot("Bot1")], False, 1, 1)
+
+
+def test_play_game_loses_one_die_per_round():
+    bots = [Bot("Bot1"), Bot("Bot2")]
+    r = play_game(bots, False)
+
+    assert bots[r.winner].dice_left > 0
+    assert bots[1 - r.winner].dice_left == 0
+    assert r.rounds == 10 - bots[r.winner].dice_left
+
+
+def test_simulate_games_large_table():
+    bots = [Bot(f"Bot{i}") for i in range(25)] + [
+        ProbabilityBot(f"ProbabilityBot{i}", True) for i in range(25)
+    ]
+
+    [r] = simulate_games(bots, True, 3, 1, dice_per_player=10, faces_per_die=10)
+
+    # Each round but the last one takes one die away from one of the 500 dice in play
+    assert r.rounds == 50 * 10 - bots[r.winner].dice_left
+    assert sum(b.dice_left > 0 for b in bots) == 1
+    assert bots[r.winner].hand_counts and len(bots[r.winner].hand_counts) == 10
+
+
+def test_simulate_games_probability_bots_with_many_dice():
+    # With more than about 1030 dice in play, comb(n, k) doesn't fit in a float
+    bots = [ProbabilityBot(f"Bot{i}") for i in range(60)]
+    results = simulate_games(bots, False, 1, 1, dice_per_player=20)
+    assert results[0].rounds == 60 * 20 - 1
+
+
+def test_run_tournament_same_results_for_any_number_of_workers():
+    bots = [Bot("Bot1"), Bot("Bot2"), Bot("Bot3")]
+
+    r1 = run_tournament(bots, False, 5, 60, workers=1, games_per_chunk=7)
+    r2 = run_tournament(bots, False, 5, 60, workers=2, games_per_chunk=7)
+    r3 = run_tournament(bots, False, 5, 60, workers=4, games_per_chunk=7)
+    assert r1 == r2 == r3
+
+    assert r1.count_of_games == 60
+    assert sum(r1.wins_by_seat) == 60
+    assert sum(r1.wins_by_bot.values()) == 60
+    assert sum(r1.win_rate_by_seat()) == pytest.approx(1)
+    assert sum(r1.win_rate_by_bot().values()) == pytest.approx(1)
+
+
+def test_run_tournament_with_bots_that_played_before(tmp_path):
+    # The bots are still tied to their last games (with the default rng, or an event log as a listener),
+    # but they're sent to the workers without them
+    bots = [Bot("Bot1"), ProbabilityBot("Bot2"), Bot("Bot3")]
+    play_game(bots, False)
+    assert bots[0]._game is not None
+
+    r1 = run_tournament(bots, False, 5, 20, workers=2, games_per_chunk=5)
+
+    with EventLogWriter(tmp_path / "games.log") as log:
+        simulate_games(bots, False, 1, 3, listener=log)
+        r2 = run_tournament(bots, False, 5, 20, workers=2, games_per_chunk=5)
+
+    fresh_bots = [Bot("Bot1"), ProbabilityBot("Bot2"), Bot("Bot3")]
+    assert r1 == r2 == run_tournament(fresh_bots, False, 5, 20, workers=1)
+
+
+def test_run_tournament_matches_simulate_games_without_rotation():
+    bots = [Bot("Bot1"), Bot("Bot2")]
+
+    # All the bots play the same way, so taking turns at the seats doesn't change how the games go
+    results = simulate_games(bots, True, 3, 10)
+    r = run_tournament(bots, True, 3, 10, workers=1)
+
+    assert r.count_of_rounds == sum(g.rounds for g in results)
+
+
+def test_run_tournament_bad_args():
+    with pytest.raises(ValueError):
+        run_tournament([Bot("Bot1"), Bot("Bot1")], False, 1, 10)
+
+    with pytest.raises(ValueError):
+        run_tournament([Bot("Bot1"), Bot("Bot2")], False, 1, 10, workers=0)
+
+    with pytest.raises(TypeError):
+        run_tournament([Bot("Bot1"), Bot("Bot2")], False, 1, 10, workers="2")
+
+
+def test_run_tournament_probability_bot_beats_baseline():
+    bots = [ProbabilityBot("Prob"), Bot("Bot1"), Bot("Bot2")]
+
+    r = run_tournament(bots, False, 11, 300, workers=1)
+    assert r.win_rate_by_bot()["Prob"] > 0.5
@@ -0,0 +1,179 @@
+import random
+
+import numpy as np
+import pytest
+
+from liarsdice import Bid, Bot, Die, Hand, ProbabilityBot
+from simulation import simulate_games
+from strategy import (
+    CHALLENGE,
+    NO_BID,
+    BaselineStrategy,
+    ProbabilityStrategy,
+    Strategy,
+    StrategyBot,
+    bid_of_action,
+    turn_states,
+)
+
+pytestmark = pytest.mark.usefixtures("pristine_liarsdice")
+
+
+def _random_turns(count_of_turns, faces_per_die=6):
+    turns = []
+    for _ in range(count_of_turns):
+        hand = Hand(
+            [random.randint(1, faces_per_die) for _ in range(random.randint(1, 5))],
+            faces_per_die,
+        )
+        dice_in_play = random.randint(max(len(hand), 2) + 1, 25)
+
+        if random.random() < 0.2:
+            active_bid = None
+        else:
+            active_bid = Bid(
+                Die(random.randint(1, faces_per_die), faces_per_die),
+                random.randint(1, dice_in_play),
+            )
+
+        turns.append((hand, active_bid, dice_in_play))
+
+    return turns
+
+
+def test_turn_states():
+    states = turn_states([(1, 0, 0, 0, 0, 2)], [Bid(Die(3), 2)], [10])
+    assert states.hand_counts.shape == (1, 6)
+    assert list(states.bid_ranks) == [Bid(Die(3), 2).rank]
+    assert list(states.dice_in_play) == [10]
+
+    states = turn_states([(1, 0, 0, 0, 0, 2)], [None], [10])
+    assert list(states.bid_ranks) == [NO_BID]
+
+    assert bid_of_action(CHALLENGE) is None
+    assert bid_of_action(Bid(Die(5), 7).rank) is Bid(Die(5), 7)
+
+
+def test_strategy_is_abstract():
+    with pytest.raises(TypeError):
+        Strategy()
+
+
+@pytest.mark.parametrize("faces_per_die", [6, 10])
+@pytest.mark.parametrize("wild_1s", [False, True])
+def test_probability_strategy_matches_probability_bot(wild_1s, faces_per_die):
+    random.seed(1)
+    turns = _random_turns(2000, faces_per_die)
+
+    strategy = ProbabilityStrategy(wild_1s, 0.4)
+    actions = strategy.decide_batch(
+        turn_states(
+            [h.counts for h, _, _ in turns],
+            [b for _, b, _ in turns],
+            [n for _, _, n in turns],
+        )
+    )
+
+    bot = ProbabilityBot("Bot1", wild_1s, 0.4)
+    for (hand, active_bid, dice_in_play), action in zip(turns, actions):
+        bot._hand = hand
+        assert bid_of_action(action) is bot.play_turn(active_bid, dice_in_play)
+
+
+def test_probability_strategy_many_dice():
+    # Beyond probability.MAX_DICE, only the rows for the counts of dice in the batch are built
+    random.seed(2)
+    turns = []
+    for _ in range(200):
+        hand = Hand([random.randint(1, 6) for _ in range(random.randint(1, 20))])
+        dice_in_play = random.randint(1000, 3000)
+        active_bid = Bid(Die(random.randint(1, 6)), random.randint(150, 550))
+        turns.append((hand, active_bid, dice_in_play))
+
+    actions = ProbabilityStrategy(True, 0.4).decide_batch(
+        turn_states(
+            [h.counts for h, _, _ in turns],
+            [b for _, b, _ in turns],
+            [n for _, _, n in turns],
+        )
+    )
+
+    bot = ProbabilityBot("Bot1", True, 0.4)
+    for (hand, active_bid, dice_in_play), action in zip(turns, actions):
+        bot._hand = hand
+        assert bid_of_action(action) is bot.play_turn(active_bid, dice_in_play)
+
+    assert CHALLENGE in actions and (actions != CHALLENGE).any()
+
+
+def test_probability_strategy_bad_args():
+    with pytest.raises(TypeError):
+        ProbabilityStrategy(1)
+
+    with pytest.raises(ValueError):
+        ProbabilityStrategy(False, 2)
+
+
+def test_baseline_strategy():
+    strategy = BaselineStrategy(np.random.default_rng(3))
+    n = 20000
+
+    # The first bid of a round is on the face the bot has most of, for as many as it has
+    states = turn_states([(0, 1, 0, 3, 1, 0)] * n, [None] * n, [10] * n)
+    assert set(strategy.decide_batch(states)) == {Bid(Die(4), 3).rank}
+
+    # The highest bid is always challenged, and other bids 20% of the time
+    states = turn_states([(0, 1, 0, 3, 1, 0)] * n, [Bid(Die(6), 10)] * n, [10] * n)
+    assert set(strategy.decide_batch(states)) == {CHALLENGE}
+
+    states = turn_states([(0, 1, 0, 3, 1, 0)] * n, [Bid(Die(2), 3)] * n, [10] * n)
+    actions = strategy.decide_batch(states)
+    assert abs(np.mean(actions == CHALLENGE) - 0.2) < 0.02
+
+    # Raises go by face (to the most common face) or by count (to a random one), 50/50
+    by_face = np.mean(actions == Bid(Die(4), 1).rank) / 0.8
+    assert abs(by_face - 0.5) < 0.02
+
+    raised = {bid_of_action(a) for a in actions if a != CHALLENGE}
+    assert raised == {Bid(Die(4), 1)} | {Bid(Die(2), c) for c in range(4, 11)}
+
+    with pytest.raises(TypeError):
+        BaselineStrategy(random.Random())
+
+    # Without an rng of its own, it has to be given one
+    states = turn_states([(0, 1, 0, 3, 1, 0)], [None], [10])
+    assert len(BaselineStrategy().decide_batch(states, np.random.default_rng(1))) == 1
+    with pytest.raises(TypeError):
+        BaselineStrategy().decide_batch(states)
+
+
+def test_baseline_strategy_plays_like_bot():
+    # Over many games, bots with the baseline strategy win as often as the baseline bots
+    bots = [
+        StrategyBot("Bot1", BaselineStrategy(np.random.default_rng(1))),
+        Bot("Bot2"),
+    ]
+    results = simulate_games(bots, False, 1, 600)
+
+    win_rate = sum(r.winner == 0 for r in results) / len(results)
+    assert abs(win_rate - 0.5) < 0.08
+
+
+def test_strategy_bot_replayable():
+    # A StrategyBot draws its randomness from the game's RNG, so seeded games can be replayed
+    bots = [StrategyBot("S", BaselineStrategy()), Bot("B1"), Bot("B2")]
+    a = simulate_games(bots, False, 5, 30)
+    b = simulate_games(bots, False, 5, 30)
+    assert a == b
+
+
+def test_strategy_bot():
+    bot = StrategyBot("Bot1", ProbabilityStrategy())
+    bot._hand = Hand([1, 2, 3, 3, 3])
+    assert bot.play_turn(None, 10) is Bid(Die(3), 1)
+
+    with pytest.raises(TypeError):
+        StrategyBot("Bot1", None)
+
+    with pytest.raises(ValueError):
+        bot.play_turn(None, 1)
@@ -0,0 +1,258 @@
+import numpy as np
+import pytest
+import random
+
+from liarsdice import Bid, Bot, Die, ProbabilityBot, Round
+from simulation import simulate_games
+from strategy import CHALLENGE, BaselineStrategy, ProbabilityStrategy, Strategy
+from vectorized import (
+    LockstepSimulator,
+    evaluate_challenges,
+    faces_of_rounds,
+    roll_faces,
+    simulate_games_lockstep,
+)
+
+pytestmark = pytest.mark.usefixtures("pristine_liarsdice")
+
+
+def _random_rounds(count_of_rounds):
+    rounds = []
+    for _ in range(count_of_rounds):
+        players = [Bot(f"Bot{i}") for i in range(random.randint(2, 5))]
+        for p in players:
+            for _ in range(random.randint(0, 4)):
+                p.lose_a_die()
+
+        r = Round(1, players, players[0])
+        r.draw_hands()
+        rounds.append(r)
+
+    return rounds
+
+
+def test_evaluate_challenges_default_case():
+    faces = [
+        [2, 2, 2, 0, 0],
+        [1, 2, 5, 5, 0],
+        [1, 1, 3, 4, 6],
+    ]
+
+    assert evaluate_challenges(faces, [2, 5, 6], [3, 3, 2], False).tolist() == [
+        False,
+        True,
+        True,
+    ]
+    assert evaluate_challenges(faces, [2, 5, 6], [3, 3, 2], True).tolist() == [
+        False,
+        False,
+        False,
+    ]
+    assert evaluate_challenges(
+        faces, [2, 5, 6], [3, 3, 2], [False, True, False]
+    ).tolist() == [False, False, True]
+
+    # 1s are only counted once, when the bid is on 1s
+    assert evaluate_challenges(faces, [1, 1, 1], [1, 2, 3], True).tolist() == [
+        True,
+        True,
+        True,
+    ]
+
+
+def test_evaluate_challenges_matches_round_evaluate_challenge():
+    random.seed(0)
+    rounds = _random_rounds(200)
+    faces = faces_of_rounds(rounds)
+
+    bid_faces = np.array([random.randint(1, 6) for _ in rounds])
+    bid_counts = np.array([random.randint(1, 6) for _ in rounds])
+
+    for wild_1s in [False, True]:
+        expected = [
+            r.evaluate_challenge(Bid(Die(int(f)), int(c)), wild_1s)
+            for r, f, c in zip(rounds, bid_faces, bid_counts)
+        ]
+        assert (
+            evaluate_challenges(faces, bid_faces, bid_counts, wild_1s).tolist()
+            == expected
+        )
+
+
+def test_evaluate_challenges_bad_shapes():
+    with pytest.raises(ValueError):
+        evaluate_challenges([1, 2, 3], [1], [1], False)
+
+    with pytest.raises(ValueError):
+        evaluate_challenges([[1, 2, 3]], [1, 2], [1, 2], False)
+
+    with pytest.raises(ValueError):
+        evaluate_challenges([[1, 2, 3]], [1], [1], [True, False])
+
+
+def test_faces_of_rounds():
+    random.seed(1)
+    rounds = _random_rounds(10)
+    faces = faces_of_rounds(rounds, max_dice=25)
+
+    assert faces.shape == (10, 25)
+    for row, r in zip(faces, rounds):
+        count_all_active_dice = r.get_count_of_all_active_dice()
+        assert np.count_nonzero(row) == count_all_active_dice
+        assert bytes(row[:count_all_active_dice]) == b"".join(
+            p.hand_faces for p in r.players
+        )
+
+    with pytest.raises(ValueError):
+        faces_of_rounds(rounds, max_dice=1)
+
+
+def test_roll_faces():
+    rng = np.random.default_rng(0)
+    dice_left = np.array([[5, 3, 0], [1, 2, 4]])
+
+    faces = roll_faces(rng, dice_left)
+    assert faces.shape == (2, 3, 5)
+    assert (np.count_nonzero(faces, axis=2) == dice_left).all()
+    assert faces.max() <= 6
+
+    # All faces come up (about) equally often
+    faces = roll_faces(rng, np.full((10000, 5), 5))
+    counts = np.bincount(faces.ravel(), minlength=7)[1:]
+    assert counts.sum() == 250000
+    assert (abs(counts / 250000 - 1 / 6) < 0.01).all()
+
+    # The rolled batch can be evaluated as is
+    lies = evaluate_challenges(
+        faces.reshape(10000, -1), np.full(10000, 3), np.full(10000, 5), False
+    )
+    assert lies.shape == (10000,)
+
+
+def test_roll_faces_bad_dice_left():
+    rng = np.random.default_rng(0)
+
+    with pytest.raises(ValueError):
+        roll_faces(rng, [5, 5])
+
+    with pytest.raises(ValueError):
+        roll_faces(rng, [[5, 6]])
+
+    with pytest.raises(ValueError):
+        roll_faces(rng, [[5, -1]])
+
+
+class _AlwaysChallenge(Strategy):
+    def decide_batch(self, states, rng=None):
+        return np.full(len(states.bid_ranks), CHALLENGE)
+
+
+class _Bids(Strategy):
+    def __init__(self, action):
+        self._action = action
+
+    def decide_batch(self, states, rng=None):
+        # A legal first bid, then the same action each turn
+        actions = np.full(len(states.bid_ranks), self._action)
+        return np.where(states.bid_ranks == -1, 0, actions)
+
+
+def test_lockstep_simulator():
+    rng = np.random.default_rng(0)
+    simulator = LockstepSimulator(
+        [BaselineStrategy(rng) for _ in range(3)], 500, False, rng, dice_per_player=4
+    )
+    assert simulator.hand_counts.sum(axis=2).tolist() == [[4, 4, 4]] * 500
+
+    winners, rounds, bids = simulator.run()
+    assert simulator.finished.all()
+    assert simulator.alive.sum(axis=1).tolist() == [1] * 500
+    assert (simulator.alive.argmax(axis=1) == winners).all()
+
+    # Each round takes one die, and has at least one bid
+    assert (rounds == 12 - simulator.dice_left.sum(axis=1)).all()
+    assert (bids >= rounds).all()
+    assert simulator.step() == 0
+
+
+def test_lockstep_simulator_reproducible():
+    strategies = [ProbabilityStrategy(True) for _ in range(4)]
+    a = simulate_games_lockstep(strategies, True, 11, 300, tables_per_batch=128)
+    b = simulate_games_lockstep(strategies, True, 11, 300, tables_per_batch=128)
+
+    assert len(a.winners) == 300
+    for x, y in zip(a, b):
+        assert x.tolist() == y.tolist()
+
+
+def test_lockstep_simulator_matches_object_engine():
+    # Game statistics of the same strategy in both engines
+    count_of_games = 1500
+    results = simulate_games(
+        [ProbabilityBot(f"Bot_{i}", wild_1s=True) for i in range(4)],
+        True,
+        3,
+        count_of_games,
+    )
+    lockstep = simulate_games_lockstep(
+        [ProbabilityStrategy(True) for _ in range(4)], True, 3, count_of_games * 4
+    )
+
+    win_rates = np.bincount([r.winner for r in results], minlength=4) / count_of_games
+    lockstep_win_rates = np.bincount(lockstep.winners, minlength=4) / (
+        count_of_games * 4
+    )
+    assert np.abs(win_rates - lockstep_win_rates).max() < 0.05
+
+    mean_rounds = np.mean([r.rounds for r in results])
+    mean_bids = np.mean([sum(r.bids_per_round) for r in results])
+    assert lockstep.rounds.mean() == pytest.approx(mean_rounds, abs=0.2)
+    assert lockstep.bids.mean() == pytest.approx(mean_bids, rel=0.02)
+
+
+def test_lockstep_simulator_bad_args():
+    rng = np.random.default_rng(0)
+    with pytest.raises(ValueError):
+        LockstepSimulator([BaselineStrategy(rng)], 10, False, rng)
+    with pytest.raises(TypeError):
+        LockstepSimulator(
+            (BaselineStrategy(rng), BaselineStrategy(rng)), 10, False, rng
+        )
+    with pytest.raises(TypeError):
+        LockstepSimulator([BaselineStrategy(rng), Bot("Bot_1")], 10, False, rng)
+    with pytest.raises(TypeError):
+        LockstepSimulator([BaselineStrategy(rng)] * 2, 10, False, random.Random())
+
+    strategies = [BaselineStrategy(rng)] * 2
+    with pytest.raises(TypeError):
+        LockstepSimulator(strategies, 10, 0, rng)
+    with pytest.raises(TypeError):
+        LockstepSimulator(strategies, 10.0, False, rng)
+    with pytest.raises(ValueError):
+        LockstepSimulator(strategies, 0, False, rng)
+    with pytest.raises(ValueError):
+        LockstepSimulator(strategies, 10, False, rng, dice_per_player=0)
+    with pytest.raises(ValueError):
+        LockstepSimulator(strategies, 10, False, rng, faces_per_die=1)
+    with pytest.raises(ValueError):
+        LockstepSimulator(strategies, 10, False, rng, faces_per_die=256)
+
+    simulator = LockstepSimulator([_AlwaysChallenge()] * 2, 10, False, rng)
+    with pytest.raises(ValueError):
+        simulator.step()
+
+    # Bids that aren't legal raises
+    for action in (-2, 6 * Bid.MAX_COUNT, 11, Bid.MAX_COUNT):
+        simulator = LockstepSimulator([_Bids(action)] * 2, 10, False, rng)
+        simulator.step()
+        simulator._bid_ranks[:] = Bid.MAX_COUNT
+        with pytest.raises(ValueError):
+            simulator.step()
+
+
+def test_lockstep_simulator_random_strategies_reproducible():
+    # Strategies without an rng of their own draw from the simulator's
+    a = simulate_games_lockstep([BaselineStrategy()] * 3, False, 9, 200)
+    b = simulate_games_lockstep([BaselineStrategy()] * 3, False, 9, 200)
+    for x, y in zip(a, b):
+        assert x.tolist() == y.tolist()
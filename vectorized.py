@@ -0,0 +1,390 @@
+from collections import namedtuple
+
+import numpy as np
+
+from liarsdice import DICE_PER_PLAYER, FACES_PER_DIE, Bid
+from strategy import CHALLENGE, NO_BID, Strategy, TurnStates
+
+# Faces are stored as small unsigned integers, with 0 marking an empty slot (a die that's been lost)
+FACE_DTYPE = np.uint8
+
+
+def evaluate_challenges(faces, bid_faces, bid_counts, wild_1s):
+    """
+    Vectorized version of Round.evaluate_challenge(), for a batch of tables at once.
+
+    Expects:
+    - faces: an (n_tables x max_dice) matrix with all the dice at each table (0 for empty slots);
+    - bid_faces & bid_counts: arrays with the face & count of the active bid at each table;
+    - wild_1s: either a single boolean, or an array with one per table.
+    Returns a boolean array - True for each table where the active bid was a lie.
+    """
+    faces = np.asarray(faces)
+    bid_faces = np.asarray(bid_faces)
+    bid_counts = np.asarray(bid_counts)
+
+    if faces.ndim != 2:
+        raise ValueError("faces has to be an (n_tables x max_dice) matrix")
+
+    n_tables = faces.shape[0]
+    if bid_faces.shape != (n_tables,) or bid_counts.shape != (n_tables,):
+        raise ValueError("There has to be exactly one bid face & count per table")
+
+    matches = faces == bid_faces[:, None]
+
+    wild_1s = np.asarray(wild_1s, dtype=bool)
+    if wild_1s.ndim == 0:
+        if wild_1s:
+            matches |= faces == 1
+    else:
+        if wild_1s.shape != (n_tables,):
+            raise ValueError(
+                "wild_1s has to be a boolean, or an array with one per table"
+            )
+        matches |= (faces == 1) & wild_1s[:, None]
+
+    return np.count_nonzero(matches, axis=1) < bid_counts
+
+
+def faces_of_rounds(rounds, max_dice=None):
+    """
+    Returns the (n_tables x max_dice) face matrix of the hands drawn in a list of Round objects,
+    so that they can be passed to evaluate_challenges()
+    """
+    rows = [b"".join(p.hand_faces for p in r.players) for r in rounds]
+
+    if max_dice is None:
+        max_dice = max((len(row) for row in rows), default=0)
+
+    faces = np.zeros((len(rows), max_dice), dtype=FACE_DTYPE)
+    for i, row in enumerate(rows):
+        if len(row) > max_dice:
+            raise ValueError("There are more dice at a table than max_dice")
+        faces[i, : len(row)] = np.frombuffer(row, dtype=FACE_DTYPE)
+
+    return faces
+
+
+def roll_faces(
+    rng, dice_left, max_dice_per_player=DICE_PER_PLAYER, faces_per_die=FACES_PER_DIE
+):
+    """
+    Rolls the dice of all players at a batch of tables (or rounds) with a single numpy.random.Generator call.
+
+    Expects dice_left to be an (n_tables x n_seats) matrix with the number of dice each player has.
+    Returns an (n_tables x n_seats x max_dice_per_player) array of faces, with 0 in the slots of dice
+    that the players don't have. Reshaping it to (n_tables x -1) gives the face matrix that
+    evaluate_challenges() expects.
+    """
+    dice_left = np.asarray(dice_left)
+
+    if dice_left.ndim != 2:
+        raise ValueError("dice_left has to be an (n_tables x n_seats) matrix")
+
+    if np.any(dice_left < 0) or np.any(dice_left > max_dice_per_player):
+        raise ValueError("dice_left has to be between 0 and max_dice_per_player")
+
+    faces = rng.integers(
+        1,
+        faces_per_die + 1,
+        size=dice_left.shape + (max_dice_per_player,),
+        dtype=FACE_DTYPE,
+    )
+    faces[np.arange(max_dice_per_player) >= dice_left[..., None]] = 0
+
+    return faces
+
+
+# The results of the games played by a LockstepSimulator, as arrays with one entry per game:
+# - winners: the seat of the winner;
+# - rounds: the number of rounds played;
+# - bids: the number of bids made in all rounds.
+LockstepResults = namedtuple("LockstepResults", ["winners", "rounds", "bids"])
+
+
+class LockstepSimulator:
+    """
+    A LockstepSimulator plays count_of_tables bot-only games at once, with the state of all of them in arrays:
+    the dice left at each seat, the face counts of the hands, the active bid & bidder, whose turn it is,
+    and which seats are still in the game. Each step() plays one turn at every table that's still playing,
+    asking each strategy for its decisions once (for all the tables where it's the turn of one of its seats).
+    All the randomness - the dice, and the decisions of strategies that decide at random - is drawn from rng.
+    Strategies that make a bid which isn't a legal raise raise a ValueError.
+
+    Follows the same rules as Game & Round: seat 0 starts the first round, the loser of a challenge
+    loses a die and starts the next round, unless they're out of dice - then the player after the
+    last player in turn starts it (see Round.determine_whose_turn_at_next_round()).
+    """
+    def __init__(
+        self,
+        strategies,
+        count_of_tables,
+        wild_1s,
+        rng,
+        dice_per_player=DICE_PER_PLAYER,
+        faces_per_die=FACES_PER_DIE,
+    ):
+        if not isinstance(strategies, list):
+            raise TypeError("A LockstepSimulator expects a list of strategies")
+
+        if len(strategies) < 2:
+            raise ValueError("A LockstepSimulator needs at least 2 strategies")
+
+        for strategy in strategies:
+            if not isinstance(strategy, Strategy):
+                raise TypeError(
+                    "A LockstepSimulator expects a list of Strategy objects"
+                )
+
+        if not isinstance(wild_1s, bool):
+            raise TypeError(
+                "The 'wild_1s' property of a LockstepSimulator has to be Boolean"
+            )
+
+        for size in (count_of_tables, dice_per_player, faces_per_die):
+            if not isinstance(size, int):
+                raise TypeError(
+                    "Non-integer count_of_tables, dice_per_player or faces_per_die"
+                )
+
+        if count_of_tables < 1 or dice_per_player < 1:
+            raise ValueError(
+                "A LockstepSimulator needs at least 1 table, and 1 die per player"
+            )
+
+        if not np.iinfo(FACE_DTYPE).max >= faces_per_die >= 2:
+            raise ValueError(
+                f"A die has to have between 2 and {np.iinfo(FACE_DTYPE).max} faces"
+            )
+
+        if len(strategies) * dice_per_player > Bid.MAX_COUNT:
+            raise ValueError(f"There can't be more than {Bid.MAX_COUNT} dice in a game")
+
+        if not isinstance(rng, np.random.Generator):
+            raise TypeError(
+                "The rng of a LockstepSimulator has to be a numpy.random.Generator"
+            )
+
+        self._strategies = strategies
+        self._wild_1s = wild_1s
+        self._rng = rng
+        self._dice_per_player = dice_per_player
+        self._faces_per_die = faces_per_die
+
+        n_seats = len(strategies)
+        self._n_seats = n_seats
+
+        # The seats of each strategy (a strategy can play at more than one seat)
+        self._seats_of_strategies = {}
+        for seat, strategy in enumerate(strategies):
+            self._seats_of_strategies.setdefault(id(strategy), (strategy, []))[
+                1
+            ].append(seat)
+
+        self._dice_left = np.full(
+            (count_of_tables, n_seats), dice_per_player, dtype=np.int64
+        )
+        self._dice_in_play = self._dice_left.sum(axis=1)
+        self._hand_counts = np.zeros(
+            (count_of_tables, n_seats, faces_per_die), dtype=np.int64
+        )
+        self._bid_ranks = np.full(count_of_tables, NO_BID, dtype=np.int64)
+        self._bidders = np.zeros(count_of_tables, dtype=np.int64)
+        self._whose_turn = np.zeros(count_of_tables, dtype=np.int64)
+        self._finished = np.zeros(count_of_tables, dtype=bool)
+
+        self._winners = np.full(count_of_tables, -1, dtype=np.int64)
+        self._rounds = np.ones(count_of_tables, dtype=np.int64)
+        self._bids = np.zeros(count_of_tables, dtype=np.int64)
+
+        self._draw_hands(np.arange(count_of_tables))
+
+    def _draw_hands(self, tables):
+        """
+        Rolls the dice of all the players at the given tables, and counts their faces
+        """
+        faces = roll_faces(
+            self._rng,
+            self._dice_left[tables],
+            self._dice_per_player,
+            self._faces_per_die,
+        )
+        self._hand_counts[tables] = (
+            faces[..., None] == np.arange(1, self._faces_per_die + 1)
+        ).sum(axis=2)
+
+    def _next_seats(self, tables, seats):
+        """
+        Returns the next seat after each of the seats (one per table), that's still in the game
+        """
+        candidates = (seats[:, None] + np.arange(1, self._n_seats + 1)) % self._n_seats
+        in_game = self._dice_left[tables[:, None], candidates] > 0
+
+        return candidates[np.arange(len(tables)), np.argmax(in_game, axis=1)]
+
+    def step(self):
+        """
+        Plays one turn at each table that's still playing. Returns the number of those tables.
+        """
+        playing = np.flatnonzero(~self._finished)
+        if len(playing) == 0:
+            return 0
+
+        # Ask each strategy for its decisions
+        whose_turn = self._whose_turn[playing]
+        actions = np.empty(len(playing), dtype=np.int64)
+
+        for strategy, seats in self._seats_of_strategies.values():
+            mask = np.isin(whose_turn, seats)
+            if not mask.any():
+                continue
+
+            tables = playing[mask]
+            states = TurnStates(
+                self._hand_counts[tables, whose_turn[mask]],
+                self._bid_ranks[tables],
+                self._dice_in_play[tables],
+            )
+            actions[mask] = strategy.decide_batch(states, self._rng)
+
+        challenges = actions == CHALLENGE
+        if np.any(challenges & (self._bid_ranks[playing] == NO_BID)):
+            raise ValueError("The first turn of a round has to be a bid")
+
+        # Raises have to be legal bids, higher than the active bid
+        faces, counts = np.divmod(actions, Bid.MAX_COUNT)
+        illegal = ~challenges & (
+            (actions < 0)
+            | (faces >= self._faces_per_die)
+            | (counts >= self._dice_in_play[playing])
+            | (actions <= self._bid_ranks[playing])
+        )
+        if np.any(illegal):
+            raise ValueError("A strategy made a bid that isn't a legal raise")
+
+        # If the bid was raised
+        tables = playing[~challenges]
+        self._bid_ranks[tables] = actions[~challenges]
+        self._bidders[tables] = self._whose_turn[tables]
+        self._whose_turn[tables] = self._next_seats(tables, self._whose_turn[tables])
+        self._bids[tables] += 1
+
+        # If a challenge is issued
+        tables = playing[challenges]
+        if len(tables) > 0:
+            self._resolve_challenges(tables)
+
+        return len(playing)
+
+    def _resolve_challenges(self, tables):
+        """
+        Helper to .step(). Evaluates the challenges at the given tables, takes a die from each loser,
+        and starts the next round (or ends the game).
+        """
+        ranks = self._bid_ranks[tables]
+        faces = ranks // Bid.MAX_COUNT + 1
+        counts = ranks % Bid.MAX_COUNT + 1
+
+        table_counts = self._hand_counts[tables].sum(axis=1)
+        rows = np.arange(len(tables))
+        total = table_counts[rows, faces - 1]
+        if self._wild_1s:
+            total = total + np.where(faces != 1, table_counts[:, 0], 0)
+
+        # The bidder loses, if the bid was a lie - otherwise the challenger does
+        challengers = self._whose_turn[tables]
+        losers = np.where(total < counts, self._bidders[tables], challengers)
+
+        self._dice_left[tables, losers] -= 1
+        self._dice_in_play[tables] -= 1
+
+        # The loser starts the next round - unless they're out of dice, then the player after the challenger does
+        out_of_dice = self._dice_left[tables, losers] == 0
+        self._whose_turn[tables] = np.where(
+            out_of_dice, self._next_seats(tables, challengers), losers
+        )
+
+        # Games end when only one player has dice left
+        finished = np.count_nonzero(self._dice_left[tables], axis=1) == 1
+        ended = tables[finished]
+        self._finished[ended] = True
+        self._winners[ended] = np.argmax(self._dice_left[ended] > 0, axis=1)
+
+        # ... the others go on to the next round
+        going_on = tables[~finished]
+        self._rounds[going_on] += 1
+        self._bid_ranks[going_on] = NO_BID
+        self._draw_hands(going_on)
+
+    def run(self):
+        """
+        Steps until all the games are over, and returns their LockstepResults
+        """
+        while self.step():
+            pass
+
+        return self.results
+
+    @property
+    def results(self):
+        return LockstepResults(self._winners, self._rounds, self._bids)
+
+    @property
+    def dice_left(self):
+        return self._dice_left
+
+    @property
+    def hand_counts(self):
+        return self._hand_counts
+
+    @property
+    def bid_ranks(self):
+        return self._bid_ranks
+
+    @property
+    def whose_turn(self):
+        return self._whose_turn
+
+    @property
+    def alive(self):
+        return self._dice_left > 0
+
+    @property
+    def finished(self):
+        return self._finished
+
+
+def simulate_games_lockstep(
+    strategies, wild_1s, seed, count_of_games, tables_per_batch=10000, **table_args
+):
+    """
+    Plays count_of_games bot-only games with a LockstepSimulator, in batches of tables_per_batch games.
+    Returns the LockstepResults of all the games. The dice & the strategies' random decisions are all drawn
+    from a generator seeded with seed, so the same seed always gives the same results.
+    """
+    if not isinstance(count_of_games, int) or not isinstance(tables_per_batch, int):
+        raise TypeError("Non-integer count_of_games or tables_per_batch")
+
+    if count_of_games < 0 or tables_per_batch < 1:
+        raise ValueError("count_of_games must be >= 0, and tables_per_batch > 0")
+
+    rng = np.random.default_rng(seed)
+
+    results = []
+    for first_game in range(0, count_of_games, tables_per_batch):
+        count_of_tables = min(tables_per_batch, count_of_games - first_game)
+        simulator = LockstepSimulator(
+            strategies, count_of_tables, wild_1s, rng, **table_args
+        )
+        results.append(simulator.run())
+
+    return LockstepResults(
+        *(
+            (
+                np.concatenate([r[i] for r in results])
+                if results
+                else np.array([], dtype=np.int64)
+            )
+            for i in range(3)
+        )
+    )